@@ -8,25 +8,69 @@ with the generated resume.
 
 Usage:
     python auto_apply_with_resume.py [--config CONFIG] [--theme THEME] [--output OUTPUT]
+    python auto_apply_with_resume.py --serve [--theme THEME] < jobs.jsonl
 
 Examples:
     python auto_apply_with_resume.py
     python auto_apply_with_resume.py --config custom_resume.yaml --output professional.pdf
+    echo '["resumy/myconfig.yaml", "acme.pdf"]' | python auto_apply_with_resume.py --serve
 """
 
-import argparse
-import subprocess
+import json
+import os
 import sys
+from contextlib import redirect_stdout
+from functools import cache
 from pathlib import Path
 
+from generate_resume import run_resumy_build, validate_paths
 
+
+@cache
 def get_repo_root():
     """Get the absolute path to the repository root."""
     return Path(__file__).parent.absolute()
 
 
+def serve_builds(theme_path):
+    """
+    Build resumes for jobs read from stdin, keeping this interpreter warm.
+    
+    Each input line is a JSON array ``[config, output]``. Build progress goes
+    to stderr; one JSON result line per job is written to stdout.
+    
+    Args:
+        theme_path: Path to the theme directory shared by all jobs
+        
+    Returns:
+        True if every build succeeded, False otherwise
+    """
+    all_ok = True
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError:
+            job = None
+        if not (isinstance(job, list) and len(job) == 2
+                and all(isinstance(path, str) for path in job)):
+            print(f"❌ Invalid job line: {line.strip()}", file=sys.stderr)
+            all_ok = False
+            continue
+        config_file, output_file = job
+        
+        with redirect_stdout(sys.stderr):
+            ok = run_resumy_build(config_file, output_file, theme_path, True)
+        all_ok = all_ok and ok
+        print(json.dumps({"output": output_file, "ok": ok}), flush=True)
+    return all_ok
+
+
 def main():
     """Main function to generate resume and run job application bot."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate resume and run LinkedIn job application bot",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -59,53 +103,71 @@ def main():
         help="Skip resume generation and use existing file"
     )
     
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Build resumes for [config, output] JSON lines read from stdin, then exit"
+    )
+    
     args = parser.parse_args()
     
     repo_root = get_repo_root()
+    
+    if args.serve:
+        sys.exit(0 if serve_builds(repo_root / args.theme) else 1)
+    
     resume_path = repo_root / args.output
     
     if not args.skip_resume:
         print("🔧 Step 1: Generating resume...")
         
-        # Generate resume using our generate_resume.py script
-        resume_cmd = [
-            sys.executable, "generate_resume.py",
-            "--config", args.config,
-            "--output", args.output,
-            "--theme", args.theme
-        ]
+        # Generate resume in-process using generate_resume's build helper
+        config_file = repo_root / args.config
+        theme_path = repo_root / args.theme
         
-        try:
-            result = subprocess.run(resume_cmd, cwd=repo_root, check=True)
-            print("✅ Resume generated successfully!")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to generate resume: {e}")
+        if not validate_paths(config_file, theme_path):
+            print("❌ Failed to generate resume")
+            sys.exit(1)
+        
+        if not run_resumy_build(config_file, resume_path, theme_path, True):
+            print("❌ Failed to generate resume")
             sys.exit(1)
+        print("✅ Resume generated successfully!")
     else:
-        if not resume_path.exists():
+        try:
+            resume_st = os.stat(resume_path)
+        except FileNotFoundError:
             print(f"❌ Resume file not found: {resume_path}")
             print("Either remove --skip-resume or ensure the file exists.")
             sys.exit(1)
-        print(f"📄 Using existing resume: {resume_path}")
+        print(f"📄 Using existing resume: {resume_path} ({resume_st.st_size} bytes)")
     
     print("🤖 Step 2: Starting LinkedIn job application bot...")
     
-    # Run the main LinkedIn bot with the generated resume
-    bot_cmd = [
-        sys.executable, "main.py",
-        "--resume", str(resume_path)
-    ]
+    # Hand the process over to the LinkedIn bot with the generated resume
+    os.chdir(repo_root)
+    bot_argv = ["main.py", "--resume", str(resume_path)]
+    
+    if os.name != "nt":
+        # execv skips Python's shutdown, so push out buffered output first
+        # (otherwise lost when stdout is a pipe or file)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Replace this interpreter with the bot process; never returns
+        os.execv(sys.executable, [sys.executable, *bot_argv])
+    
+    # On Windows execv spawns a new process instead of replacing this one,
+    # so run the bot in this interpreter
+    import runpy
     
+    sys.argv = bot_argv
     try:
-        subprocess.run(bot_cmd, cwd=repo_root, check=True)
-        print("✅ Job application process completed!")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Job application failed: {e}")
-        sys.exit(1)
-    except KeyboardInterrupt:
-        print("\n⏹️  Job application interrupted by user")
-        sys.exit(0)
-
+        runpy.run_path(str(repo_root / "main.py"), run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"❌ Job application failed: exit code {e.code}")
+            sys.exit(1)
+    print("✅ Job application process completed!")
 
 if __name__ == "__main__":
     main()
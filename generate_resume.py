@@ -3,8 +3,8 @@
 Resume Generator Script
 
 This script generates a PDF resume using the local resumy package.
-It automatically handles path configuration and runs resumy build command
-with the specified parameters.
+It automatically handles path configuration and runs the resumy build command
+in-process with the specified parameters.
 
 Usage:
     python generate_resume.py [--config CONFIG_FILE] [--output OUTPUT_FILE] [--theme THEME_PATH]
@@ -15,18 +15,22 @@ Examples:
     python generate_resume.py --theme /path/to/custom/theme --config mydata.yaml
 """
 
-import argparse
+import hashlib
+import json
 import os
+import stat
 import sys
-import subprocess
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_repo_root():
     """Get the absolute path to the repository root."""
     return Path(__file__).parent.absolute()
 
 
+@cache
 def get_resumy_path():
     """Get the path to the resumy source directory."""
     repo_root = get_repo_root()
@@ -34,6 +38,7 @@ def get_resumy_path():
     return resumy_src
 
 
+@cache
 def get_default_config():
     """Get the default config file path."""
     repo_root = get_repo_root()
@@ -41,6 +46,7 @@ def get_default_config():
     return default_config
 
 
+@cache
 def get_default_theme():
     """Get the default theme path."""
     repo_root = get_repo_root()
@@ -48,9 +54,111 @@ def get_default_theme():
     return default_theme
 
 
+def load_resumy_main():
+    """
+    Import the resumy CLI entrypoint from the local resumy source tree.
+    
+    Returns:
+        The resumy ``main`` callable
+    """
+    resumy_src = str(get_resumy_path())
+    if resumy_src not in sys.path:
+        sys.path.insert(0, resumy_src)
+    from resumy.resumy import main as resumy_main
+    return resumy_main
+
+
+def _hash_tree(digest, root):
+    """Feed the relative path, size and mtime of every file under *root* to *digest*."""
+    root = Path(root)
+    files = (
+        p for p in root.rglob("*")
+        if p.is_file() and "__pycache__" not in p.parts
+    )
+    for file_path in sorted(files):
+        st = file_path.stat()
+        digest.update(str(file_path.relative_to(root)).encode("utf-8"))
+        digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+
+
+def compute_inputs_hash(config_file, theme_path):
+    """
+    Hash everything the rendered PDF depends on.
+    
+    The digest covers the config file bytes and every file (relative path,
+    size and mtime) of the theme tree and of the vendored resumy source
+    tree, so updating the resumy submodule or its templates forces a rebuild.
+    
+    Args:
+        config_file: Path to the config YAML file
+        theme_path: Path to the theme directory
+        
+    Returns:
+        Hex digest identifying the build inputs
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    with open(config_file, "rb") as f:
+        digest.update(f.read())
+    
+    _hash_tree(digest, theme_path)
+    digest.update(b"\0resumy\0")
+    _hash_tree(digest, get_resumy_path())
+    
+    return digest.hexdigest()
+
+
+def get_manifest_path(output_file):
+    """Get the build manifest path stored next to the output PDF."""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + ".manifest.json")
+
+
+def is_build_up_to_date(output_file, inputs_hash):
+    """
+    Check whether the output PDF was already built from the same inputs.
+    
+    The build is skipped only when the manifest exists, the PDF exists,
+    its size, mtime and mode match the manifest and the inputs hash matches.
+    
+    Args:
+        output_file: Output PDF file path
+        inputs_hash: Hash of the current build inputs
+        
+    Returns:
+        True if the existing PDF can be reused, False otherwise
+    """
+    try:
+        with open(get_manifest_path(output_file), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        st = os.stat(output_file)
+    except (OSError, ValueError):
+        return False
+    
+    return (
+        manifest.get("size") == st.st_size
+        and manifest.get("mtime_ns") == st.st_mtime_ns
+        and manifest.get("mode") == st.st_mode
+        and manifest.get("hash") == inputs_hash
+    )
+
+
+def write_build_manifest(output_file, inputs_hash):
+    """Record the inputs hash and PDF stat fields after a successful build."""
+    st = os.stat(output_file)
+    manifest = {
+        "hash": inputs_hash,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "mode": st.st_mode,
+    }
+    with open(get_manifest_path(output_file), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+
 def run_resumy_build(config_file, output_file, theme_path, disable_validation=True):
     """
-    Run resumy build command with the specified parameters.
+    Run resumy build in-process with the specified parameters.
     
     Args:
         config_file: Path to the config YAML file
@@ -61,60 +169,54 @@ def run_resumy_build(config_file, output_file, theme_path, disable_validation=Tr
     Returns:
         True if successful, False otherwise
     """
-    resumy_src = get_resumy_path()
+    repo_root = get_repo_root()
     
-    # Add resumy source to Python path
-    env = os.environ.copy()
-    current_path = env.get('PYTHONPATH', '')
-    if current_path:
-        env['PYTHONPATH'] = f"{resumy_src}:{current_path}"
-    else:
-        env['PYTHONPATH'] = str(resumy_src)
+    # Relative paths are resolved against the repository root
+    config_file = repo_root / config_file
+    output_file = repo_root / output_file
+    theme_path = repo_root / theme_path
     
-    # Prepare the command
-    cmd = [
-        sys.executable, "-m", "resumy.resumy", "build",
+    # Prepare the resumy arguments
+    argv = [
+        "build",
         "-o", str(output_file),
         "--theme", str(theme_path),
     ]
     
     if disable_validation:
-        cmd.append("--disable-validation")
+        argv.append("--disable-validation")
     
-    cmd.append(str(config_file))
+    argv.append(str(config_file))
     
-    print(f"Running command: {' '.join(cmd)}")
-    print(f"Working directory: {get_repo_root()}")
-    print(f"PYTHONPATH: {env['PYTHONPATH']}")
+    print(f"Running resumy: {' '.join(argv)}")
+    print(f"Working directory: {repo_root}")
     print(f"Config file: {config_file}")
     print(f"Output file: {output_file}")
     print(f"Theme path: {theme_path}")
     print("-" * 50)
     
     try:
-        # Run the command
-        result = subprocess.run(
-            cmd,
-            cwd=get_repo_root(),
-            env=env,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        inputs_hash = compute_inputs_hash(config_file, theme_path)
+        if is_build_up_to_date(output_file, inputs_hash):
+            print("✅ Resume is up to date, skipping build")
+            return True
         
-        print("✅ Resume generated successfully!")
-        if result.stdout:
-            print("Output:", result.stdout)
+        resumy_main = load_resumy_main()
+        
+        # resumy's CLI exits through SystemExit; a non-zero code is a failure
+        try:
+            exit_code = resumy_main(argv)
+        except SystemExit as e:
+            exit_code = e.code
+        
+        if exit_code not in (None, 0):
+            print(f"❌ Error running resumy: exit code {exit_code}")
+            return False
         
+        write_build_manifest(output_file, inputs_hash)
+        print("✅ Resume generated successfully!")
         return True
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running resumy: {e}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
-        return False
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return False
@@ -131,18 +233,20 @@ def validate_paths(config_file, theme_path):
     Returns:
         True if all paths are valid, False otherwise
     """
-    config_path = Path(config_file)
-    theme_dir = Path(theme_path)
-    
-    if not config_path.exists():
+    # One stat() per path instead of separate exists()/is_dir() checks
+    try:
+        os.stat(config_file)
+    except FileNotFoundError:
         print(f"❌ Config file not found: {config_file}")
         return False
     
-    if not theme_dir.exists():
+    try:
+        theme_st = os.stat(theme_path)
+    except FileNotFoundError:
         print(f"❌ Theme directory not found: {theme_path}")
         return False
     
-    if not theme_dir.is_dir():
+    if not stat.S_ISDIR(theme_st.st_mode):
         print(f"❌ Theme path is not a directory: {theme_path}")
         return False
     
@@ -151,6 +255,8 @@ def validate_paths(config_file, theme_path):
 
 def main():
     """Main function to handle command line arguments and run resumy."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate PDF resume using local resumy package",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -11,8 +11,12 @@ Key Features:
 - Job description analysis and integration
 - API call logging and cost tracking
 - Template-based response generation for different question types
+- Semantic caching of answers to similarly phrased questions
 
 Classes:
+    Section: Resume sections used to answer textual questions
+    SectionAnswer: Structured reply of the combined section/answer request
+    AsyncRateLimiter: Requests/tokens per minute limiter for async calls
     LLMLogger: Logs all API calls with usage metrics and costs
     LoggerChatModel: Wrapper for ChatOpenAI with logging capabilities
     GPTAnswerer: Main class for generating form responses using AI
@@ -23,27 +27,378 @@ Dependencies:
     - Resume and job description data for context
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import importlib.util
 import json
+import logging
 import os
+import queue
+import random
 import re
+import shelve
+import sys
 import textwrap
-from datetime import datetime
+import threading
+import time
+from enum import IntEnum
 
 from logging_config import logger
-from typing import Dict, List
+from typing import Dict, Iterator, List, Literal
 
+import httpx
+import numpy as np
 from dotenv import load_dotenv
 from langchain_core.messages.ai import AIMessage
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompt_values import StringPromptValue
+from langchain_core.prompt_values import ChatPromptValue, StringPromptValue
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
-from Levenshtein import distance
+from langchain_core.pydantic_v1 import BaseModel, Field
+from langchain_core.runnables import RunnableLambda
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+import openai
+import orjson
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
+import yaml
 
 import strings
+from semantic_cache import SemanticCache
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 load_dotenv()
 
+# Patterns used to parse model replies
+_SECTION_RE = re.compile(
+    r"(personal information|self identification|legal authorization|work preferences|"
+    r"education details|experience details|projects|availability|salary expectations|"
+    r"certifications|languages|interests|cover letter)",
+    re.IGNORECASE
+)
+_MD_RE = re.compile(r"\*+")
+_NUM_RE = re.compile(r"\d+")
+_RANGE_RE = re.compile(r"(\d+),(\d+)")
+_FENCE_RE = re.compile(r"^```(?:yaml)?[^\n]*\n(.*?)(?:\n\s*```|\Z)", re.DOTALL)
+
+# Large stable prompt blocks sent as a leading system message, so that
+# OpenAI's automatic prompt caching can reuse them across calls
+_PREFIX_BLOCKS = (
+    ("## My resume:\n```\n{resume}\n```", "## My resume:\nSee the resume above."),
+    ("## Base Resume Configuration:\n```yaml\n{base_config}\n```", "## Base Resume Configuration:\nSee the configuration above."),
+)
+
+class Section(IntEnum):
+    """Resume sections a textual question can be answered from."""
+    PERSONAL_INFORMATION = 0
+    SELF_IDENTIFICATION = 1
+    LEGAL_AUTHORIZATION = 2
+    WORK_PREFERENCES = 3
+    EDUCATION_DETAILS = 4
+    EXPERIENCE_DETAILS = 5
+    PROJECTS = 6
+    AVAILABILITY = 7
+    SALARY_EXPECTATIONS = 8
+    CERTIFICATIONS = 9
+    LANGUAGES = 10
+    INTERESTS = 11
+    COVER_LETTER = 12
+
+
+class SectionAnswer(BaseModel):
+    """Structured reply of the combined section selection and answer request."""
+    section: Literal[
+        "personal_information", "self_identification", "legal_authorization",
+        "work_preferences", "education_details", "experience_details", "projects",
+        "availability", "salary_expectations", "certifications", "languages",
+        "interests", "cover_letter",
+    ] = Field(description="Resume section most relevant to the question")
+    answer: str = Field(description="Answer to the question, empty for cover_letter")
+
+
+# Label and example phrasings per section, embedded into nearest-centroid classifier rows
+_SECTION_EXAMPLES = {
+    Section.PERSONAL_INFORMATION: ("Personal information", "What is your phone number?", "What is your email address?", "In which city do you live?", "What is your LinkedIn profile URL?"),
+    Section.SELF_IDENTIFICATION: ("Self identification", "What is your gender?", "Do you identify as a veteran?", "Do you have a disability?", "What is your ethnicity?"),
+    Section.LEGAL_AUTHORIZATION: ("Legal authorization", "Are you legally authorized to work in this country?", "Will you now or in the future require visa sponsorship?", "Do you have a valid work permit?"),
+    Section.WORK_PREFERENCES: ("Work preferences", "Are you willing to relocate?", "Are you comfortable working remotely?", "Are you open to working on-site?", "Are you willing to travel for work?"),
+    Section.EDUCATION_DETAILS: ("Education details", "What is your highest level of education?", "Do you have a bachelor's degree?", "Which university did you attend?", "What did you study?"),
+    Section.EXPERIENCE_DETAILS: ("Experience details", "Describe your experience with Python.", "What was your role at your last company?", "Tell us about your professional background.", "Have you worked with cloud platforms?"),
+    Section.PROJECTS: ("Projects", "Describe a project you are proud of.", "Tell us about a side project you built.", "Share a link to your portfolio or GitHub."),
+    Section.AVAILABILITY: ("Availability", "When can you start?", "What is your notice period?", "How soon are you available to join?"),
+    Section.SALARY_EXPECTATIONS: ("Salary expectations", "What are your salary expectations?", "What is your desired compensation?", "What is your current salary?"),
+    Section.CERTIFICATIONS: ("Certifications", "Do you hold any professional certifications?", "Are you AWS certified?", "List your licenses and certifications."),
+    Section.LANGUAGES: ("Languages", "Which languages do you speak?", "What is your level of English?", "Are you fluent in French?"),
+    Section.INTERESTS: ("Interests", "What are your hobbies?", "What do you do in your free time?", "What are you passionate about?"),
+    Section.COVER_LETTER: ("Cover letter", "Write a cover letter.", "Why do you want to work for this company?", "Why are you a good fit for this role?"),
+}
+
+# Minimum gap between the two closest centroids for a local classification to be trusted
+_SECTION_MARGIN = 0.05
+
+# Human-readable lowercase section names, as matched by _SECTION_RE
+_SECTION_BY_NAME = {section.name.lower().replace("_", " "): section for section in Section}
+
+def _serialize_section(value) -> str | None:
+    """
+    Render a resume section the way prompt formatting would, once.
+    
+    Small results are interned so repeated prompts share one string.
+    """
+    if value is None:
+        return None
+    text = str(value)
+    return sys.intern(text) if len(text) < 4096 else text
+
+
+# Resume HTML assets, resolved once at import
+_RESUME_TEMPLATE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "resume_template"))
+_CASUAL_MD_PATH, _REORG_HEADER_PATH, _RESUME_CSS_PATH = (
+    os.path.join(_RESUME_TEMPLATE_DIR, name)
+    for name in ("casual_markdown.js", "reorganizeHeader.js", "resume.css")
+)
+_HTML_TEMPLATE_FORMATTED = strings.html_template.format(
+    casual_markdown=_CASUAL_MD_PATH,
+    reorganize_header=_REORG_HEADER_PATH,
+    resume_css=_RESUME_CSS_PATH
+)
+
+# API call log, written as one JSON record per line by a background thread
+_CALLS_LOG = os.path.join(os.getcwd(), "open_ai_calls.json")
+_LOG_BUFFER_BYTES = 65536
+_LOG_IDLE_FLUSH_SECONDS = 1.0
+_log_q: queue.Queue = queue.Queue(maxsize=10000)
+
+
+def _drain_log_queue():
+    """Write queued log records to the calls log in batches."""
+    buf = []
+    buf_size = 0
+    with open(_CALLS_LOG, "ab", buffering=_LOG_BUFFER_BYTES) as f:
+        while True:
+            try:
+                record = _log_q.get(timeout=_LOG_IDLE_FLUSH_SECONDS)
+            except queue.Empty:
+                record = None
+            
+            if isinstance(record, dict):
+                try:
+                    record["time"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record["time"]))
+                    prompts = record["prompts"]
+                    record["prompts"] = _PROMPT_FORMATTERS.get(type(prompts), _format_prompt_messages)(prompts)
+                    record["total_cost"] = 0.0 if record["cached"] else _call_cost(
+                        record["model"], record["input_tokens"], record["cached_input_tokens"], record["output_tokens"]
+                    )
+                    line = orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+                except Exception as e:
+                    logger.warning(f"[GPT API] Failed to format call log entry: {e}")
+                    continue
+                buf.append(line)
+                buf_size += len(line)
+                if buf_size < _LOG_BUFFER_BYTES:
+                    continue
+            
+            # Flush on a full buffer, an idle queue or a shutdown request
+            try:
+                if buf:
+                    f.write(b"".join(buf))
+                    f.flush()
+            except Exception as e:
+                logger.warning(f"[GPT API] Failed to write to {_CALLS_LOG}: {e}")
+            buf.clear()
+            buf_size = 0
+            if isinstance(record, threading.Event):
+                record.set()
+
+
+def _flush_log_queue(timeout: float = 5.0):
+    """Wait for queued log records to be written, used at exit."""
+    done = threading.Event()
+    try:
+        _log_q.put(done, timeout=timeout)
+    except queue.Full:
+        return
+    done.wait(timeout)
+
+
+_log_thread = threading.Thread(target=_drain_log_queue, name="openai-calls-log", daemon=True)
+_log_thread.start()
+atexit.register(_flush_log_queue)
+
+
+# Keep-alive connection pool shared by all OpenAI clients. HTTP/2 is used
+# when the optional h2 package is installed (pip install httpx[http2]).
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_HTTPX_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=30.0)
+_HTTPX_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+_SHARED_HTTPX = httpx.Client(http2=_HTTP2, limits=_HTTPX_LIMITS, timeout=_HTTPX_TIMEOUT)
+atexit.register(_SHARED_HTTPX.close)
+
+# Async OpenAI calls all run on one event loop that lives as long as the
+# process. Pooled async connections belong to the loop that opened them, so
+# a loop per asyncio.run would leave the shared client with dead connections.
+_ASYNC_LOOP = asyncio.new_event_loop()
+_async_loop_thread = threading.Thread(target=_ASYNC_LOOP.run_forever, name="openai-async-loop", daemon=True)
+_async_loop_thread.start()
+
+
+def _run_async(coro):
+    """
+    Run a coroutine on the shared async loop and wait for its result.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        Exception: Whatever the coroutine raised
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _ASYNC_LOOP).result()
+
+
+async def _new_async_client() -> httpx.AsyncClient:
+    """Create the async HTTP client on the loop that will use it."""
+    return httpx.AsyncClient(http2=_HTTP2, limits=_HTTPX_LIMITS, timeout=_HTTPX_TIMEOUT)
+
+
+_SHARED_HTTPX_ASYNC = _run_async(_new_async_client())
+
+
+def _close_async_loop():
+    """Close the async client on its own loop, then stop the loop."""
+    try:
+        asyncio.run_coroutine_threadsafe(_SHARED_HTTPX_ASYNC.aclose(), _ASYNC_LOOP).result(timeout=5)
+    except Exception as e:
+        logger.debug(f"[GPT] Could not close async HTTP client: {e}")
+    finally:
+        _ASYNC_LOOP.call_soon_threadsafe(_ASYNC_LOOP.stop)
+        _async_loop_thread.join(timeout=5)
+
+
+atexit.register(_close_async_loop)
+
+# Per-token prices (prompt, cached prompt, completion) by model name prefix
+_MODEL_PRICING = {
+    "gpt-4o-mini": (0.00000015, 0.000000075, 0.0000006),
+    "gpt-4o": (0.0000025, 0.00000125, 0.00001),
+    "gpt-4-turbo": (0.00001, 0.00001, 0.00003),
+    "gpt-3.5-turbo": (0.0000005, 0.0000005, 0.0000015),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _model_pricing(model_name: str) -> tuple[float, float, float]:
+    """
+    Get per-token prices for a model.
+    
+    Dated model names (e.g. gpt-4o-mini-2024-07-18) match the longest
+    known prefix. Unknown models are priced at zero.
+    """
+    for prefix in sorted(_MODEL_PRICING, key=len, reverse=True):
+        if model_name.startswith(prefix):
+            return _MODEL_PRICING[prefix]
+    return (0.0, 0.0, 0.0)
+
+
+@functools.lru_cache(maxsize=4096)
+def _best_match(text: str, options: tuple[str, ...]) -> str:
+    """Closest option to text by case-insensitive Levenshtein distance."""
+    best_option, _, _ = process.extractOne(
+        text, options, scorer=Levenshtein.distance, processor=str.lower
+    )
+    return best_option
+
+
+def _call_cost(model_name: str, input_tokens: int, cached_tokens: int, output_tokens: int) -> float:
+    """Price of one API call in USD, with cached input tokens at their discounted rate."""
+    prompt_price, cached_prompt_price, completion_price = _model_pricing(model_name)
+    return (
+        (input_tokens - cached_tokens) * prompt_price
+        + cached_tokens * cached_prompt_price
+        + output_tokens * completion_price
+    )
+
+
+def _format_prompt_messages(prompts) -> Dict[str, str]:
+    """Format chat prompt messages for the calls log."""
+    return {
+        f"prompt_{i+1}": prompt.content
+        for i, prompt in enumerate(prompts.messages)
+    }
+
+
+_PROMPT_FORMATTERS = {
+    StringPromptValue: lambda prompts: prompts.text,
+    ChatPromptValue: _format_prompt_messages,
+}
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket limiter for requests and tokens per minute on async calls.
+    
+    Follows the openai-cookbook parallel request processor: both buckets
+    refill continuously, and a call waits until it fits in both.
+    """
+    
+    def __init__(self, max_requests_per_minute: int = 500, max_tokens_per_minute: int = 200_000):
+        """
+        Initialize the limiter with full buckets.
+        
+        Args:
+            max_requests_per_minute: Request budget per minute
+            max_tokens_per_minute: Token budget per minute
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self._request_capacity = float(max_requests_per_minute)
+        self._token_capacity = float(max_tokens_per_minute)
+        self._last_update = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self):
+        """Add capacity for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self._request_capacity = min(
+            self.max_requests_per_minute,
+            self._request_capacity + self.max_requests_per_minute * elapsed / 60
+        )
+        self._token_capacity = min(
+            self.max_tokens_per_minute,
+            self._token_capacity + self.max_tokens_per_minute * elapsed / 60
+        )
+
+    async def acquire(self, tokens: int):
+        """
+        Wait until a request consuming ``tokens`` fits in both buckets.
+        
+        Args:
+            tokens: Estimated tokens of the request
+        """
+        tokens = min(tokens, self.max_tokens_per_minute)
+        while True:
+            self._refill()
+            if (time.monotonic() >= self._paused_until
+                    and self._request_capacity >= 1
+                    and self._token_capacity >= tokens):
+                self._request_capacity -= 1
+                self._token_capacity -= tokens
+                return
+            await asyncio.sleep(0.05)
+
+    def pause(self, seconds: float):
+        """Hold back all calls for ``seconds``, used after a rate limit error."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
 
 class LLMLogger:
     """
@@ -63,69 +418,52 @@ class LLMLogger:
         self.llm = llm
 
     @staticmethod
-    def log_request(prompts, parsed_reply: Dict[str, Dict]):
+    def log_request(prompts, parsed_reply: Dict[str, Dict], cached: bool = False):
         """
         Log an API request with full details including cost calculation.
         
         Args:
             prompts: The input prompts sent to the API
             parsed_reply: Parsed response from the API
+            cached: True if the reply was served from the response cache
         """
-        calls_log = os.path.join(os.getcwd(), "open_ai_calls.json")
-        
-        # Normalize prompts format
-        if isinstance(prompts, StringPromptValue):
-            prompts = prompts.text
-        elif isinstance(prompts, Dict):
-            prompts = {
-                f"prompt_{i+1}": prompt.content
-                for i, prompt in enumerate(prompts.messages)
-            }
-        else:
-            prompts = {
-                f"prompt_{i+1}": prompt.content
-                for i, prompt in enumerate(prompts.messages)
-            }
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Extract token usage and calculate costs
+        # Extract token usage; prompt formatting and cost are left to the background writer
         token_usage = parsed_reply["usage_metadata"]
         output_tokens = token_usage["output_tokens"]
         input_tokens = token_usage["input_tokens"]
         total_tokens = token_usage["total_tokens"]
+        cached_tokens = token_usage.get("cached_tokens", 0)
 
         model_name = parsed_reply["response_metadata"]["model_name"]
-        prompt_price_per_token = 0.00000015
-        completion_price_per_token = 0.0000006
-
-        total_cost = (input_tokens * prompt_price_per_token) + (
-            output_tokens * completion_price_per_token
-        )
         
         # Log API call details to main logger
-        logger.debug(f"[GPT API] Model: {model_name}, Tokens: {total_tokens} (in:{input_tokens}, out:{output_tokens}), Cost: ${total_cost:.6f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            total_cost = 0.0 if cached else _call_cost(model_name, input_tokens, cached_tokens, output_tokens)
+            logger.debug(f"[GPT API] Model: {model_name}, Tokens: {total_tokens} (in:{input_tokens}, cached in:{cached_tokens}, out:{output_tokens}), Cost: ${total_cost:.6f}, Cached: {cached}")
 
         # Create comprehensive log entry
         log_entry = {
             "model": model_name,
-            "time": current_time,
+            "time": time.time(),  # formatted by the background writer
             "prompts": prompts,
             "replies": parsed_reply["content"],
             "total_tokens": total_tokens,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
-            "total_cost": total_cost,
+            "cached_input_tokens": cached_tokens,
+            "total_cost": None,
+            "cached": cached,
         }
 
-        # Append to log file
+        # Hand off to the background writer
         try:
-            with open(calls_log, "a", encoding="utf-8") as f:
-                json_string = json.dumps(log_entry, ensure_ascii=False, indent=4)
-                f.write(json_string + "\n")
-            logger.debug(f"[GPT API] Call logged to {calls_log}")
-        except Exception as e:
-            logger.warning(f"[GPT API] Failed to write to {calls_log}: {e}")
+            _log_q.put_nowait(log_entry)
+        except queue.Full:
+            logger.warning("[GPT API] Log queue full, dropping call log entry")
+
+
+# Errors worth retrying: 429s and network blips (APITimeoutError subclasses APIConnectionError)
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError)
 
 
 class LoggerChatModel:
@@ -133,21 +471,123 @@ class LoggerChatModel:
     Wrapper for ChatOpenAI that logs all interactions.
     
     Provides the same interface as ChatOpenAI but automatically logs
-    all requests and responses for monitoring and debugging.
+    all requests and responses for monitoring and debugging. When a cache
+    file is given, replies to deterministic (temperature 0) calls are cached
+    by model and messages, and persisted to that file on exit.
     """
 
-    def __init__(self, llm: ChatOpenAI):
+    # Retries of async calls rejected with HTTP 429
+    MAX_RATE_LIMIT_RETRIES = 5
+    RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        cache_path: str | None = None,
+        rate_limiter: AsyncRateLimiter | None = None
+    ):
         """
         Initialize with a ChatOpenAI instance.
         
         Args:
             llm: ChatOpenAI instance to wrap with logging
+            cache_path: Optional JSON file used to persist the response cache
+            rate_limiter: Optional limiter applied to async calls, shareable
+                between models on the same account
         """
         self.llm = llm
+        self.cache_path = cache_path
+        self.rate_limiter = rate_limiter
+        self._cache: dict[str, AIMessage] = {}
+        self._stats = {"hits": 0, "misses": 0}
+        
+        if cache_path:
+            self._load_cache()
+            atexit.register(self._save_cache)
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether replies of this model may be served from the cache."""
+        return self.cache_path is not None and self.llm.temperature == 0
+
+    def _cache_key(self, messages) -> str:
+        """Build the cache key from the model settings and the prompt messages."""
+        payload = {
+            "model": self.llm.model_name,
+            "t": self.llm.temperature,
+            "msgs": [(m.type, m.content) for m in messages.to_messages()],
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _load_cache(self):
+        """Load persisted replies from the cache file, if present."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"[GPT API] Failed to load response cache {self.cache_path}: {e}")
+            return
+        
+        for key, entry in entries.items():
+            self._cache[key] = AIMessage(
+                content=entry["content"],
+                response_metadata=entry.get("response_metadata", {}),
+                usage_metadata=entry.get("usage_metadata"),
+            )
+        logger.debug(f"[GPT API] Loaded {len(self._cache)} cached replies from {self.cache_path}")
+
+    def _save_cache(self):
+        """Persist cached replies to the cache file."""
+        if not self._cache:
+            return
+        entries = {
+            key: {
+                "content": reply.content,
+                "response_metadata": reply.response_metadata,
+                "usage_metadata": reply.usage_metadata,
+            }
+            for key, reply in self._cache.items()
+        }
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            logger.debug(f"[GPT API] Response cache saved: {len(entries)} entries, stats={self._stats}")
+        except Exception as e:
+            logger.warning(f"[GPT API] Failed to write response cache {self.cache_path}: {e}")
+
+    def _lookup_cache(self, messages):
+        """
+        Look up a cached reply for the messages.
+        
+        Args:
+            messages: Prompt messages of the call
+            
+        Returns:
+            Tuple of (cache key or None if caching is disabled, cached reply or None)
+        """
+        if not self.cache_enabled:
+            return None, None
+        key = self._cache_key(messages)
+        reply = self._cache.get(key)
+        if reply is not None:
+            self._stats["hits"] += 1
+            LLMLogger.log_request(prompts=messages, parsed_reply=self.parse_llmresult(reply), cached=True)
+        else:
+            self._stats["misses"] += 1
+        return key, reply
+
+    def _record_reply(self, messages, key, reply: AIMessage):
+        """Log a fresh reply and store it in the cache when caching applies."""
+        parsed_reply = self.parse_llmresult(reply)
+        LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
+        if key is not None:
+            self._cache[key] = reply
 
     def __call__(self, messages: List[Dict[str, str]]) -> str:
         """
-        Call the LLM with logging.
+        Call the LLM with logging, serving deterministic calls from the cache.
         
         Args:
             messages: List of message dictionaries for the conversation
@@ -155,11 +595,152 @@ class LoggerChatModel:
         Returns:
             AI response string
         """
-        reply = self.llm(messages)
-        parsed_reply = self.parse_llmresult(reply)
-        LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
+        key, reply = self._lookup_cache(messages)
+        if reply is not None:
+            return reply
+        
+        reply = self._invoke_with_backoff(messages)
+        self._record_reply(messages, key, reply)
+        return reply
+
+    def stream(self, messages) -> Iterator[str]:
+        """
+        Stream the reply text as it is generated.
+        
+        The reply is logged (and cached, when caching applies) once the
+        stream completes, with the full concatenated text.
+        
+        Args:
+            messages: Prompt messages of the call
+            
+        Yields:
+            Chunks of the reply text
+        """
+        key, reply = self._lookup_cache(messages)
+        if reply is not None:
+            yield reply.content
+            return
+        
+        full = None
+        for chunk in self.llm.stream(messages, stream_usage=True):
+            full = chunk if full is None else full + chunk
+            if chunk.content:
+                yield chunk.content
+        
+        if full is not None:
+            self._record_reply(messages, key, AIMessage(
+                content=full.content,
+                response_metadata=full.response_metadata,
+                usage_metadata=full.usage_metadata,
+                id=full.id,
+            ))
+
+    async def acall(self, messages: List[Dict[str, str]]) -> str:
+        """
+        Async variant of __call__, awaiting the LLM without blocking the event loop.
+        
+        Args:
+            messages: List of message dictionaries for the conversation
+            
+        Returns:
+            AI response string
+        """
+        key, reply = self._lookup_cache(messages)
+        if reply is not None:
+            return reply
+        
+        reply = await self._ainvoke_with_backoff(messages)
+        self._record_reply(messages, key, reply)
         return reply
 
+    @staticmethod
+    def _estimate_tokens(messages) -> int:
+        """Rough token count of the prompt (4 characters per token) for the token bucket."""
+        return sum(len(m.content) for m in messages.to_messages()) // 4 + 1
+
+    def _invoke_with_backoff(self, messages) -> AIMessage:
+        """
+        Call the LLM, retrying rate limit and transient connection errors with exponential backoff.
+        
+        Args:
+            messages: Prompt messages of the call
+            
+        Returns:
+            AI response message
+        """
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                return self.llm.invoke(messages)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = min(60.0, self.RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt) + random.uniform(0, 0.5)
+                logger.warning(f"[GPT API] {type(e).__name__}, retrying in {delay:.1f}s (attempt {attempt + 1})")
+                if self.rate_limiter is not None and isinstance(e, openai.RateLimitError):
+                    self.rate_limiter.pause(delay)
+                time.sleep(delay)
+
+    async def _ainvoke_with_backoff(self, messages) -> AIMessage:
+        """
+        Await the LLM within the rate limit, retrying 429 errors with exponential backoff.
+        
+        Args:
+            messages: Prompt messages of the call
+            
+        Returns:
+            AI response message
+        """
+        estimated_tokens = self._estimate_tokens(messages)
+        
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(estimated_tokens)
+            try:
+                return await self.llm.ainvoke(messages)
+            except openai.RateLimitError:
+                if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = self.RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt + random.uniform(0, 0.5)
+                logger.warning(f"[GPT API] Rate limited, retrying in {delay:.1f}s (attempt {attempt + 1})")
+                if self.rate_limiter is not None:
+                    self.rate_limiter.pause(delay)
+                await asyncio.sleep(delay)
+
+    def structured(self, schema) -> RunnableLambda:
+        """
+        Wrap the model to return structured output validated against a schema.
+        
+        Calls are logged like regular ones. Replies that fail validation
+        produce None instead of raising.
+        
+        Args:
+            schema: Pydantic model describing the expected output
+            
+        Returns:
+            Runnable supporting both invoke and ainvoke
+        """
+        structured_llm = self.llm.with_structured_output(schema, include_raw=True)
+        
+        def handle(messages, result):
+            LLMLogger.log_request(prompts=messages, parsed_reply=self.parse_llmresult(result["raw"]))
+            if result.get("parsing_error") is not None:
+                logger.debug(f"[GPT API] Structured output failed validation: {result['parsing_error']}")
+            return result.get("parsed")
+        
+        def call(messages):
+            return handle(messages, structured_llm.invoke(messages))
+        
+        async def acall(messages):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(self._estimate_tokens(messages))
+            return handle(messages, await structured_llm.ainvoke(messages))
+        
+        return RunnableLambda(call, afunc=acall)
+
+    def as_runnable(self) -> RunnableLambda:
+        """Wrap the model as a runnable supporting both invoke and ainvoke."""
+        return RunnableLambda(self.__call__, afunc=self.acall)
+
     def parse_llmresult(self, llmresult: AIMessage) -> Dict[str, Dict]:
         """
         Parse LLM response into structured format for logging.
@@ -173,7 +754,12 @@ class LoggerChatModel:
         content = llmresult.content
         response_metadata = llmresult.response_metadata
         id_ = llmresult.id
-        usage_metadata = llmresult.usage_metadata
+        usage_metadata = llmresult.usage_metadata or {}
+        
+        # Prompt tokens served from OpenAI's automatic prefix cache
+        token_usage = response_metadata.get("token_usage") or {}
+        prompt_tokens_details = token_usage.get("prompt_tokens_details") or {}
+        cached_tokens = prompt_tokens_details.get("cached_tokens") or 0
 
         parsed_result = {
             "content": content,
@@ -188,6 +774,7 @@ class LoggerChatModel:
                 "input_tokens": usage_metadata.get("input_tokens", 0),
                 "output_tokens": usage_metadata.get("output_tokens", 0),
                 "total_tokens": usage_metadata.get("total_tokens", 0),
+                "cached_tokens": cached_tokens,
             },
         }
         return parsed_result
@@ -207,20 +794,114 @@ class GPTAnswerer:
         job: Current job being applied to
     """
     
-    def __init__(self, openai_api_key):
+    def __init__(
+        self,
+        openai_api_key,
+        deterministic_temperature: float = 0,
+        max_requests_per_minute: int = 500,
+        max_tokens_per_minute: int = 200_000
+    ):
         """
         Initialize the GPT answerer with API credentials.
         
         Args:
             openai_api_key: OpenAI API key for authentication
+            deterministic_temperature: Temperature used for section selection,
+                numeric and option questions. At 0 their replies are cached.
+            max_requests_per_minute: Request rate limit for concurrent answering
+            max_tokens_per_minute: Token rate limit for concurrent answering
         """
+        rate_limiter = AsyncRateLimiter(max_requests_per_minute, max_tokens_per_minute)
         self.llm_cheap = LoggerChatModel(
             ChatOpenAI(
                 model_name="gpt-4o-mini", 
                 openai_api_key=openai_api_key, 
-                temperature=0.8
+                temperature=0.8,
+                http_client=_SHARED_HTTPX,
+                http_async_client=_SHARED_HTTPX_ASYNC
+            ),
+            rate_limiter=rate_limiter
+        )
+        self.llm_deterministic = LoggerChatModel(
+            ChatOpenAI(
+                model_name="gpt-4o-mini",
+                openai_api_key=openai_api_key,
+                temperature=deterministic_temperature,
+                http_client=_SHARED_HTTPX,
+                http_async_client=_SHARED_HTTPX_ASYNC
+            ),
+            cache_path=os.path.join(os.getcwd(), "open_ai_cache.json"),
+            rate_limiter=rate_limiter
+        )
+        self._embeddings = OpenAIEmbeddings(
+            model="text-embedding-3-small",
+            openai_api_key=openai_api_key,
+            http_client=_SHARED_HTTPX,
+            http_async_client=_SHARED_HTTPX_ASYNC
+        )
+        # Question embeddings shared by the semantic cache and the section classifier
+        self._embedding_memo: dict[str, list[float]] = {}
+        self._section_centroids = None
+        self.semantic_cache = SemanticCache(
+            self._embed_texts,
+            path=os.path.join(os.getcwd(), "open_ai_semantic_cache.db"),
+            ttl=30 * 24 * 3600,
+            # A similar numeric question usually asks about something else
+            exact_kinds=("numeric",)
+        )
+        
+        
+        # First stage of get_resume_html, keyed by a hash of the resume
+        self._resume_markdown_shelf = shelve.open(os.path.join(os.getcwd(), "resume_markdown_cache.db"))
+        atexit.register(self._resume_markdown_shelf.close)
+        
+        # Compile prompt chains once instead of on every question
+        # Indexed by Section
+        self._section_chains = tuple(
+            self._create_chain(template) for template in (
+                strings.personal_information_template,
+                strings.self_identification_template,
+                strings.legal_authorization_template,
+                strings.work_preferences_template,
+                strings.education_details_template,
+                strings.experience_details_template,
+                strings.projects_template,
+                strings.availability_template,
+                strings.salary_expectations_template,
+                strings.certifications_template,
+                strings.languages_template,
+                strings.interests_template,
+                strings.coverletter_template,
             )
         )
+        self._section_picker_chain = self._create_chain(strings.section_picker_template, self.llm_deterministic)
+        self._section_answer_chain = (
+            self._create_prompt(strings.section_answer_template)
+            | self.llm_cheap.structured(SectionAnswer)
+        )
+        self._batch_questions_chain = self._create_chain(strings.batch_questions_template)
+        self._numeric_batch_chain = self._create_chain(strings.numeric_batch_template, self.llm_deterministic)
+        self._options_batch_chain = self._create_chain(strings.options_batch_template, self.llm_deterministic)
+        
+        # Answers fetched ahead of time by prefetch_answers, consumed by the answer_question_* methods
+        self._prefetched: dict[tuple, str | int] = {}
+        self._resume_stuff_chain = self._create_chain(
+            self._preprocess_template_string(strings.resume_stuff_template)
+        )
+        self._numeric_question_chain = self._create_chain(
+            self._preprocess_template_string(strings.numeric_question_template), self.llm_deterministic
+        )
+        self._options_chain = self._create_chain(
+            self._preprocess_template_string(strings.options_template), self.llm_deterministic
+        )
+        self._numeric_range_chain = self._create_chain(
+            self._preprocess_template_string(strings.numeric_range_template)
+        )
+        self._resume_markdown_chain = self._create_chain(strings.resume_markdown_template)
+        self._resume_fusion_chain = self._create_chain(strings.fusion_job_description_resume_template)
+        self._resume_tailoring_chain = self._create_chain(
+            self._preprocess_template_string(strings.resume_tailoring_template)
+        )
 
     @property
     def job_description(self):
@@ -239,11 +920,8 @@ class GPTAnswerer:
         Returns:
             Best matching option from the list
         """
-        distances = [
-            (option, distance(text.lower(), option.lower())) for option in options
-        ]
-        best_option = min(distances, key=lambda x: x[1])[0]
-        return best_option
+        # Option lists repeat across forms, so matches are memoized
+        return _best_match(text, tuple(options))
 
     @staticmethod
     def _remove_placeholders(text: str) -> str:
@@ -256,9 +934,28 @@ class GPTAnswerer:
         """Preprocess template strings to remove unnecessary indentation."""
         return textwrap.dedent(template)
 
+    @staticmethod
+    def _canonical_prefix(text: str) -> str:
+        """Normalize text to a byte-stable form (LF endings, no trailing spaces)."""
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return "\n".join(line.rstrip() for line in lines).strip()
+
     def set_resume(self, resume):
-        """Set the resume data for context."""
+        """
+        Set the resume data for context.
+        
+        The resume is serialized once into a canonical string that is sent
+        verbatim at the start of every prompt, so repeated calls share a
+        cacheable prefix.
+        """
         self.resume = resume
+        self._resume_prefix = self._canonical_prefix(str(resume))
+        # Cached answers are only reused for the resume they were generated from
+        self.semantic_cache.set_namespace(hashlib.sha256(self._resume_prefix.encode("utf-8")).hexdigest())
+        # Pre-serialized per Section, so answering does not re-stringify the resume objects
+        self._resume_sections = tuple(
+            _serialize_section(getattr(resume, section.name.lower(), None)) for section in Section
+        )
 
     def set_job(self, job):
         """
@@ -268,6 +965,8 @@ class GPTAnswerer:
             job: Job object containing job details and description
         """
         self.job = job
+        # Prefetched answers were written for the previous job
+        self._prefetched.clear()
         self.job.set_summarize_job_description(
             self.summarize_job_description(self.job.description)
         )
@@ -276,6 +975,9 @@ class GPTAnswerer:
         """
         Generate a summary of the job description.
         
+        The summary is a plain truncation, cheaper than any cache lookup;
+        cache it if it ever becomes an LLM call.
+        
         Args:
             text: Full job description text
             
@@ -287,64 +989,108 @@ class GPTAnswerer:
             return self.current_summary
         output = text[:100]  # Simple truncation for now
         return output
-    
 
     def get_resume_html(self):
         """
         Generate HTML resume tailored to the current job description.
         
+        The resume markdown produced by the first stage only depends on
+        the resume and is cached on disk.
+        
         Returns:
-            HTML-formatted resume string customized for the job
+            HTML-formatted resume string customized for the job, or None if
+            generation fails after retries
         """
-        resume_markdown_prompt = ChatPromptTemplate.from_template(strings.resume_markdown_template)
-        fusion_job_description_resume_prompt = ChatPromptTemplate.from_template(strings.fusion_job_description_resume_template)
-        resume_markdown_chain = resume_markdown_prompt | self.llm_cheap | StrOutputParser()
-        fusion_job_description_resume_chain = fusion_job_description_resume_prompt | self.llm_cheap | StrOutputParser()
-        
-        # Get template file paths
-        casual_markdown_path = os.path.abspath("resume_template/casual_markdown.js")
-        reorganize_header_path = os.path.abspath("resume_template/reorganizeHeader.js")
-        resume_css_path = os.path.abspath("resume_template/resume.css")
-
-        html_template = strings.html_template.format(
-            casual_markdown=casual_markdown_path, 
-            reorganize_header=reorganize_header_path, 
-            resume_css=resume_css_path
-        )
-        
-        composed_chain = (
-            resume_markdown_chain
-            | (lambda output: {"job_description": self.job.summarize_job_description, "formatted_resume": output})
-            | fusion_job_description_resume_chain
-            | (lambda formatted_resume: html_template + formatted_resume)
-        )
-        
         try:
-            output = composed_chain.invoke({
-                "resume": self.resume,
-                "job_description": self.job.summarize_job_description
+            key = hashlib.sha256(self._resume_prefix.encode("utf-8")).hexdigest()
+            formatted_resume = self._resume_markdown_shelf.get(key)
+            if formatted_resume is None:
+                formatted_resume = self._resume_markdown_chain.invoke({"resume": self._resume_prefix})
+                # Kept so a failure in the second stage does not redo the first
+                self._resume_markdown_shelf[key] = formatted_resume
+            
+            output = self._resume_fusion_chain.invoke({
+                "job_description": self.job.summarize_job_description,
+                "formatted_resume": formatted_resume
             })
-            return output
+            return _HTML_TEMPLATE_FORMATTED + output
         except Exception as e:
-            pass  # Return None if generation fails
+            logger.error(f"[GPT ERROR] Failed to generate resume HTML: {e}")
+            return None
 
-    def _create_chain(self, template: str):
+    def _create_chain(self, template: str, llm: LoggerChatModel | None = None):
         """
         Create a LangChain processing chain from a template.
         
+        Templates containing the resume or base config block get that block
+        as a leading system message, keeping the prompt prefix identical
+        across calls.
+        
         Args:
             template: Prompt template string
+            llm: Model to use, defaults to llm_cheap
             
         Returns:
             Configured chain for processing
         """
-        prompt = ChatPromptTemplate.from_template(template)
-        return prompt | self.llm_cheap | StrOutputParser()
+        prompt = self._create_prompt(template)
+        return prompt | (llm or self.llm_cheap).as_runnable() | StrOutputParser()
+
+    @staticmethod
+    def _create_prompt(template: str) -> ChatPromptTemplate:
+        """
+        Create a chat prompt from a template, ordered for provider-side prefix caching.
+        
+        The resume / base config block becomes a leading system message shared
+        by every template, followed by the template's static instructions as
+        a second system message; only the text after the block (the question)
+        is sent as the human message, so every request with the same template
+        starts with an identical prefix.
+        
+        Args:
+            template: Prompt template string
+            
+        Returns:
+            Chat prompt template
+        """
+        for block, reference in _PREFIX_BLOCKS:
+            if block in template:
+                instructions, question = template.split(block, 1)
+                messages = [("system", block)]
+                if instructions.strip():
+                    messages.append(("system", instructions.strip()))
+                messages.append(("human", reference + question))
+                return ChatPromptTemplate.from_messages(messages)
+        return ChatPromptTemplate.from_template(template)
+
+    @staticmethod
+    def _parse_json_reply(output: str):
+        """
+        Parse a JSON reply, tolerating a surrounding markdown code fence.
+        
+        Args:
+            output: Raw model output
+            
+        Returns:
+            Parsed JSON value
+            
+        Raises:
+            ValueError: If the output is not valid JSON
+        """
+        text = output.strip()
+        match = _FENCE_RE.match(text)
+        if match:
+            text = match.group(1)
+        return json.loads(text)
 
     def answer_question_textual_wide_range(self, question: str) -> str:
         """
         Answer a wide-range textual question by determining the relevant resume section.
         
+        Section selection and answering are done in one request; if the reply
+        cannot be parsed, falls back to selecting the section first and then
+        answering with the section-specific template.
+        
         Args:
             question: Question text to answer
             
@@ -353,81 +1099,284 @@ class GPTAnswerer:
         """
         logger.debug(f"[GPT] Answering textual question (wide range): {question[:100]}...")
         
-        # Define chains for each resume section
-        chains = {
-            "personal_information": self._create_chain(strings.personal_information_template),
-            "self_identification": self._create_chain(strings.self_identification_template),
-            "legal_authorization": self._create_chain(strings.legal_authorization_template),
-            "work_preferences": self._create_chain(strings.work_preferences_template),
-            "education_details": self._create_chain(strings.education_details_template),
-            "experience_details": self._create_chain(strings.experience_details_template),
-            "projects": self._create_chain(strings.projects_template),
-            "availability": self._create_chain(strings.availability_template),
-            "salary_expectations": self._create_chain(strings.salary_expectations_template),
-            "certifications": self._create_chain(strings.certifications_template),
-            "languages": self._create_chain(strings.languages_template),
-            "interests": self._create_chain(strings.interests_template),
-            "cover_letter": self._create_chain(strings.coverletter_template),
-        }
+        prefetched = self._prefetched.pop(("textual", question), None)
+        if prefetched is not None:
+            return prefetched
+        
+        cached = self.semantic_cache.lookup(question, "wide_range")
+        if cached is not None:
+            return cached
+        
+        # A confident local classification answers from the section alone, with a much smaller prompt
+        section = self._classify_section(question)
+        if section is Section.COVER_LETTER:
+            return self._generate_cover_letter()
+        if section is not None and self._resume_sections[section] is not None:
+            answer = self._answer_from_section(section, question)
+            self.semantic_cache.insert(question, answer, "wide_range")
+            return answer
+        
+        reply = self._section_answer_chain.invoke({"resume": self._resume_prefix, "question": question})
+        section, answer = self._parse_section_reply(reply)
+        if section is Section.COVER_LETTER:
+            # Cover letters depend on the job description, never cache them
+            return self._generate_cover_letter()
+        if not answer:
+            # The fallback may still pick the cover letter section, so its answer is not cached
+            return self._answer_question_two_step(question)
+        self.semantic_cache.insert(question, answer, "wide_range")
+        return answer
+
+    def stream_answer_textual_wide_range(self, question: str) -> Iterator[str]:
+        """
+        Streaming variant of answer_question_textual_wide_range.
+        
+        Questions confidently classified to a resume section are answered
+        with a streamed request, so the caller can start typing the first
+        chunks while the rest is generated. Prefetched, cached and
+        ambiguous questions yield the whole answer at once.
+        
+        Args:
+            question: Question text to answer
+            
+        Yields:
+            Chunks of the answer
+        """
+        prefetched = self._prefetched.pop(("textual", question), None)
+        if prefetched is not None:
+            yield prefetched
+            return
+        
+        cached = self.semantic_cache.lookup(question, "wide_range")
+        if cached is not None:
+            yield cached
+            return
+        
+        section = self._classify_section(question)
+        if section is None or section is Section.COVER_LETTER or self._resume_sections[section] is None:
+            yield self.answer_question_textual_wide_range(question)
+            return
+        
+        prompt = self._section_chains[section].first.invoke({
+            "resume_section": self._resume_sections[section],
+            "question": question
+        })
+        parts = []
+        for part in self.llm_cheap.stream(prompt):
+            parts.append(part)
+            yield part
+        self.semantic_cache.insert(question, "".join(parts), "wide_range")
+
+    async def answer_question_textual_wide_range_async(self, question: str) -> str:
+        """
+        Async variant of answer_question_textual_wide_range.
+        
+        Follows the same steps (prefetched answer, semantic cache, local
+        classification, combined request, two-step fallback) and caches the
+        same answers, so both variants agree on a given question. The cache
+        and classifier embed the question; callers answering several
+        questions should embed them up front (see answer_questions_concurrent)
+        so these lookups do not block the event loop.
+        
+        Args:
+            question: Question text to answer
+            
+        Returns:
+            AI-generated response based on relevant resume section
+        """
+        logger.debug(f"[GPT] Answering textual question (wide range, async): {question[:100]}...")
         
+        prefetched = self._prefetched.pop(("textual", question), None)
+        if prefetched is not None:
+            return prefetched
+        
+        cached = self.semantic_cache.lookup(question, "wide_range")
+        if cached is not None:
+            return cached
+        
+        section = self._classify_section(question)
+        if section is Section.COVER_LETTER:
+            return await self._generate_cover_letter_async()
+        if section is not None and self._resume_sections[section] is not None:
+            chain = self._section_chains[section]
+            answer = await chain.ainvoke({"resume_section": self._resume_sections[section], "question": question})
+            self.semantic_cache.insert(question, answer, "wide_range")
+            return answer
+        
+        reply = await self._section_answer_chain.ainvoke({"resume": self._resume_prefix, "question": question})
+        section, answer = self._parse_section_reply(reply)
+        if section is Section.COVER_LETTER:
+            # Cover letters depend on the job description, never cache them
+            return await self._generate_cover_letter_async()
+        if not answer:
+            # The fallback may still pick the cover letter section, so its answer is not cached
+            return await asyncio.to_thread(self._answer_question_two_step, question)
+        self.semantic_cache.insert(question, answer, "wide_range")
+        return answer
+
+    async def _generate_cover_letter_async(self) -> str:
+        """Async variant of _generate_cover_letter."""
+        logger.debug("[GPT] Generating cover letter")
+        chain = self._section_chains[Section.COVER_LETTER]
+        return await chain.ainvoke({"resume": self._resume_prefix, "job_description": self.job_description})
+
+    async def answer_questions_concurrent(self, questions: list[str], concurrency: int = 10) -> list[str]:
+        """
+        Answer several textual questions concurrently.
+        
+        Args:
+            questions: Question texts to answer
+            concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Answers in the same order as the questions
+        """
+        # One embeddings request for all questions, reused by the section classifier
+        try:
+            await asyncio.to_thread(self._embed_texts, questions)
+        except Exception as e:
+            logger.warning(f"[GPT] Batch embedding failed: {e}")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def answer(question: str) -> str:
+            async with semaphore:
+                return await self.answer_question_textual_wide_range_async(question)
+        
+        return list(await asyncio.gather(*(answer(question) for question in questions)))
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts, requesting only those not embedded before in a single call.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embeddings in the same order as the texts
+        """
+        missing = list(dict.fromkeys(text for text in texts if text not in self._embedding_memo))
+        if missing:
+            if len(self._embedding_memo) > 4096:
+                self._embedding_memo.clear()
+            self._embedding_memo.update(zip(missing, self._embeddings.embed_documents(missing)))
+        return [self._embedding_memo[text] for text in texts]
+
+    def _classify_section(self, question: str) -> Section | None:
+        """
+        Pick the resume section of a question by nearest centroid embedding.
+        
+        Centroids are built on first use from the label and example
+        phrasings of each section in _SECTION_EXAMPLES.
+        
+        Args:
+            question: Question text
+            
+        Returns:
+            The closest section, or None if the embedding failed or the two
+            closest sections are within _SECTION_MARGIN of each other
+        """
+        try:
+            if self._section_centroids is None:
+                examples = [(section, text) for section, texts in _SECTION_EXAMPLES.items() for text in texts]
+                vectors = np.asarray(self._embed_texts([text for _, text in examples]), dtype=np.float32)
+                vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+                owners = np.array([section for section, _ in examples])
+                centroids = np.stack([vectors[owners == section].mean(axis=0) for section in Section])
+                self._section_centroids = centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+            query = np.asarray(self._embed_texts([question])[0], dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"[GPT] Section classification embedding failed: {e}")
+            return None
+        
+        similarities = self._section_centroids @ (query / (np.linalg.norm(query) or 1.0))
+        second, best = np.argsort(similarities)[-2:]
+        margin = float(similarities[best] - similarities[second])
+        if margin < _SECTION_MARGIN:
+            logger.debug(f"[GPT] Section classification ambiguous (margin {margin:.3f}), deferring to the LLM")
+            return None
+        section = Section(int(best))
+        logger.debug(f"[GPT] Classified section locally: {section.name.lower()} (margin {margin:.3f})")
+        return section
+
+    def _parse_section_reply(self, reply: "SectionAnswer | None") -> tuple[Section | None, str]:
+        """
+        Interpret the structured reply of the combined section/answer request.
+        
+        Args:
+            reply: Validated structured reply, or None if validation failed
+            
+        Returns:
+            Tuple of (section, answer). The answer is empty when the reply
+            is unusable and the two-step flow should be used instead.
+        """
+        if reply is None:
+            logger.debug("[GPT] Combined section reply failed validation, using two-step flow")
+            return None, ""
+        
+        section = Section[reply.section.upper()]
+        answer = reply.answer.strip()
+        logger.debug(f"[GPT] Selected section: {reply.section} (combined request)")
+        if answer:
+            logger.debug(f"[GPT] Answer generated from {reply.section}, length: {len(answer)} chars")
+        return section, answer
+
+    def _generate_cover_letter(self) -> str:
+        """Generate a cover letter for the current job."""
+        logger.debug("[GPT] Generating cover letter")
+        chain = self._section_chains[Section.COVER_LETTER]
+        output = chain.invoke({"resume": self._resume_prefix, "job_description": self.job_description})
+        logger.debug(f"[GPT] Cover letter generated, length: {len(output)} chars")
+        return output
+
+    def _answer_question_two_step(self, question: str) -> str:
+        """
+        Answer a textual question by selecting the resume section, then answering from it.
+        
+        Args:
+            question: Question text to answer
+            
+        Returns:
+            AI-generated response based on relevant resume section
+        """
         # Determine which resume section is relevant
-        section_prompt = (
-            f"For the following question: '{question}', which section of the resume is relevant? "
-            "Respond with ONLY ONE of these exact options (no explanation, no markdown, just the text):\n"
-            "Personal information\n"
-            "Self Identification\n"
-            "Legal Authorization\n"
-            "Work Preferences\n"
-            "Education Details\n"
-            "Experience Details\n"
-            "Projects\n"
-            "Availability\n"
-            "Salary Expectations\n"
-            "Certifications\n"
-            "Languages\n"
-            "Interests\n"
-            "Cover letter"
-        )
         logger.debug("[GPT] Determining relevant resume section")
-        prompt = ChatPromptTemplate.from_template(section_prompt)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        output = chain.invoke({"question": question})
-        
-        # Clean up output (remove markdown, extra text, etc.)
-        output_clean = output.strip().lower()
-        # Remove markdown formatting
-        output_clean = output_clean.replace("**", "").replace("*", "")
-        # Extract just the section name if there's extra text
-        for valid_section in ["personal information", "self identification", "legal authorization",
-                              "work preferences", "education details", "experience details",
-                              "projects", "availability", "salary expectations", "certifications",
-                              "languages", "interests", "cover letter"]:
-            if valid_section in output_clean:
-                output_clean = valid_section
-                break
-        
-        section_name = output_clean.replace(" ", "_")
-        logger.debug(f"[GPT] Selected section: {section_name} (from output: {output.strip()[:50]})")
+        section = self._classify_section(question)
+        if section is None:
+            output = self._section_picker_chain.invoke({"question": question})
+            
+            # Strip markdown and extract just the section name if there's extra text
+            output_clean = _MD_RE.sub("", output).strip().lower()
+            match = _SECTION_RE.search(output_clean)
+            section = _SECTION_BY_NAME[match.group(1).lower()] if match else Section.EXPERIENCE_DETAILS
+            logger.debug(f"[GPT] Selected section: {section.name.lower()} (from output: {output.strip()[:50]})")
         
         # Handle cover letter specially
-        if section_name == "cover_letter":
-            logger.debug("[GPT] Generating cover letter")
-            chain = chains.get(section_name)
-            output = chain.invoke({"resume": self.resume, "job_description": self.job_description})
-            logger.debug(f"[GPT] Cover letter generated, length: {len(output)} chars")
-            return output
-            
-        # Get relevant resume section
-        resume_section = getattr(self.resume, section_name, None)
+        if section is Section.COVER_LETTER:
+            return self._generate_cover_letter()
+        return self._answer_from_section(section, question)
+
+    def _answer_from_section(self, section: Section, question: str) -> str:
+        """
+        Answer a textual question from a single resume section.
+        
+        Args:
+            section: Resume section to answer from
+            question: Question text to answer
+            
+        Returns:
+            AI-generated response based on the resume section
+            
+        Raises:
+            ValueError: If the section is missing from the resume
+        """
+        section_name = section.name.lower()
+        resume_section = self._resume_sections[section]
         if resume_section is None:
             logger.error(f"[GPT ERROR] Section '{section_name}' not found in the resume")
             raise ValueError(f"Section '{section_name}' not found in the resume.")
             
-        chain = chains.get(section_name)
-        if chain is None:
-            logger.error(f"[GPT ERROR] Chain not defined for section '{section_name}'")
-            raise ValueError(f"Chain not defined for section '{section_name}'")
-            
+        chain = self._section_chains[section]
         output = chain.invoke({"resume_section": resume_section, "question": question})
         logger.debug(f"[GPT] Answer generated from {section_name}, length: {len(output)} chars")
         return output
@@ -442,12 +1391,192 @@ class GPTAnswerer:
         Returns:
             AI-generated response based on resume data
         """
-        template = self._preprocess_template_string(strings.resume_stuff_template)
-        prompt = ChatPromptTemplate.from_template(template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        output = chain.invoke({"resume": self.resume, "question": question})
+        cached = self.semantic_cache.lookup(question, "textual")
+        if cached is not None:
+            return cached
+        
+        chain = self._resume_stuff_chain
+        output = chain.invoke({"resume": self._resume_prefix, "question": question})
+        self.semantic_cache.insert(question, output, "textual")
         return output
 
+    def answer_questions_batch(self, questions: list[str]) -> list[str]:
+        """
+        Answer several textual questions from the same form in a single request.
+        
+        Falls back to answering each question individually if the reply is
+        not a JSON array with one answer per question.
+        
+        Args:
+            questions: Question texts to answer
+            
+        Returns:
+            Answers in the same order as the questions
+        """
+        if not questions:
+            return []
+        if len(questions) == 1:
+            return [self.answer_question_textual_wide_range(questions[0])]
+        
+        logger.debug(f"[GPT] Answering {len(questions)} questions in one request")
+        output = self._batch_questions_chain.invoke({
+            "resume": self._resume_prefix,
+            "questions": self._numbered(questions),
+            "count": len(questions)
+        })
+        try:
+            answers = self._parse_json_reply(output)
+        except ValueError as e:
+            answers = None
+            logger.debug(f"[GPT] Could not parse batch reply: {e}")
+        
+        if not isinstance(answers, list) or len(answers) != len(questions):
+            logger.warning("[GPT] Batch reply did not match the questions, answering individually")
+            return self._answer_questions_individually(questions)
+        return [str(answer) for answer in answers]
+
+    def _answer_questions_individually(self, questions: list[str]) -> list[str]:
+        """
+        Answer textual questions with one request each, concurrently when possible.
+        
+        Args:
+            questions: Question texts to answer
+            
+        Returns:
+            Answers in the same order as the questions
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _run_async(self.answer_questions_concurrent(questions))
+        # Already inside an event loop, which must not block on another: answer in turn
+        return [self.answer_question_textual_wide_range(question) for question in questions]
+
+    def answer_questions_numeric_batch(self, questions: list[str], default_experience: int = 3) -> list[int]:
+        """
+        Answer several numeric questions from the same form in a single request.
+        
+        Falls back to answering each question individually if the reply is
+        not a JSON array with one number per question.
+        
+        Args:
+            questions: Numeric question texts
+            default_experience: Default value if extraction fails
+            
+        Returns:
+            Numbers in the same order as the questions
+        """
+        if len(questions) < 2:
+            return [self.answer_question_numeric(question, default_experience) for question in questions]
+        
+        logger.debug(f"[GPT] Answering {len(questions)} numeric questions in one request")
+        output = self._numeric_batch_chain.invoke({
+            "resume": self._resume_prefix,
+            "questions": self._numbered(questions),
+            "count": len(questions),
+            "default_experience": default_experience
+        })
+        try:
+            answers = [int(answer) for answer in self._parse_json_reply(output)]
+        except (ValueError, TypeError) as e:
+            answers = None
+            logger.debug(f"[GPT] Could not parse numeric batch reply: {e}")
+        
+        if answers is None or len(answers) != len(questions):
+            logger.warning("[GPT] Numeric batch reply did not match the questions, answering individually")
+            return [self.answer_question_numeric(question, default_experience) for question in questions]
+        return answers
+
+    def answer_questions_options_batch(self, questions: list[tuple[str, list[str]]]) -> list[str]:
+        """
+        Answer several multiple choice questions from the same form in a single request.
+        
+        Each reply is snapped to the closest option of its question. Falls
+        back to answering each question individually if the reply is not a
+        JSON array with one answer per question.
+        
+        Args:
+            questions: (question text, options) pairs
+            
+        Returns:
+            Chosen options in the same order as the questions
+        """
+        if len(questions) < 2:
+            return [self.answer_question_from_options(question, options) for question, options in questions]
+        
+        logger.debug(f"[GPT] Answering {len(questions)} option questions in one request")
+        numbered = self._numbered([f"{question}\n   Options: {options}" for question, options in questions])
+        output = self._options_batch_chain.invoke({
+            "resume": self._resume_prefix,
+            "questions": numbered,
+            "count": len(questions)
+        })
+        try:
+            answers = self._parse_json_reply(output)
+        except ValueError as e:
+            answers = None
+            logger.debug(f"[GPT] Could not parse options batch reply: {e}")
+        
+        if not isinstance(answers, list) or len(answers) != len(questions):
+            logger.warning("[GPT] Options batch reply did not match the questions, answering individually")
+            return [self.answer_question_from_options(question, options) for question, options in questions]
+        return [
+            self.find_best_match(str(answer), options)
+            for answer, (_, options) in zip(answers, questions)
+        ]
+
+    def prefetch_answers(
+        self,
+        textual: list[str] = (),
+        numeric: list[str] = (),
+        options: list[tuple[str, list[str]]] = ()
+    ):
+        """
+        Answer the pending questions of a form with one batched request per type.
+        
+        The answers are kept until the matching answer_question_* call asks
+        for them, so a form with N questions costs up to three requests
+        instead of N.
+        
+        Args:
+            textual: Textual question texts
+            numeric: Numeric question texts
+            options: (question text, options) pairs of multiple choice questions
+        """
+        if len(textual) > 1:
+            for question, answer in zip(textual, self.answer_questions_batch(list(textual))):
+                self._prefetched[("textual", question)] = answer
+        if len(numeric) > 1:
+            for question, answer in zip(numeric, self.answer_questions_numeric_batch(list(numeric))):
+                self._prefetched[("numeric", question)] = answer
+        if len(options) > 1:
+            for (question, choices), answer in zip(options, self.answer_questions_options_batch(list(options))):
+                self._prefetched[("options", question, tuple(choices))] = answer
+
+    def discard_prefetched(self):
+        """Drop prefetched answers that no answer_question_* call asked for."""
+        self._prefetched.clear()
+
+    def has_prefetched(self, kind: str, question: str, options: list[str] | None = None) -> bool:
+        """
+        Check whether prefetch_answers left an answer for a question.
+        
+        Args:
+            kind: "textual", "numeric" or "options"
+            question: Question text
+            options: Choices of an "options" question
+            
+        Returns:
+            True if the matching answer_question_* call will use a prefetched answer
+        """
+        key = (kind, question) if options is None else (kind, question, tuple(options))
+        return key in self._prefetched
+
+    @staticmethod
+    def _numbered(questions: list[str]) -> str:
+        """Format questions as a numbered list for batch prompts."""
+        return "\n".join(f"{i}. {question}" for i, question in enumerate(questions, 1))
+
     def answer_question_numeric(self, question: str, default_experience: int = 3) -> int:
         """
         Answer a numeric question (e.g., years of experience).
@@ -461,11 +1590,17 @@ class GPTAnswerer:
         """
         logger.debug(f"[GPT] Answering numeric question: {question[:100]}...")
         
-        func_template = self._preprocess_template_string(strings.numeric_question_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        prefetched = self._prefetched.pop(("numeric", question), None)
+        if prefetched is not None:
+            return prefetched
+        
+        cached = self.semantic_cache.lookup(question, "numeric")
+        if cached is not None:
+            return int(cached)
+        
+        chain = self._numeric_question_chain
         output_str = chain.invoke({
-            "resume": self.resume, 
+            "resume": self._resume_prefix, 
             "question": question, 
             "default_experience": default_experience
         })
@@ -475,11 +1610,24 @@ class GPTAnswerer:
         try:
             output = self.extract_number_from_string(output_str)
             logger.debug(f"[GPT] Extracted number: {output}")
+            self.semantic_cache.insert(question, str(output), "numeric")
         except ValueError:
             logger.warning(f"[GPT] Could not extract number from response, using default: {default_experience}")
             output = default_experience
         return output
 
+    def record_answer_feedback(self, question: str, accepted: bool):
+        """
+        Report whether the form accepted an answer, tuning the semantic cache.
+        
+        Only answers served from the cache count; see SemanticCache.record_feedback.
+        
+        Args:
+            question: Question text as passed to the answer_question_* method
+            accepted: False if the form rejected the answer as invalid
+        """
+        self.semantic_cache.record_feedback(question, accepted)
+
     def extract_number_from_string(self, output_str):
         """
         Extract the first number found in a string.
@@ -493,9 +1641,9 @@ class GPTAnswerer:
         Raises:
             ValueError: If no numbers are found
         """
-        numbers = re.findall(r"\d+", output_str)
-        if numbers:
-            return int(numbers[0])
+        match = _NUM_RE.search(output_str)
+        if match:
+            return int(match.group())
         else:
             raise ValueError("No numbers found in the string")
 
@@ -510,15 +1658,24 @@ class GPTAnswerer:
         Returns:
             Best matching option from the provided list
         """
-        func_template = self._preprocess_template_string(strings.options_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        prefetched = self._prefetched.pop(("options", question, tuple(options)), None)
+        if prefetched is not None:
+            return prefetched
+        
+        # Answers are only reused for the same set of options
+        kind = "options:" + hashlib.sha1("\0".join(sorted(options)).encode("utf-8")).hexdigest()[:16]
+        cached = self.semantic_cache.lookup(question, kind)
+        if cached is not None and cached in options:
+            return cached
+        
+        chain = self._options_chain
         output_str = chain.invoke({
-            "resume": self.resume, 
+            "resume": self._resume_prefix, 
             "question": question, 
             "options": options
         })
         best_option = self.find_best_match(output_str, options)
+        self.semantic_cache.insert(question, best_option, kind)
         return best_option
 
     def get_numeric_range(self, question: str, error_text: str) -> str:
@@ -532,9 +1689,7 @@ class GPTAnswerer:
         Returns:
             String in format "min,max" representing appropriate range
         """
-        func_template = self._preprocess_template_string(strings.numeric_range_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        chain = self._numeric_range_chain
         
         output_str = chain.invoke({
             "question": question,
@@ -544,12 +1699,12 @@ class GPTAnswerer:
         # Extract the range from response, fallback to conservative range
         try:
             # Look for pattern like "1,99" or "0,10" 
-            range_match = re.search(r"(\d+),(\d+)", output_str)
+            range_match = _RANGE_RE.search(output_str)
             if range_match:
                 return f"{range_match.group(1)},{range_match.group(2)}"
             else:
                 # Fallback parsing - look for individual numbers
-                numbers = re.findall(r"\d+", output_str)
+                numbers = _NUM_RE.findall(output_str)
                 if len(numbers) >= 2:
                     return f"{numbers[0]},{numbers[1]}"
                 else:
@@ -557,6 +1712,23 @@ class GPTAnswerer:
         except Exception:
             return "1,99"  # Safe fallback
 
+    @staticmethod
+    def _strip_code_fence(text: str) -> str:
+        """
+        Remove a markdown code block wrapper (```yaml or ```) from a reply.
+        
+        Args:
+            text: Raw model output
+            
+        Returns:
+            Content inside the code block, or the text unchanged if not wrapped
+        """
+        match = _FENCE_RE.match(text.strip())
+        if match:
+            logger.debug("[GPT] Removing markdown code block wrapper")
+            return match.group(1)
+        return text
+
     def tailor_resume_to_job(self, job_description: str, base_config_path: str) -> str:
         """
         Tailor resume configuration to a specific job by analyzing the job description.
@@ -576,61 +1748,28 @@ class GPTAnswerer:
         try:
             with open(base_config_path, 'r', encoding='utf-8') as f:
                 base_config = f.read()
+            self._config_prefix = self._canonical_prefix(base_config)
             logger.debug(f"[GPT] Base config loaded, size: {len(base_config)} bytes")
         except Exception as e:
             logger.error(f"[GPT ERROR] Failed to read base config: {e}")
             return base_config
         
-        func_template = self._preprocess_template_string(strings.resume_tailoring_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        chain = self._resume_tailoring_chain
         
         try:
             logger.debug("[GPT] Sending tailoring request to API")
             tailored_config = chain.invoke({
                 "job_description": job_description,
-                "base_config": base_config
+                "base_config": self._config_prefix
             })
             logger.debug(f"[GPT] Received tailored config, size: {len(tailored_config)} bytes")
             
             # Clean up the response - remove markdown code blocks if present
-            if tailored_config.strip().startswith('```yaml'):
-                logger.debug("[GPT] Removing ```yaml markdown wrapper")
-                # Extract content between ```yaml and ```
-                lines = tailored_config.split('\n')
-                start_idx = 0
-                end_idx = len(lines)
-                
-                for i, line in enumerate(lines):
-                    if line.strip().startswith('```yaml'):
-                        start_idx = i + 1
-                    elif line.strip() == '```' and i > start_idx:
-                        end_idx = i
-                        break
-                
-                tailored_config = '\n'.join(lines[start_idx:end_idx])
-            
-            elif tailored_config.strip().startswith('```'):
-                logger.debug("[GPT] Removing ``` markdown wrapper")
-                # Extract content between ``` and ```
-                lines = tailored_config.split('\n')
-                start_idx = 0
-                end_idx = len(lines)
-                
-                for i, line in enumerate(lines):
-                    if line.strip().startswith('```'):
-                        if start_idx == 0:
-                            start_idx = i + 1
-                        else:
-                            end_idx = i
-                            break
-                
-                tailored_config = '\n'.join(lines[start_idx:end_idx])
+            tailored_config = self._strip_code_fence(tailored_config)
             
             # Validate that the response is valid YAML
             logger.debug("[GPT] Validating tailored YAML")
-            import yaml
-            yaml.safe_load(tailored_config)
+            yaml.load(tailored_config, Loader=_SafeLoader)
             logger.info("[GPT] Resume tailoring completed successfully")
             
             return tailored_config
@@ -11,6 +11,7 @@ Date: 2025
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass
@@ -38,6 +39,10 @@ class Job:
     description: str = ""
     summarize_job_description: str = ""
 
+    def __post_init__(self) -> None:
+        """Precompute the lowercased apply method used by is_easy_apply."""
+        self._apply_method_lower = self.apply_method.lower()
+
     def set_summarize_job_description(self, summarize_job_description: str) -> None:
         """
         Set the AI-generated summary of the job description.
@@ -80,9 +85,10 @@ class Job:
         """
         return job_information.strip()
 
-    def get_unique_identifier(self) -> str:
+    @cached_property
+    def unique_identifier(self) -> str:
         """
-        Generate a unique identifier for this job posting.
+        Unique identifier for this job posting, computed once.
         
         Returns:
             str: Unique identifier based on company, title, and location
@@ -96,7 +102,7 @@ class Job:
         Returns:
             bool: True if job supports Easy Apply, False otherwise
         """
-        return "easy apply" in self.apply_method.lower()
+        return "easy apply" in self._apply_method_lower
 
     def __str__(self) -> str:
         """
@@ -13,14 +13,22 @@ and handles various authentication scenarios including 2FA challenges.
 Date: 2025
 """
 
+import json
+import os
 import time
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+import utils
 from logging_config import logger
 
+# Cookie jar saved after a successful login, restored on the next start. It
+# holds the li_at session token, so only the owner may read it.
+COOKIES_PATH = os.path.join(os.path.dirname(utils.CHROME_PROFILE_PATH), "linkedin_cookies.json")
+_LEGACY_COOKIES_PATH = os.path.join(os.path.dirname(utils.CHROME_PROFILE_PATH), "linkedin_cookies.pkl")
+
 
 class LinkedInAuthenticator:
     """
@@ -61,8 +69,9 @@ class LinkedInAuthenticator:
         
         This method initiates the complete login workflow:
         1. Navigate to LinkedIn homepage
-        2. Check if already logged in
-        3. Handle login process if needed
+        2. Trust a valid session cookie, restoring saved cookies if needed
+        3. Check if already logged in
+        4. Handle login process if needed
         """
         logger.info("[AUTH] Starting LinkedIn authentication process")
         logger.debug("[AUTH] Navigating to LinkedIn homepage...")
@@ -77,9 +86,17 @@ class LinkedInAuthenticator:
         self.wait_for_page_load()
         logger.debug("[AUTH] Page load complete")
         
+        if self.has_session_cookie():
+            logger.info("[AUTH] Valid LinkedIn session cookie found, skipping login check")
+            return
+        
+        if self.restore_cookies():
+            logger.debug("[AUTH] Restored saved cookies, verifying session")
+        
         if not self.is_logged_in():
             logger.info("[AUTH] Not logged in, initiating login process...")
             self.handle_login()
+            self.save_cookies()
         else:
             logger.info("[AUTH] Already logged in to LinkedIn")
             logger.debug(f"[AUTH] Current URL: {self.driver.current_url}")
@@ -109,9 +126,15 @@ class LinkedInAuthenticator:
             logger.debug("[AUTH] Submitting login form")
             self.submit_login_form()
             
-            # Wait for login to process
-            logger.debug("[AUTH] Waiting for login to process (8 seconds)")
-            time.sleep(8)  # Allow time for login processing and redirects
+            # Wait for the redirect to the feed or a security checkpoint
+            logger.debug("[AUTH] Waiting for login to process")
+            try:
+                WebDriverWait(self.driver, 15).until(EC.any_of(
+                    EC.url_contains("/feed"),
+                    EC.url_contains("/checkpoint/")
+                ))
+            except TimeoutException:
+                logger.debug("[AUTH] No redirect after login yet, continuing to security check")
             
             # Handle any security challenges
             logger.debug("[AUTH] Checking for security challenges")
@@ -183,24 +206,84 @@ class LinkedInAuthenticator:
             RuntimeError: If security checkpoint is not resolved within the timeout
         """
         logger.debug("Checking for security challenges...")
-        end_time = time.time() + max_wait_minutes * 60
         
-        while time.time() < end_time:
-            current_url = self.driver.current_url
-            
-            # Check if we've successfully reached the feed page
-            if "/feed" in current_url:
-                logger.info("Security check cleared - landed on the feed page")
-                return
-                
-            # Check if we're on a checkpoint page
-            if "/checkpoint/" in current_url:
-                logger.warning("Security checkpoint detected. Please solve it in the open browser tab...")
-                logger.info("Waiting for manual completion...")
-                
-            time.sleep(5)
-
-        raise RuntimeError("Login aborted: security checkpoint not passed within time limit")
+        # Check if we're on a checkpoint page
+        if "/checkpoint/" in self.driver.current_url:
+            logger.warning("Security checkpoint detected. Please solve it in the open browser tab...")
+            logger.info("Waiting for manual completion...")
+        
+        # Block until the browser lands on the feed page
+        try:
+            WebDriverWait(self.driver, max_wait_minutes * 60, poll_frequency=1).until(
+                EC.url_contains("/feed")
+            )
+        except TimeoutException:
+            raise RuntimeError("Login aborted: security checkpoint not passed within time limit")
+        logger.info("Security check cleared - landed on the feed page")
+
+    def has_session_cookie(self) -> bool:
+        """
+        Check for LinkedIn's ``li_at`` authentication cookie without loading a page.
+        
+        Returns:
+            bool: True if the cookie is present and not expired
+        """
+        cookie = self.driver.get_cookie("li_at")
+        if not cookie:
+            return False
+        expiry = cookie.get("expiry")
+        return expiry is None or expiry > time.time()
+
+    def save_cookies(self) -> None:
+        """Persist the browser's cookies so the next run can skip the login workflow."""
+        try:
+            cookies = self.driver.get_cookies()
+            fd = os.open(COOKIES_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                if hasattr(os, "fchmod"):
+                    # The mode above only applies when the file is created
+                    os.fchmod(f.fileno(), 0o600)
+                json.dump(cookies, f)
+            logger.debug(f"[AUTH] Saved session cookies to {COOKIES_PATH}")
+            # Drop the world-readable pickle written by earlier versions
+            if os.path.exists(_LEGACY_COOKIES_PATH):
+                os.remove(_LEGACY_COOKIES_PATH)
+        except (OSError, WebDriverException) as e:
+            logger.warning(f"[AUTH] Failed to save session cookies: {e}")
+
+    def restore_cookies(self) -> bool:
+        """
+        Add the cookies saved by save_cookies to the browser.
+        
+        Must be called while on a linkedin.com page, since cookies can only
+        be set for the current domain.
+        
+        Returns:
+            bool: True if saved cookies were found and added
+        """
+        try:
+            with open(COOKIES_PATH, "r", encoding="utf-8") as f:
+                cookies = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"[AUTH] Failed to load saved cookies: {e}")
+            return False
+        if not isinstance(cookies, list):
+            logger.warning(f"[AUTH] Ignoring malformed cookie file {COOKIES_PATH}")
+            return False
+        
+        now = time.time()
+        for cookie in cookies:
+            if not isinstance(cookie, dict):
+                continue
+            if cookie.get("expiry", now + 1) <= now:
+                continue
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.debug(f"[AUTH] Skipped cookie {cookie.get('name')}: {e}")
+        return True
 
     def is_logged_in(self) -> bool:
         """
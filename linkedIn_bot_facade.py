@@ -11,6 +11,144 @@ interface for starting the job application process.
 Date: 2025
 """
 
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Initialization state flags, combined into LinkedInBotFacade.state
+(
+    STATE_CREDENTIALS,
+    STATE_API_KEY,
+    STATE_RESUME,
+    STATE_GPT,
+    STATE_PARAMS,
+    STATE_LOGGED_IN,
+) = (1 << i for i in range(6))
+
+# Flags that must all be set before applying
+STATE_APPLY_READY = STATE_RESUME | STATE_GPT | STATE_PARAMS | STATE_LOGGED_IN
+
+# Error raised by start_apply for each missing flag, in check order
+_APPLY_REQUIRED_MSGS = (
+    (STATE_LOGGED_IN, "You must be logged in before applying."),
+    (STATE_RESUME, "Plain text resume must be set before applying."),
+    (STATE_GPT, "GPT Answerer must be set before applying."),
+    (STATE_PARAMS, "Parameters must be set before applying."),
+)
+
+# Maximum number of GPT answers memoized per answerer
+ANSWER_MEMO_SIZE = 2048
+
+
+# Answer methods memoized by _bind_answerer, with the kind their prefetched answers are stored under
+_MEMOIZED_ANSWER_KINDS = {
+    "answer_question_numeric": "numeric",
+    "answer_question_from_options": "options",
+}
+
+
+def _memoize_answers(gpt_answerer, method, kind: str, resume_fp: bytes, memo: OrderedDict, lock: threading.Lock):
+    """
+    Wrap a GPT answer method with an LRU memo keyed on the resume and the normalized question.
+    
+    A pending prefetched answer for the question takes precedence over the
+    memo, so the answerer consumes it instead of keeping it for a later job.
+    
+    Args:
+        gpt_answerer: Answerer the method belongs to
+        method: Original bound answer method taking the question as first argument
+        kind: Kind the answerer stores prefetched answers of this method under
+        resume_fp: Fingerprint of the resume the answers are based on
+        memo: Shared LRU store, bounded by ANSWER_MEMO_SIZE
+        lock: Guards ``memo`` against appliers answering from several threads
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(question, *args, **kwargs):
+        key = (
+            resume_fp,
+            method.__name__,
+            question.strip().lower(),
+            tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args),
+            tuple(sorted(kwargs.items())),
+        )
+        options = (args[0] if args else kwargs.get("options")) if kind == "options" else None
+        if not gpt_answerer.has_prefetched(kind, question, options):
+            with lock:
+                if key in memo:
+                    memo.move_to_end(key)
+                    return memo[key]
+        answer = method(question, *args, **kwargs)
+        with lock:
+            memo[key] = answer
+            memo.move_to_end(key)
+            if len(memo) > ANSWER_MEMO_SIZE:
+                memo.popitem(last=False)
+        return answer
+    return wrapper
+
+
+def _bind_answerer(gpt_answerer, resume):
+    """
+    Give the GPT answerer its resume and memoize its resume-only answers.
+    
+    Numeric and multiple choice answers only depend on the resume and the
+    question, so repeats across postings are served from memory. Textual
+    answers are left to the answerer's own cache since they may be
+    job-specific (cover letters). Binding again (e.g. a new resume) wraps
+    the original methods afresh instead of stacking memo layers.
+    """
+    gpt_answerer.set_resume(resume)
+    resume_fp = hashlib.blake2b(repr(resume).encode(), digest_size=8).digest()
+    memo = OrderedDict()
+    lock = threading.Lock()
+    originals = gpt_answerer.__dict__.setdefault("_unmemoized_answer_methods", {})
+    for name, kind in _MEMOIZED_ANSWER_KINDS.items():
+        method = originals.setdefault(name, getattr(gpt_answerer, name))
+        setattr(gpt_answerer, name, _memoize_answers(gpt_answerer, method, kind, resume_fp, memo, lock))
+
+
+class LinkedInBotConfig:
+    """
+    Configuration shared by reference between many LinkedInBotFacade instances.
+    
+    Holds the parts that are the same for every target (resume, parameters,
+    GPT answerer) so they are prepared once, while each facade keeps its own
+    credentials and login state. See LinkedInBotFacade.from_config.
+    """
+
+    __slots__ = ("resume", "parameters", "gpt_answerer", "_resume_bound")
+
+    def __init__(self, resume, parameters, gpt_answerer):
+        """
+        Initialize the shared configuration.
+        
+        Args:
+            resume: Resume instance containing processed resume data
+            parameters: Dictionary containing configuration parameters
+            gpt_answerer: GPTAnswerer instance for question answering
+            
+        Raises:
+            ValueError: If resume or parameters is empty
+        """
+        if not resume:
+            raise ValueError("Plain text resume cannot be empty.")
+        if not parameters:
+            raise ValueError("Parameters cannot be None or empty.")
+        self.resume = resume
+        self.parameters = parameters
+        self.gpt_answerer = gpt_answerer
+        self._resume_bound = False
+
+    def bind(self):
+        """Bind the GPT answerer to the resume, once for all facades."""
+        if not self._resume_bound:
+            _bind_answerer(self.gpt_answerer, self.resume)
+            self._resume_bound = True
+
 
 class LinkedInBotFacade:
     """
@@ -26,6 +164,11 @@ class LinkedInBotFacade:
     provides a simplified interface for the main application flow.
     """
 
+    __slots__ = (
+        "login_component", "apply_component", "state", "resume",
+        "email", "password", "gpt_answerer", "parameters", "_gpt_wired", "_config",
+    )
+
     def __init__(self, login_component, apply_component):
         """
         Initialize the LinkedIn bot facade with required components.
@@ -37,15 +180,44 @@ class LinkedInBotFacade:
         self.login_component = login_component
         self.apply_component = apply_component
         
-        # Track initialization state of various components
-        self.state = {
-            "credentials_set": False,
-            "api_key_set": False,
-            "resume_set": False,
-            "gpt_answerer_set": False,
-            "parameters_set": False,
-            "logged_in": False
-        }
+        self.resume = None
+        self.email = None
+        self.password = None
+        self.gpt_answerer = None
+        self.parameters = None
+        self._gpt_wired = False
+        self._config = None
+        
+        # Track initialization state of various components as STATE_* flags
+        self.state = 0
+
+    @classmethod
+    def from_config(cls, login_component, apply_component, config: LinkedInBotConfig):
+        """
+        Create a facade that shares a prepared configuration by reference.
+        
+        Only the credentials and login remain to be done per facade; the
+        resume, parameters and GPT answerer are taken from ``config`` without
+        copying, and the job manager is only reconfigured if it was given
+        different parameters.
+        
+        Args:
+            login_component: LinkedInAuthenticator instance for handling login
+            apply_component: LinkedInJobManager instance for job applications
+            config: Shared configuration
+            
+        Returns:
+            LinkedInBotFacade ready for set_secrets and start_login
+        """
+        facade = cls(login_component, apply_component)
+        facade._config = config
+        facade.resume = config.resume
+        facade.parameters = config.parameters
+        facade.gpt_answerer = config.gpt_answerer
+        if apply_component._params is not config.parameters:
+            apply_component.set_parameters(config.parameters)
+        facade.state |= STATE_RESUME | STATE_GPT | STATE_PARAMS
+        return facade
 
     def set_resume(self, resume):
         """
@@ -60,7 +232,7 @@ class LinkedInBotFacade:
         if not resume:
             raise ValueError("Plain text resume cannot be empty.")
         self.resume = resume
-        self.state["resume_set"] = True
+        self.state |= STATE_RESUME
 
     def set_secrets(self, email, password):
         """
@@ -77,19 +249,35 @@ class LinkedInBotFacade:
             raise ValueError("Email and password cannot be empty.")
         self.email = email
         self.password = password
-        self.state["credentials_set"] = True
+        self.state |= STATE_CREDENTIALS
 
     def set_gpt_answerer(self, gpt_answerer_component):
         """
         Set the GPT answering component for intelligent form filling.
         
+        The component is only bound to the resume and the job manager when
+        applying starts, so runs that stop earlier (e.g. a failed login)
+        skip that work.
+        
         Args:
             gpt_answerer_component: GPTAnswerer instance for question answering
         """
-        self.gpt_answerer = gpt_answerer_component 
-        self.gpt_answerer.set_resume(self.resume)
+        self.gpt_answerer = gpt_answerer_component
+        self._gpt_wired = False
+        self.state |= STATE_GPT
+
+    def _wire_gpt_answerer(self):
+        """Bind the GPT answerer to the resume and the job manager, once."""
+        if self._gpt_wired:
+            return
+        if self._config is not None and self._config.gpt_answerer is self.gpt_answerer \
+                and self._config.resume is self.resume:
+            self._config.bind()
+        else:
+            _bind_answerer(self.gpt_answerer, self.resume)
+        
         self.apply_component.set_gpt_answerer(self.gpt_answerer)
-        self.state["gpt_answerer_set"] = True
+        self._gpt_wired = True
 
     def set_parameters(self, parameters):
         """
@@ -104,8 +292,9 @@ class LinkedInBotFacade:
         if not parameters:
             raise ValueError("Parameters cannot be None or empty.")
         self.parameters = parameters
-        self.apply_component.set_parameters(parameters)
-        self.state["parameters_set"] = True
+        if self.apply_component._params is not parameters:
+            self.apply_component.set_parameters(parameters)
+        self.state |= STATE_PARAMS
 
     def start_login(self):
         """
@@ -114,11 +303,24 @@ class LinkedInBotFacade:
         Raises:
             ValueError: If credentials are not set before attempting login
         """
-        if not self.state["credentials_set"]:
+        if not self.state & STATE_CREDENTIALS:
             raise ValueError("Email and password must be set before logging in.")
         self.login_component.set_secrets(self.email, self.password)
         self.login_component.start()
-        self.state["logged_in"] = True
+        self.state |= STATE_LOGGED_IN
+
+    def _ensure_ready(self):
+        """
+        Validate that every component required for applying is set, and wire
+        the GPT answerer.
+        
+        Raises:
+            ValueError: If required components are not set before starting application
+        """
+        missing = STATE_APPLY_READY & ~self.state
+        if missing:
+            raise ValueError(next(msg for bit, msg in _APPLY_REQUIRED_MSGS if missing & bit))
+        self._wire_gpt_answerer()
 
     def start_apply(self):
         """
@@ -130,15 +332,31 @@ class LinkedInBotFacade:
         Raises:
             ValueError: If required components are not set before starting application
         """
-        # Validate all required components are initialized
-        if not self.state["logged_in"]:
-            raise ValueError("You must be logged in before applying.")
-        if not self.state["resume_set"]:
-            raise ValueError("Plain text resume must be set before applying.")
-        if not self.state["gpt_answerer_set"]:
-            raise ValueError("GPT Answerer must be set before applying.")
-        if not self.state["parameters_set"]:
-            raise ValueError("Parameters must be set before applying.")
+        self._ensure_ready()
             
         # Start the job application process
-        self.apply_component.start_applying()
\ No newline at end of file
+        self.apply_component.start_applying()
+
+    def start_apply_batch(self, job_ids, batch_size=25):
+        """
+        Apply to specific job postings, handing them to the job manager in batches.
+        
+        Validation runs once for the whole list, not once per job.
+        
+        Args:
+            job_ids: LinkedIn job posting ids
+            batch_size: Number of ids forwarded per call to the job manager
+            
+        Returns:
+            Mapping of job id to its outcome ("success", "failed" or "skipped")
+            
+        Raises:
+            ValueError: If required components are not set before starting application
+        """
+        self._ensure_ready()
+        
+        job_ids = list(job_ids)
+        results = {}
+        for i in range(0, len(job_ids), batch_size):
+            results.update(self.apply_component.start_applying_batch(job_ids[i:i + batch_size]))
+        return results
@@ -26,19 +26,22 @@ import base64
 import io
 import os
 import random
+import re
 import tempfile
 import time
 import traceback
 import uuid
 import warnings
+from collections import defaultdict, deque
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 from langchain_core._api.deprecation import LangChainDeprecationWarning
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
@@ -51,6 +54,293 @@ import resume_generator
 
 warnings.filterwarnings("ignore", category=LangChainDeprecationWarning)    
 
+# Returns the text of the first descendant <label> of arguments[0] with visible
+# text, looking at most arguments[1] levels below it
+_DEEP_LABEL_JS = """
+const root = arguments[0], maxDepth = arguments[1];
+const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT, {
+    acceptNode(node) {
+        let depth = 0;
+        for (let p = node; p !== root && depth <= maxDepth; p = p.parentNode) depth++;
+        if (depth > maxDepth) return NodeFilter.FILTER_REJECT;
+        return node.tagName === 'LABEL' && node.innerText.trim()
+            ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
+    }
+});
+const label = walker.nextNode();
+return label ? label.innerText.trim() : '';
+"""
+
+
+# Label text of a terms-of-service / privacy-policy consent checkbox (EN, FR)
+_TOS_RE = re.compile(
+    r"terms of service|privacy policy|terms of use|politique de confidentialité"
+    r"|conditions d[’']utilisation|j[’']accepte|confidentialité",
+    re.IGNORECASE,
+)
+
+# Placeholder options of a <select> ("Select an option", "Choisissez…", …)
+_PLACEHOLDER_RE = re.compile(r"select|sélect|selecciona|choose|choisissez|opción", re.IGNORECASE)
+
+# Question keywords (multilingual) that _smart_dropdown_match answers from the resume
+_SMART_MATCH_KEYWORDS = {
+    "phone": ("phone country", "country code", "código del país", "código país", "code pays",
+              "ländervorwahl", "país", "country"),
+    "email": ("email", "correo", "e-mail", "courriel"),
+    "city": ("city", "location", "ciudad", "ville", "stadt", "ubicación"),
+    "country": ("país", "pays", "land"),
+}
+_SMART_MATCH_CATEGORIES: Dict[str, frozenset] = {
+    kw: frozenset(cat for cat, kws in _SMART_MATCH_KEYWORDS.items() if kw in kws)
+    for kws in _SMART_MATCH_KEYWORDS.values() for kw in kws
+}
+# Every keyword occurrence in one pass; a lookahead so overlapping keywords are all
+# found (at a given position only the longest one is reported, which shares its
+# categories with any keyword it extends)
+_SMART_MATCH_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_SMART_MATCH_CATEGORIES, key=len, reverse=True))) + "))"
+)
+
+# After clicking a primary footer button: "gone" once it is detached or
+# hidden, "next" when another step button is shown, "error" when a validation
+# message is visible, otherwise null (transition not complete yet)
+_STEP_TRANSITION_FN_JS = """
+function stepTransition(clicked) {
+    if (!clicked.isConnected || clicked.offsetParent === null) return 'gone';
+    const next = document.querySelectorAll(
+        'button[data-live-test-easy-apply-submit-button],' +
+        'button[data-live-test-easy-apply-review-button],' +
+        'button[data-live-test-easy-apply-next-button]');
+    for (const b of next) {
+        if (b !== clicked) return 'next';
+    }
+    for (const e of document.querySelectorAll('.artdeco-inline-feedback--error')) {
+        if (e.offsetParent !== null && e.innerText.trim()) return 'error';
+    }
+    return null;
+}
+"""
+
+# Polled fallback: one check per call
+_STEP_TRANSITION_JS = _STEP_TRANSITION_FN_JS + "return stepTransition(arguments[0]);"
+
+# Async script: resolves on the first DOM mutation that completes the
+# transition instead of being polled; null after arguments[1] ms
+_AWAIT_STEP_TRANSITION_JS = _STEP_TRANSITION_FN_JS + """
+const clicked = arguments[0];
+const done = arguments[arguments.length - 1];
+let observer = null;
+let timer = null;
+const finish = outcome => {
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(outcome);
+};
+const first = stepTransition(clicked);
+if (first) { finish(first); return; }
+observer = new MutationObserver(() => {
+    const outcome = stepTransition(clicked);
+    if (outcome) finish(outcome);
+});
+observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(() => finish(null), arguments[1]);
+"""
+
+# Kind of control a form element holds, most specific first; must stay in
+# step with the handler map in _process_form_element
+_CLASSIFY_ELEMENT_JS = """
+const el = arguments[0];
+if (el.querySelector("input[type='file']")) return 'upload';
+if (el.querySelector('[data-test-multiline-text-form-component]')) return 'multiline';
+if (el.querySelector("input[type='radio']")) return 'radio';
+if (el.querySelector('select')) return 'dropdown';
+if (el.querySelector('.artdeco-datepicker__input')) return 'date';
+if (el.querySelector("input[type='checkbox']")) return 'tos';
+if (el.querySelector('input, textarea')) return 'textbox';
+return 'unknown';
+"""
+
+# Text of every displayed, non-empty inline validation error
+_ACTIVE_ERRORS_JS = """
+return Array.from(document.getElementsByClassName('artdeco-inline-feedback--error'))
+    .filter(e => e.offsetParent !== null && e.innerText.trim())
+    .map(e => e.innerText.trim());
+"""
+
+# Unhides the file input of an upload block and reports whether it expects a
+# cover letter (by its id); null when the block has no file input
+_UPLOAD_SETUP_JS = """
+const input = arguments[0].querySelector("input[type='file']");
+if (!input) return null;
+input.classList.remove('hidden');
+const id = (input.id || '').toLowerCase();
+return {id: id, wantsCover: /cover|motivation/.test(id)};
+"""
+
+# Sends Escape to the focused input and blurs it when a typeahead dropdown is
+# open; returns whether one was
+_DISMISS_TYPEAHEAD_JS = """
+if (!document.querySelector('.basic-typeahead__triggered-content, .artdeco-typeahead__results-list')) {
+    return false;
+}
+const active = document.activeElement;
+if (active && active !== document.body) {
+    active.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', code: 'Escape', keyCode: 27, bubbles: true}));
+    active.blur();
+}
+return true;
+"""
+
+# Presses Escape on the page and drops focus, without locating an element first
+_PRESS_ESCAPE_JS = """
+document.body.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', code: 'Escape', keyCode: 27, bubbles: true}));
+if (document.activeElement) document.activeElement.blur();
+"""
+
+# Snapshot of a form element for the textbox and dropdown handlers; see
+# LinkedInEasyApplier._probe_section for the shape of the result
+_PROBE_SECTION_FN_JS = """
+function probeSection(root) {
+    const visible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+    const label = root.querySelector('label');
+    const labelled = Array.from(root.querySelectorAll('label')).find(l => l.innerText.trim());
+    let field = Array.from(root.querySelectorAll('input')).find(
+        e => visible(e) && !['hidden', 'file'].includes((e.type || '').toLowerCase()));
+    if (!field) field = Array.from(root.querySelectorAll('textarea')).find(visible);
+    const select = root.querySelector('select');
+    const selected = select && select.selectedIndex >= 0 ? select.options[select.selectedIndex] : null;
+    return {
+        label: label ? label.innerText.trim() : null,
+        labelText: labelled ? labelled.innerText.trim() : '',
+        multiline: !!root.querySelector('[data-test-multiline-text-form-component]'),
+        field: field ? {
+            el: field,
+            type: (field.type || '').toLowerCase(),
+            id: field.id || '',
+            value: field.value || '',
+            role: field.getAttribute('role') || '',
+            autocomplete: field.getAttribute('aria-autocomplete') || '',
+        } : null,
+        select: select ? {
+            el: select,
+            selected: selected ? selected.text : '',
+            enabled: !select.disabled,
+            options: Array.from(select.options).map(o => o.text),
+        } : null,
+    };
+}
+"""
+
+_PROBE_SECTION_JS = _PROBE_SECTION_FN_JS + "return probeSection(arguments[0]);"
+
+# Batched variant: probes for every element of arguments[0], in order
+_PROBE_SECTIONS_JS = _PROBE_SECTION_FN_JS + "return Array.from(arguments[0], probeSection);"
+
+# Dispatches the bubbling events named in arguments[1] on arguments[0], or on
+# its first descendant matching the optional selector arguments[2]
+_DISPATCH_EVENTS_JS = """
+const target = arguments[2] ? arguments[0].querySelector(arguments[2]) : arguments[0];
+if (target) {
+    for (const evt of arguments[1]) target.dispatchEvent(new Event(evt, {bubbles: true}));
+}
+"""
+
+# Selects option arguments[1] of the <select> arguments[0] by index and fires
+# change and blur, so LinkedIn validates the choice
+_SELECT_INDEX_JS = """
+const select = arguments[0];
+select.selectedIndex = arguments[1];
+select.dispatchEvent(new Event('change', {bubbles: true}));
+select.dispatchEvent(new Event('blur', {bubbles: true}));
+"""
+
+# Sets the value of an input/textarea through the native setter (so framework
+# bound inputs see it), fires input and change, blurs it, and returns the value
+_SET_VALUE_JS = """
+const el = arguments[0];
+const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+el.blur();
+return el.value;
+"""
+
+# Returns [element, kind] pairs for a form: every [data-test-form-element] as
+# "field", then the upload card around each bare file input as "upload".
+# File inputs inside a field are left to the field so they are handled once.
+_FORM_ELEMENTS_JS = """
+const form = arguments[0];
+const out = [];
+form.querySelectorAll('[data-test-form-element]').forEach(el => out.push([el, 'field']));
+const blocks = new Set();
+form.querySelectorAll("input[type='file']").forEach(input => {
+    if (input.closest('[data-test-form-element]')) return;
+    const block = input.closest('div.jobs-document-upload, div.js-jobs-document-upload__container');
+    if (block && !blocks.has(block)) {
+        blocks.add(block);
+        out.push([block, 'upload']);
+    }
+});
+return out;
+"""
+
+
+# Label "for" attribute or text of a form element, else the start of its markup
+_STABLE_KEY_JS = """
+const label = arguments[0].querySelector('label');
+if (label) {
+    const key = label.getAttribute('for') || label.textContent.trim();
+    if (key) return key;
+}
+return arguments[0].outerHTML.slice(0, 120);
+"""
+
+
+# Async script: scroll the first scrollable ancestor of arguments[0] by 600px
+# steps, giving virtualized lists 150ms to render, until scrollTop stops moving
+_AUTO_SCROLL_JS = """
+const done = arguments[arguments.length - 1];
+let scroller = arguments[0];
+while (scroller && scroller.scrollHeight <= scroller.clientHeight) {
+    scroller = scroller.parentElement;
+}
+if (!scroller) { done(false); return; }
+let last = -1;
+(function step() {
+    scroller.scrollBy(0, 600);
+    setTimeout(() => {
+        if (scroller.scrollTop === last) { done(true); return; }
+        last = scroller.scrollTop;
+        step();
+    }, 150);
+})();
+"""
+
+
+# Expands a truncated job description, then returns the text of the first
+# non-empty description container: #job-details (unified pane), the older
+# article layout, the "stretch" layout, then any details wrapper
+_JOB_DESCRIPTION_JS = """
+const more = document.querySelector(
+    'button.inline-show-more-text__button, button.jobs-description__footer-button');
+if (more) more.click();
+const selectors = [
+    '#job-details',
+    'article.jobs-description__container .jobs-box__html-content',
+    'div.jobs-description-content__text--stretch',
+    'div.jobs-search__job-details--container',
+    'div.jobs-description',
+];
+for (const selector of selectors) {
+    const el = document.querySelector(selector);
+    const text = el && el.innerText.trim();
+    if (text) return text;
+}
+return '';
+"""
+
+
 class LinkedInEasyApplier:
     """
     LinkedIn Easy Apply Form Handler
@@ -70,6 +360,25 @@ class LinkedInEasyApplier:
         answers: Dictionary mapping question substrings to saved answers
     """
     
+    # Primary footer CTA (Next / Review / Submit), most specific first
+    _PRIMARY_BTN_LOCATORS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        # 1️⃣ explicit hooks
+        (By.CSS_SELECTOR, 'button[data-live-test-easy-apply-next-button]'),
+        (By.CSS_SELECTOR, 'button[data-live-test-easy-apply-review-button]'),
+        (By.CSS_SELECTOR, 'button[data-live-test-easy-apply-submit-button]'),
+        (By.CSS_SELECTOR, 'button[data-easy-apply-next-button]'),
+        # 2️⃣ aria labels
+        (By.CSS_SELECTOR, 'button[aria-label*="Continue to next step"]'),
+        (By.CSS_SELECTOR, 'button[aria-label*="Review your application"]'),
+        (By.CSS_SELECTOR, 'button[aria-label*="Submit application"]'),
+        # 3️⃣ last-resort primary CTA
+        (By.CSS_SELECTOR, 'button.artdeco-button--primary'),
+    )
+    _EASY_APPLY_BUTTON_XPATH: ClassVar[str] = (
+        '//button[contains(@class, "jobs-apply-button") and contains(., "Easy Apply")]'
+    )
+    _FIRST_EASY_APPLY_BUTTON_XPATH: ClassVar[str] = f"({_EASY_APPLY_BUTTON_XPATH})[1]"
+    
     def __init__(
         self,
         driver: Any,
@@ -77,6 +386,7 @@ class LinkedInEasyApplier:
         set_old_answers: List[Tuple[str, str, str]],
         gpt_answerer: Any,
         record_answer_cb: Optional[callable] = None,
+        record_answers_bulk_cb: Optional[callable] = None,
     ):
         """
         Initialize the LinkedIn Easy Apply form handler.
@@ -86,13 +396,33 @@ class LinkedInEasyApplier:
             resume_dir: Path to resume file for upload
             set_old_answers: List of tuples (question_type, question_text, answer)
             gpt_answerer: AI service for generating form responses
-            record_answer_cb: Optional callback to persist new answers
+            record_answer_cb: Optional callback to persist one new answer
+            record_answers_bulk_cb: Optional callback to persist a list of new
+                answers at once; preferred over record_answer_cb when given
         """
         self.driver = driver
-        self.resume_dir = Path(resume_dir) if resume_dir else None
-        self.set_old_answers = list(set_old_answers)
+        self.resume_dir = resume_dir
         self.gpt_answerer = gpt_answerer
         self._record_cb = record_answer_cb
+        self._record_bulk_cb = record_answers_bulk_cb
+        # New answers of the current application, persisted by _flush_answers
+        self._pending_answers: List[Tuple[str, str, str]] = []
+        # window.__la helpers (see utils.PAGE_HELPERS_JS) available in every page
+        self._page_helpers = utils.install_page_helpers(driver)
+        # Cover letter PDF generated for the current application
+        self._cover_letter_path: Optional[str] = None
+        # Easy Apply modal scroll container, cached for the current application
+        self._modal: Optional[WebElement] = None
+        # Label text per form element id, for the current application
+        self._label_cache: Dict[str, str] = {}
+        # Section probes read ahead for a batch of sections, by element id;
+        # each is used once, by the first handler that probes its section
+        self._prefetched_probes: Dict[str, Dict[str, Any]] = {}
+        # Today's date as typed into date pickers, refreshed when the day changes
+        self._today: Optional[date] = None
+        self._today_str = ""
+        # Resume contact fields used by _smart_dropdown_match, read on first use
+        self._pi_cache: Optional[SimpleNamespace] = None
 
         # Normalize saved answers for quick lookup
         self.set_old_answers: List[Tuple[str, str, str]] = []
@@ -105,12 +435,66 @@ class LinkedInEasyApplier:
             else:
                 continue
 
-        # Build quick lookup dictionary for saved answers
+        # Build quick lookup dictionary for saved answers; values keep their
+        # original case and are compared case-insensitively where used
         self.answers: Dict[str, str] = {
-            q_sub.lower().strip(): ans.title()
+            q_sub.lower().strip(): ans
             for _, q_sub, ans in self.set_old_answers
         }
         logger.debug(f"Loaded saved answers: {self.answers}")
+        # Matcher over the keys of self.answers, built on first use
+        self._answers_re: Optional[re.Pattern] = None
+
+        # Saved answers indexed by question type: exact (type, question) hits and
+        # per-type (question, answer) lists for substring matches, in load order
+        self._answers_by_type: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        self._answers_exact: Dict[Tuple[str, str], str] = {}
+        # Substring-match results per (type, question), dropped whenever an answer is added
+        self._answer_lookups: Dict[Tuple[str, str], Optional[str]] = {}
+        for q_type, q_sub, ans in self.set_old_answers:
+            self._index_answer(q_type, q_sub, ans)
+
+    @property
+    def resume_dir(self) -> Optional[Path]:
+        """Resume file uploaded to applications (swapped for a tailored one per job)."""
+        return self._resume_dir
+
+    @resume_dir.setter
+    def resume_dir(self, value) -> None:
+        self._resume_dir = Path(value) if value else None
+        # Resolved once per assignment rather than on every upload attempt
+        self._resume_path_str = str(self._resume_dir.resolve()) if self._resume_dir else None
+
+    def _saved_answers_in(self, text: str) -> Iterator[str]:
+        """
+        Yield the saved answers whose question substring occurs in ``text``.
+        
+        All keys of ``self.answers`` are matched in a single pass of one
+        compiled alternation (longest key first at each position) rather
+        than one substring search per saved answer.
+        
+        Args:
+            text: Lowercased question text
+            
+        Yields:
+            Saved answers, in order of where their key occurs in ``text``
+        """
+        if self._answers_re is None:
+            keys = sorted((k for k in self.answers if k), key=len, reverse=True)
+            self._answers_re = re.compile(
+                "(?=(" + "|".join(map(re.escape, keys)) + "))" if keys else r"(?!)"
+            )
+        if "" in self.answers:
+            yield self.answers[""]
+        for match in self._answers_re.finditer(text):
+            yield self.answers[match.group(1)]
+
+    def _index_answer(self, qtype: str, qtext: str, answer: str) -> None:
+        """Add a saved answer to the lookup indices used by _get_answer_from_set."""
+        qtype, qtext = qtype.lower(), qtext.lower()
+        self._answers_by_type[qtype].append((qtext, answer))
+        self._answers_exact.setdefault((qtype, qtext), answer)
+        self._answer_lookups.clear()
 
     def _remember_answer(self, qtype: str, qtext: str, answer: str) -> None:
         """
@@ -136,19 +520,33 @@ class LinkedInEasyApplier:
                 logger.warning(f"[REMEMBER] Refusing to save placeholder answer: {answer!r} for question: {qtext!r}")
                 return
         
-        key = (qtype.lower(), qtext.lower())
-        if any((t.lower(), q.lower()) == key for t, q, _ in self.set_old_answers):
+        if (qtype.lower(), qtext.lower()) in self._answers_exact:
             return
         
         logger.debug(f"[REMEMBER] Saving answer: {qtype} | {qtext} → {answer}")
         self.set_old_answers.append((qtype, qtext, answer))
         self.answers[qtext.lower()] = answer
-        
-        if self._record_cb:
-            try:
-                self._record_cb(qtype, qtext, answer)
-            except Exception as exc:
-                logger.warning(f"Could not persist answer: {exc}")
+        self._answers_re = None
+        self._index_answer(qtype, qtext, answer)
+        # Written to disk once the application finishes, see _flush_answers
+        self._pending_answers.append((qtype, qtext, answer))
+
+    def _flush_answers(self) -> None:
+        """Persist the answers remembered during the current application in one go."""
+        if not self._pending_answers:
+            return
+        pending, self._pending_answers = self._pending_answers, []
+        if not (self._record_bulk_cb or self._record_cb):
+            return
+
+        try:
+            if self._record_bulk_cb:
+                self._record_bulk_cb(pending)
+            else:
+                for qtype, qtext, answer in pending:
+                    self._record_cb(qtype, qtext, answer)
+        except Exception as exc:
+            logger.warning(f"Could not persist answers: {exc}")
 
     def _ask_openai_for_yes_no(self, prompt: str) -> str:
         """
@@ -177,32 +575,36 @@ class LinkedInEasyApplier:
         Returns:
             Saved answer if found and valid, None otherwise
         """
-        for entry in self.set_old_answers:
-            if isinstance(entry, tuple) and len(entry) == 3:
-                if entry[0] == question_type and question_text in entry[1].lower():
-                    answer = entry[2]
-                    return answer if options is None or answer in options else None
-        return None
+        question_type = question_type.lower()
+        question_text = question_text.lower()
+        
+        key = (question_type, question_text)
+        answer = self._answers_exact.get(key)
+        if answer is None:
+            # The prefetch pass and the field handlers look up the same questions
+            if key in self._answer_lookups:
+                answer = self._answer_lookups[key]
+            else:
+                answer = next(
+                    (ans for saved, ans in self._answers_by_type.get(question_type, ()) if question_text in saved),
+                    None
+                )
+                self._answer_lookups[key] = answer
+        if answer is None:
+            return None
+        return answer if options is None or answer in options else None
 
-    def _smart_dropdown_match(self, question_text: str, options: List[str]) -> Optional[str]:
+    def _pi(self) -> Optional[SimpleNamespace]:
         """
-        Intelligently match dropdown options using resume data and pattern recognition.
+        Contact fields of the resume used by `_smart_dropdown_match`, read once.
         
-        Handles common dropdown fields like phone country codes, emails, and other
-        contact information by matching against resume data, even when field names
-        are in different languages.
-        
-        Args:
-            question_text: The question text (may be in any language)
-            options: List of available dropdown options
-            
         Returns:
-            Best matching option from the dropdown, or None if no match found
+            Namespace with phone, phonePrefix, email, city and country, plus
+            lowercased email_lower, city_lower and country_lower; None if the
+            resume is not available (not cached, so a later resume is picked up)
         """
-        # Normalize question text
-        q_lower = question_text.lower()
-        logger.debug(f"[SMART MATCH] Analyzing question: {question_text!r}")
-        logger.debug(f"[SMART MATCH] Available options: {options}")
+        if self._pi_cache is not None:
+            return self._pi_cache
         
         # Get resume data from GPT answerer
         try:
@@ -217,18 +619,59 @@ class LinkedInEasyApplier:
                 return None
                 
             personal_info = resume.personal_information
-            logger.debug(f"[SMART MATCH] Resume info: phone={personal_info.phone}, phonePrefix={personal_info.phonePrefix}, email={personal_info.email}, city={personal_info.city}")
-            
+            pi = SimpleNamespace(
+                phone=personal_info.phone,
+                phonePrefix=personal_info.phonePrefix,
+                email=personal_info.email,
+                city=personal_info.city,
+                country=personal_info.country,
+            )
         except Exception as e:
             logger.error(f"[SMART MATCH] Error accessing resume: {e}")
             return None
         
+        pi.email_lower = (pi.email or "").lower()
+        pi.city_lower = (pi.city or "").lower()
+        pi.country_lower = (pi.country or "").lower()
+        logger.debug(f"[SMART MATCH] Resume info: phone={pi.phone}, phonePrefix={pi.phonePrefix}, email={pi.email}, city={pi.city}")
+        self._pi_cache = pi
+        return pi
+
+    def _smart_dropdown_match(self, question_text: str, options: List[str]) -> Optional[str]:
+        """
+        Intelligently match dropdown options using resume data and pattern recognition.
+        
+        Handles common dropdown fields like phone country codes, emails, and other
+        contact information by matching against resume data, even when field names
+        are in different languages.
+        
+        Args:
+            question_text: The question text (may be in any language)
+            options: List of available dropdown options
+            
+        Returns:
+            Best matching option from the dropdown, or None if no match found
+        """
+        # Normalize question text
+        q_lower = question_text.lower()
+        logger.debug(f"[SMART MATCH] Analyzing question: {question_text!r}")
+        logger.debug(f"[SMART MATCH] Available options: {options}")
+        
+        pi = self._pi()
+        if pi is None:
+            return None
+        
+        # Classify the question against every category's keywords in one scan
+        categories = set()
+        for match in _SMART_MATCH_RE.finditer(q_lower):
+            categories |= _SMART_MATCH_CATEGORIES[match.group(1)]
+        options_lower = [option.lower() for option in options]
+        
         # Phone country code detection (multilingual)
-        phone_keywords = ["phone country", "country code", "código del país", "código país", "code pays", "ländervorwahl", "país", "country"]
-        if any(kw in q_lower for kw in phone_keywords):
+        if "phone" in categories:
             logger.debug("[SMART MATCH] Detected phone country code question")
             # Use phonePrefix directly (e.g., "+33")
-            country_code = personal_info.phonePrefix
+            country_code = pi.phonePrefix
             if country_code:
                 logger.debug(f"[SMART MATCH] Using phone prefix from resume: {country_code}")
                 
@@ -243,16 +686,15 @@ class LinkedInEasyApplier:
                 logger.warning(f"[SMART MATCH] No phonePrefix in resume")
         
         # Email selection (when multiple emails available)
-        email_keywords = ["email", "correo", "e-mail", "courriel"]
-        if any(kw in q_lower for kw in email_keywords):
+        if "email" in categories:
             logger.debug("[SMART MATCH] Detected email question")
-            resume_email = personal_info.email
+            resume_email = pi.email
             if resume_email:
                 logger.debug(f"[SMART MATCH] Looking for email: {resume_email}")
                 
                 # Try exact match first
-                for option in options:
-                    if resume_email.lower() in option.lower():
+                for option, option_lower in zip(options, options_lower):
+                    if pi.email_lower in option_lower:
                         logger.info(f"[SMART MATCH] ✅ Matched email option: {option}")
                         return option
                 
@@ -261,15 +703,14 @@ class LinkedInEasyApplier:
                 logger.warning("[SMART MATCH] No email in resume")
         
         # Location/City detection
-        location_keywords = ["city", "location", "ciudad", "ville", "stadt", "ubicación"]
-        if any(kw in q_lower for kw in location_keywords):
+        if "city" in categories:
             logger.debug("[SMART MATCH] Detected location question")
-            city = personal_info.city
+            city = pi.city
             if city:
                 logger.debug(f"[SMART MATCH] Looking for city: {city}")
                 
-                for option in options:
-                    if city.lower() in option.lower():
+                for option, option_lower in zip(options, options_lower):
+                    if pi.city_lower in option_lower:
                         logger.info(f"[SMART MATCH] ✅ Matched location option: {option}")
                         return option
                 
@@ -278,16 +719,15 @@ class LinkedInEasyApplier:
                 logger.warning("[SMART MATCH] No city in resume")
         
         # Country detection
-        country_keywords_specific = ["país", "pays", "land"] 
-        if any(kw in q_lower for kw in country_keywords_specific) and "code" not in q_lower and "código" not in q_lower:
+        if "country" in categories and "code" not in q_lower and "código" not in q_lower:
             logger.debug("[SMART MATCH] Detected country question")
-            country = personal_info.country
+            country = pi.country
             if country:
                 logger.debug(f"[SMART MATCH] Looking for country: {country}")
                 
                 # Try direct match first
-                for option in options:
-                    if country.lower() in option.lower():
+                for option, option_lower in zip(options, options_lower):
+                    if pi.country_lower in option_lower:
                         logger.info(f"[SMART MATCH] ✅ Matched country option: {option}")
                         return option
                 
@@ -298,26 +738,94 @@ class LinkedInEasyApplier:
         logger.debug("[SMART MATCH] No match found")
         return None
 
-    def _safe_click(self, el: WebElement):
+    def _wait_until(self, condition, timeout: float = 2.0, poll: float = 0.05) -> bool:
+        """
+        Wait for a post-condition of a form interaction instead of sleeping.
+        
+        Args:
+            condition: Callable taking the driver, truthy once the DOM has settled
+            timeout: Maximum seconds to wait
+            poll: Seconds between checks
+            
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll).until(condition)
+            return True
+        except TimeoutException:
+            logger.debug("[WAIT] Post-condition not met in time, continuing")
+            return False
+
+    def _wait_or_find(self, by: str, selector: str, timeout: float = 10) -> WebElement:
+        """
+        Return the first matching element, waiting for it only if it is not there yet.
+        
+        Args:
+            by: Selenium locator strategy
+            selector: Locator value
+            timeout: Seconds to wait when the element is not present yet
+            
+        Returns:
+            The first matching WebElement
+            
+        Raises:
+            TimeoutException: If no element appears within ``timeout``
+        """
+        found = self.driver.find_elements(by, selector)
+        if found:
+            return found[0]
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_element_located((by, selector))
+        )
+
+    def _scroll_center(self, el: WebElement) -> None:
+        """Scroll an element to the center of the viewport without animation."""
+        if self._page_helpers:
+            self.driver.execute_script("window.__la.scrollCenter(arguments[0]);", el)
+        else:
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});", el
+            )
+
+    def _safe_click(self, el: WebElement, wait_after=None):
         """
         Safely click an element by defocusing, scrolling into view, and using JS click.
         
+        Waits on page conditions instead of fixed sleeps between the steps.
+        
         Args:
             el: WebElement to click
+            wait_after: Optional expected condition that signals the click took
+                effect (e.g. a modal becoming visible); waited for up to 5s.
+                Without it, waits for the document to finish loading.
         """
-        # Defocus any open search input
-        self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-        time.sleep(0.2)
+        # Dismiss an open typeahead dropdown, and wait for it to close only if there was one
+        if self.driver.execute_script(_DISMISS_TYPEAHEAD_JS):
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.05).until(
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, "div.basic-typeahead__triggered-content"))
+                )
+            except TimeoutException:
+                pass
 
-        # Scroll element into view
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({block: 'center', inline: 'center'});", el
-        )
-        time.sleep(0.2)
+        # Scroll element into view without smooth scrolling, then wait until it can take the click
+        self._scroll_center(el)
+        try:
+            WebDriverWait(self.driver, 1, poll_frequency=0.05).until(EC.element_to_be_clickable(el))
+        except TimeoutException:
+            pass
 
         # Use JS click to avoid interception
-        self.driver.execute_script("arguments[0].click();", el)
-        time.sleep(0.5)
+        self.driver.execute_script(
+            "window.__la.jsClick(arguments[0]);" if self._page_helpers else "arguments[0].click();", el
+        )
+        try:
+            WebDriverWait(self.driver, 5 if wait_after else 1, poll_frequency=0.05).until(
+                wait_after or (lambda d: d.execute_script("return document.readyState") == "complete")
+            )
+        except TimeoutException:
+            logger.debug("[CLICK] Post-click condition not met in time, continuing")
 
     def job_apply(self, job: Any):
         """
@@ -333,7 +841,9 @@ class LinkedInEasyApplier:
         Raises:
             Exception: If application process fails at any step
         """
-        self.driver.get(job.link)
+        # Batched applications have already opened the posting to read its header
+        if self.driver.current_url.split("?")[0].rstrip("/") != job.link.split("?")[0].rstrip("/"):
+            self.driver.get(job.link)
         
         # Store original resume path to restore later
         original_resume_dir = self.resume_dir
@@ -353,7 +863,9 @@ class LinkedInEasyApplier:
             else:
                 logger.warning("Failed to generate tailored resume, using original")
             
-            self._safe_click(easy_apply_button)
+            self._safe_click(easy_apply_button, wait_after=EC.visibility_of_element_located(
+                (By.CSS_SELECTOR, "div.jobs-easy-apply-modal")
+            ))
             self.gpt_answerer.set_job(job)
             self._fill_application_form()
             
@@ -364,22 +876,43 @@ class LinkedInEasyApplier:
         finally:
             # Restore original resume path for next job
             self.resume_dir = original_resume_dir
+            self._modal = None
+            self._cover_letter_path = None
+            self._label_cache.clear()
+            self._flush_answers()
+
+    def _get_modal(self) -> WebElement:
+        """
+        Return the Easy Apply modal's scroll container, located once per application.
+        
+        The node survives step changes; callers that hit a stale reference
+        reset ``self._modal`` and call again.
+        
+        Returns:
+            WebElement of div.jobs-easy-apply-modal__content
+        """
+        if self._modal is None:
+            self._modal = self.driver.find_element(By.CSS_SELECTOR, "div.jobs-easy-apply-modal__content")
+        return self._modal
 
-    def _stable_key(self, form_el: WebElement) -> str:
+    def _stable_key(self, form_el: WebElement, key_cache: Optional[Dict[str, str]] = None) -> str:
         """
         Generate a stable identifier for a form element that survives DOM recycling.
         
         Args:
             form_el: WebElement to generate key for
+            key_cache: Optional memo of keys by WebDriver element id
             
         Returns:
             Unique string identifier for the element
         """
-        try:
-            label = form_el.find_element(By.TAG_NAME, "label")
-            return label.get_attribute("for") or label.text.strip()
-        except NoSuchElementException:
-            return form_el.get_attribute("outerHTML")[:120]
+        if key_cache is not None and form_el.id in key_cache:
+            return key_cache[form_el.id]
+        # Computed in the page so the outerHTML fallback never crosses the wire in full
+        key = self.driver.execute_script(_STABLE_KEY_JS, form_el)
+        if key_cache is not None:
+            key_cache[form_el.id] = key
+        return key
 
     def _find_easy_apply_button(self) -> WebElement:
         """
@@ -391,22 +924,21 @@ class LinkedInEasyApplier:
         Raises:
             Exception: If no clickable Easy Apply button is found
         """
-        buttons = WebDriverWait(self.driver, 5).until(
-            EC.presence_of_all_elements_located(
-                (By.XPATH, '//button[contains(@class, "jobs-apply-button") and contains(., "Easy Apply")]')
+        try:
+            return WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
+                EC.element_to_be_clickable((By.XPATH, self._FIRST_EASY_APPLY_BUTTON_XPATH))
             )
-        )
-        
-        for index, button in enumerate(buttons):
+        except TimeoutException:
+            pass
+
+        # The first match can be a hidden duplicate; take any other usable one without waiting again
+        for button in self.driver.find_elements(By.XPATH, self._EASY_APPLY_BUTTON_XPATH):
             try:
-                return WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH, f'(//button[contains(@class, "jobs-apply-button") and contains(., "Easy Apply")])[{index + 1}]')
-                    )
-                )
-            except Exception:
-                pass
-                
+                if button.is_displayed() and button.is_enabled():
+                    return button
+            except StaleElementReferenceException:
+                continue
+
         raise Exception("No clickable 'Easy Apply' button found")
 
     def _get_job_description(self) -> str:
@@ -416,63 +948,24 @@ class LinkedInEasyApplier:
         """
         # 1) Wait for any job-details container to appear
         try:
-            WebDriverWait(self.driver, 20).until(
+            WebDriverWait(self.driver, 20, poll_frequency=0.1).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "div.jobs-description, #job-details, article.jobs-description__container"))
             )
         except TimeoutException:
             logger.error("Timed out waiting for description container")
 
-        # 2) Expand any "show more" button if present
-        try:
-            more_btn = self.driver.find_element(
-                By.CSS_SELECTOR,
-                "button.inline-show-more-text__button, button.jobs-description__footer-button"
-            )
-            more_btn.click()
-            time.sleep(0.5)
-        except NoSuchElementException:
-            pass
-
-        # 3) Try direct #job-details (new unified pane)
+        # 2) Expand "show more" and take the first non-empty description,
+        # newest layout first, in a single round trip
         try:
-            details_div = self.driver.find_element(By.ID, "job-details")
-            return details_div.text.strip()
-        except NoSuchElementException:
-            pass
-
-        # 4) Try article-based selector (older unified layout)
-        try:
-            container = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((
-                    By.CSS_SELECTOR,
-                    "article.jobs-description__container .jobs-box__html-content"
-                ))
-            )
-            return container.text.strip()
-        except TimeoutException:
-            logger.error("Article-based selector timed out")
-
-        # 5) Fallback to the “stretch” class
-        try:
-            stretch_div = self.driver.find_element(
-                By.CSS_SELECTOR,
-                "div.jobs-description-content__text--stretch"
-            )
-            return stretch_div.text.strip()
-        except NoSuchElementException:
-            pass
-
-        # 6) Last resort: grab any visible text in the details container
-        try:
-            wrapper = self.driver.find_element(
-                By.CSS_SELECTOR,
-                "div.jobs-search__job-details--container, div.jobs-description"
-            )
-            return wrapper.text.strip()
-        except Exception:
-            logger.error(f"Could not locate job description:\n{traceback.format_exc()}")
+            description = self.driver.execute_script(_JOB_DESCRIPTION_JS)
+        except WebDriverException:
+            logger.error(f"Could not read job description:\n{traceback.format_exc()}")
             return ""
 
+        if not description:
+            logger.error("Could not locate job description")
+        return description or ""
+
 
     def _auto_scroll_within_modal(self, root: WebElement):
         """
@@ -481,22 +974,9 @@ class LinkedInEasyApplier:
         Args:
             root: Root element to find scrollable container within
         """
-        # Find the first ancestor that scrolls
-        scroller = root
-        while scroller and self.driver.execute_script(
-            "return arguments[0].scrollHeight <= arguments[0].clientHeight",
-            scroller
-        ):
-            scroller = scroller.find_element(By.XPATH, "..")
-
-        last = -1
-        while True:
-            self.driver.execute_script("arguments[0].scrollBy(0, 600);", scroller)
-            time.sleep(0.4)  # Allow virtualized list to render
-            now = self.driver.execute_script("return arguments[0].scrollTop;", scroller)
-            if now == last:  # Bottom reached
-                break
-            last = now
+        # Climb to the scrollable ancestor and scroll to the bottom in the
+        # browser, so the whole loop costs one round trip
+        self.driver.execute_async_script(_AUTO_SCROLL_JS, root)
 
     def _scroll_page(self) -> None:
         """Scroll the entire page up and down to trigger content loading."""
@@ -518,9 +998,7 @@ class LinkedInEasyApplier:
 
             # --- 1️⃣  locate the *fresh* form for THIS step
             try:
-                form = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "form"))
-                )
+                form = self._wait_or_find(By.TAG_NAME, "form")
 
                 html = form.get_attribute("outerHTML")
                 logger.debug("Step HTML content:")
@@ -534,11 +1012,11 @@ class LinkedInEasyApplier:
                 
                 try:
                     # Wait for the modal to appear and be visible
-                    modal = WebDriverWait(self.driver, 10).until(
+                    modal = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                         EC.visibility_of_element_located((By.CSS_SELECTOR, "div.artdeco-modal--layer-default"))
                     )
                     # Scroll within the modal to reveal content
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", modal)
+                    self._scroll_center(modal)
                     time.sleep(0.5)
                 except TimeoutException:
                     logger.error("Modal did not appear within timeout or is not visible")
@@ -557,7 +1035,7 @@ class LinkedInEasyApplier:
                 # --- 4️⃣ Wait for the Post-submit modal (Done / Not Now button)
                 try:
                     # Wait for the post-submit modal to appear
-                    pop_up_modal = WebDriverWait(self.driver, 10).until(
+                    pop_up_modal = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                         EC.visibility_of_element_located((By.CSS_SELECTOR, "div.artdeco-modal.artdeco-modal--layer-default"))
                     )
                     logger.info("Pop-up modal appeared after submit")
@@ -578,7 +1056,7 @@ class LinkedInEasyApplier:
                     
                     for selector_type, selector in selectors:
                         try:
-                            done_button = WebDriverWait(pop_up_modal, 3).until(
+                            done_button = WebDriverWait(pop_up_modal, 3, poll_frequency=0.1).until(
                                 EC.element_to_be_clickable((selector_type, selector))
                             )
                             logger.debug(f"Found post-submit button using selector: {selector}")
@@ -590,7 +1068,7 @@ class LinkedInEasyApplier:
                         raise TimeoutException("Could not find post-submit modal button")
 
                     # Scroll the button into view to ensure visibility and interaction
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", done_button)
+                    self._scroll_center(done_button)
                     time.sleep(0.5)
                     
                     # Get button text for logging
@@ -602,7 +1080,7 @@ class LinkedInEasyApplier:
 
                     # Allow time for the modal to close and wait for it to disappear
                     try:
-                        WebDriverWait(self.driver, 5).until(
+                        WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
                             EC.invisibility_of_element(pop_up_modal)
                         )
                         logger.info("Post-submit modal closed successfully")
@@ -627,53 +1105,55 @@ class LinkedInEasyApplier:
         (which LI no longer wraps in data-test-form-element) is handled.
         """
         processed: set[str] = set()
+        key_cache: Dict[str, str] = {}
         pass_idx            = 0
 
-        while True:
-            pass_idx += 1
-            newly_handled = 0
-            elems = form_el.find_elements(By.CSS_SELECTOR, "[data-test-form-element]")
-
-            for el in elems:
-                key = self._stable_key(el)
-                if key in processed:
-                    continue
-                if self._process_form_element(el):
-                    processed.add(key)
-                    newly_handled += 1
-
-            # ── NEW: pick up bare <input type="file"> blocks ───────────────
-            for fi in form_el.find_elements(By.CSS_SELECTOR, "input[type='file']"):
-                # ancestor that visually groups the upload card / button
-                block = fi.find_element(
-                    By.XPATH,
-                    "./ancestor::div[contains(@class,'jobs-document-upload') or "  # redesign
-                    "contains(@class,'js-jobs-document-upload__container')][1]"
-                )
-                key = self._stable_key(block)
-                if key in processed:
-                    continue
-                if self._handle_upload_fields(block):
-                    processed.add(key)
-                    newly_handled += 1
-            # ----------------------------------------------------------------
-
-            logger.debug(f"Form processing pass {pass_idx}: handled {newly_handled} of "
-                f"{len(elems)} + uploads (total so far {len(processed)})")
-
-            if newly_handled == 0:
-                break
+        try:
+            while True:
+                pass_idx += 1
+                newly_handled = 0
+                # One round trip for the form fields and the upload blocks around
+                # bare <input type="file"> (which LI no longer wraps in data-test-form-element)
+                found = self.driver.execute_script(_FORM_ELEMENTS_JS, form_el)
+                elems = [el for el, kind in found if kind == "field"]
+                if pass_idx == 1:
+                    self._prefetch_gpt_answers(elems)
+
+                for el, kind in found:
+                    key = self._stable_key(el, key_cache)
+                    if key in processed:
+                        continue
+                    handled = (self._process_form_element(el) if kind == "field"
+                               else self._handle_upload_fields(el))
+                    if handled:
+                        processed.add(key)
+                        newly_handled += 1
+                # Probes describe the page as it was before this pass answered anything
+                self._prefetched_probes.clear()
+
+                logger.debug(f"Form processing pass {pass_idx}: handled {newly_handled} of "
+                    f"{len(elems)} + uploads (total so far {len(processed)})")
+
+                if newly_handled == 0:
+                    break
 
-            self.driver.execute_script("arguments[0].scrollBy(0, 600);", form_el)
-            time.sleep(0.4)
+                self.driver.execute_script("arguments[0].scrollBy(0, 600);", form_el)
+                time.sleep(0.4)
+        finally:
+            # Answers a handler never asked for (skipped field, changed page)
+            # must not leak into a later form or job
+            self._prefetched_probes.clear()
+            self.gpt_answerer.discard_prefetched()
 
         self._check_for_errors()
 
         # ensure LI re-validates the footer CTA
-        modal = self.driver.find_element(By.CSS_SELECTOR,
-                                        "div.jobs-easy-apply-modal__content")
-        self.driver.execute_script(
-            "arguments[0].scrollTo(0, arguments[0].scrollHeight);", modal)
+        scroll_to_bottom = "arguments[0].scrollTo(0, arguments[0].scrollHeight);"
+        try:
+            self.driver.execute_script(scroll_to_bottom, self._get_modal())
+        except StaleElementReferenceException:
+            self._modal = None
+            self.driver.execute_script(scroll_to_bottom, self._get_modal())
         time.sleep(0.6)
 
         try:
@@ -683,6 +1163,73 @@ class LinkedInEasyApplier:
         time.sleep(0.2)
 
 
+    def _prefetch_gpt_answers(self, elems: List[WebElement]) -> None:
+        """
+        Collect the unanswered questions of a form and have GPT answer them
+        in one batched request per question type (textual, numeric, options).
+
+        All elements are probed in one round trip; the handlers reuse those
+        probes and then pick the answers up through the usual
+        ``answer_question_*`` calls. Questions the handlers would skip or
+        answer from saved answers or smart dropdown matching are left out.
+        """
+        # Batching only pays off for a type with at least two questions
+        if len(elems) < 2:
+            return
+        try:
+            probes = self.driver.execute_script(_PROBE_SECTIONS_JS, elems)
+        except WebDriverException as exc:
+            logger.debug(f"[PREFETCH] Section probe failed, answering per question: {exc}")
+            return
+        self._prefetched_probes.update((el.id, probe) for el, probe in zip(elems, probes))
+
+        textual: list[str] = []
+        numeric: list[str] = []
+        options: list[tuple[str, list[str]]] = []
+
+        for el, probe in zip(elems, probes):
+            label, field, select = probe["labelText"], probe["field"], probe["select"]
+            if label:
+                # Same lookup as _deep_label_text, which the textbox handler calls
+                self._label_cache.setdefault(el.id, label)
+
+            if probe["multiline"]:
+                question = (probe["label"] or "").strip()
+                if question and "cover letter" not in question.lower() \
+                        and field is not None and not field["value"].strip():
+                    textual.append(question)
+                continue
+
+            if select is not None:
+                if probe["label"] is None or not select["enabled"]:
+                    continue
+                selected = select["selected"].strip().lower()
+                if selected and not _PLACEHOLDER_RE.search(selected):
+                    continue
+                question = probe["label"].lower()
+                choices = select["options"]
+                if not (self._get_answer_from_set("dropdown", question, choices)
+                        or self._smart_dropdown_match(question, choices)):
+                    options.append((question, choices))
+                continue
+
+            if field is None or field["type"] not in ("text", "number", "tel", "email", "url") \
+                    or field["value"].strip() or field["role"] == "combobox":
+                continue
+            question = label.lower()
+            is_numeric = "-numeric" in field["id"]
+            if question and not self._get_answer_from_set("numeric" if is_numeric else "text", question):
+                (numeric if is_numeric else textual).append(question)
+
+        if max(len(textual), len(numeric), len(options)) < 2:
+            return
+        logger.debug(f"[PREFETCH] Batching {len(textual)} textual, {len(numeric)} numeric, "
+                     f"{len(options)} option questions")
+        try:
+            self.gpt_answerer.prefetch_answers(textual=textual, numeric=numeric, options=options)
+        except Exception as exc:
+            logger.debug(f"[PREFETCH] Batched answering failed, falling back to per-question calls: {exc}")
+
     def _deep_label_text(self, root: WebElement, max_depth: int = 12) -> str:
         """
         Find the first non-empty label text within a form element using breadth-first search.
@@ -698,10 +1245,28 @@ class LinkedInEasyApplier:
         Returns:
             Label text if found, empty string otherwise
         """
-        queue: list[tuple[WebElement, int]] = [(root, 0)]
+        # The prefetch pass and the field handlers ask for the same labels
+        cached = self._label_cache.get(root.id)
+        if cached is not None:
+            return cached
+        label = self._find_label_text(root, max_depth)
+        if label:
+            # Empty results are not kept: the label may not have rendered yet
+            self._label_cache[root.id] = label
+        return label
+
+    def _find_label_text(self, root: WebElement, max_depth: int) -> str:
+        """Look up the label text of ``root`` in the page (see `_deep_label_text`)."""
+        # One round trip: first descendant <label> with visible text, at most max_depth levels down
+        try:
+            return self.driver.execute_script(_DEEP_LABEL_JS, root, max_depth) or ""
+        except WebDriverException as exc:
+            logger.debug(f"Label lookup script failed, walking the DOM instead: {exc}")
+
+        queue: deque[tuple[WebElement, int]] = deque([(root, 0)])
 
         while queue:
-            node, depth = queue.pop(0)
+            node, depth = queue.popleft()
             if depth > max_depth:
                 break
 
@@ -722,8 +1287,8 @@ class LinkedInEasyApplier:
         Detect and handle form controls within a LinkedIn form element.
         
         This is the main dispatcher that identifies what type of form element
-        we're dealing with and delegates to the appropriate handler. It can
-        handle multiple control types within a single element.
+        we're dealing with and delegates to the appropriate handler. Elements
+        that cannot be classified are offered to every handler.
         
         Args:
             element: WebElement containing form controls
@@ -731,21 +1296,30 @@ class LinkedInEasyApplier:
         Returns:
             True if any controls were successfully handled, False otherwise
         """
-        handled = False
-
-        # Handle file uploads first
-        if self._is_upload_field(element):
-            logger.debug("Detected upload field")
-            self._handle_upload_fields(element)
-            handled = True
-
-        # Handle different form control types
-        handled |= self._handle_terms_of_service(element)
-        handled |= self._handle_multiline_question(element)
-        handled |= self._handle_radio_question(element)
-        handled |= self._handle_dropdown_question(element)
-        handled |= self._handle_textbox_question(element)
-        handled |= self._handle_date_question(element)
+        kind = self._classify_element(element)
+        handler = {
+            "upload": self._handle_upload_fields,
+            "multiline": self._handle_multiline_question,
+            "radio": self._handle_radio_question,
+            "dropdown": self._handle_dropdown_question,
+            "date": self._handle_date_question,
+            "tos": self._handle_terms_of_service,
+            "textbox": self._handle_textbox_question,
+        }.get(kind)
+
+        if handler is not None:
+            logger.debug(f"Detected {kind} field")
+            handled = bool(handler(element))
+        else:
+            # Unrecognized markup: let every handler have a go. The classifier
+            # already ruled out a file input, so uploads are not probed again.
+            label_text = self._section_label(element)
+            handled = self._handle_terms_of_service(element, label_text)
+            handled |= self._handle_multiline_question(element, label_text)
+            handled |= self._handle_radio_question(element)
+            handled |= self._handle_dropdown_question(element)
+            handled |= self._handle_textbox_question(element, label_text)
+            handled |= self._handle_date_question(element)
 
         if handled:
             logger.debug("Handled at least one sub-control")
@@ -755,6 +1329,23 @@ class LinkedInEasyApplier:
 
         return handled
 
+    def _classify_element(self, element: WebElement) -> str:
+        """
+        Classify a form element by the controls it contains, in one round trip.
+        
+        Args:
+            element: WebElement containing form controls
+            
+        Returns:
+            One of "upload", "multiline", "radio", "dropdown", "date", "tos",
+            "textbox" or "unknown"
+        """
+        try:
+            return self.driver.execute_script(_CLASSIFY_ELEMENT_JS, element) or "unknown"
+        except WebDriverException as e:
+            logger.debug(f"Element classification failed: {e}")
+            return "unknown"
+
     def _get_primary_action_button(self) -> WebElement:
         """
         Locate and return the primary action button for the Easy Apply modal.
@@ -771,10 +1362,7 @@ class LinkedInEasyApplier:
         """
         # Ensure footer is located first
         try:
-            footer = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "div.jobs-easy-apply-modal footer"))
-            )
+            footer = self._wait_or_find(By.CSS_SELECTOR, "div.jobs-easy-apply-modal footer")
         except TimeoutException:
             logger.error("[FOOTER] Timeout waiting for Easy Apply modal footer - application may be complete")
             # Check if we're in a post-submission state
@@ -787,28 +1375,10 @@ class LinkedInEasyApplier:
         # ----------------------------------------------------------------------
 
 
-        locators = [
-            # 1️⃣ explicit hooks
-            (By.CSS_SELECTOR, 'button[data-live-test-easy-apply-next-button]'),
-            (By.CSS_SELECTOR, 'button[data-live-test-easy-apply-review-button]'),
-            (By.CSS_SELECTOR, 'button[data-live-test-easy-apply-submit-button]'),
-            (By.CSS_SELECTOR, 'button[data-easy-apply-next-button]'),
-            # 2️⃣ aria labels
-            (By.CSS_SELECTOR, 'button[aria-label*="Continue to next step"]'),
-            (By.CSS_SELECTOR, 'button[aria-label*="Review your application"]'),
-            (By.CSS_SELECTOR, 'button[aria-label*="Submit application"]'),
-            # 3️⃣ last-resort primary CTA
-            (By.CSS_SELECTOR, 'button.artdeco-button--primary'),
-        ]
-
-        # the modal scroll-container (same on every step)
-        modal = self.driver.find_element(By.CSS_SELECTOR,
-                                        'div.jobs-easy-apply-modal__content')
-
         header = self.driver.find_element(By.TAG_NAME, "h3").text.lower()
         wait_s = 18 if "additional questions" in header else 6
 
-        for by, sel in locators:
+        for by, sel in self._PRIMARY_BTN_LOCATORS:
             # ① element must exist
             try:
                 btn = footer.find_element(by, sel)       # ‹— search *inside* footer
@@ -816,9 +1386,7 @@ class LinkedInEasyApplier:
                 continue
 
             # ② bring it into view → required on “Review” page
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block:'center'});", btn
-            )
+            self._scroll_center(btn)
 
             # ③ wait until it’s actually clickable (enabled & no overlay)
             # Debug button information
@@ -827,7 +1395,7 @@ class LinkedInEasyApplier:
                         f"classes: {btn.get_attribute('class')}")
 
             try:
-                WebDriverWait(self.driver, 6).until(
+                WebDriverWait(self.driver, 6, poll_frequency=0.1).until(
                     EC.element_to_be_clickable((by, sel))
                 )
                 return btn                    # success!
@@ -860,26 +1428,38 @@ class LinkedInEasyApplier:
         self._safe_click(btn)
         logger.info(f"[BUTTON] ✅ Clicked button: '{label}'")
 
-        # Wait for either the modal to vanish OR a fresh primary button to render.
+        # Wait for the clicked button to go away (modal closed / step replaced),
+        # a different primary button to render, or an active validation error.
+        # The old button itself still matches the step selectors, so it is excluded.
         logger.debug("[WAIT] Waiting for button to become stale or new button to appear...")
+
+        def step_transition(driver):
+            try:
+                return driver.execute_script(_STEP_TRANSITION_JS, btn)
+            except StaleElementReferenceException:
+                return "gone"
+
         try:
-            WebDriverWait(self.driver, 8).until(
-                EC.any_of(
-                    EC.invisibility_of_element(btn),                       # modal closed
-                    EC.presence_of_element_located((
-                        By.CSS_SELECTOR,
-                        'button[data-live-test-easy-apply-submit-button],'  # new step
-                        'button[data-live-test-easy-apply-review-button],'
-                        'button[data-live-test-easy-apply-next-button]'
-                    ))
-                )
-            )
-            logger.debug("[WAIT] ✅ Button transition completed")
+            # React to the first DOM mutation in the page; poll only if the
+            # async script cannot run (e.g. the button went stale already)
+            try:
+                outcome = self.driver.execute_async_script(_AWAIT_STEP_TRANSITION_JS, btn, 8000)
+            except StaleElementReferenceException:
+                outcome = "gone"
+            except WebDriverException as e:
+                logger.debug(f"[WAIT] Mutation observer unavailable, polling instead: {e}")
+                outcome = WebDriverWait(self.driver, 8, poll_frequency=0.1).until(step_transition)
+            if outcome is None:
+                raise TimeoutException("No step transition after 8s")
+            logger.debug(f"[WAIT] ✅ Button transition completed ({outcome})")
         except TimeoutException:
             logger.error("[WAIT] ❌ Timeout waiting for button transition - checking for errors")
             self._check_for_errors()
             raise
 
+        if outcome == "error":
+            self._check_for_errors()
+
         # Check if Easy Apply modal still exists (not just any modal - confirmation modal is different)
         try:
             easy_apply_modal = self.driver.find_element(By.CSS_SELECTOR, "div.jobs-easy-apply-modal")
@@ -911,8 +1491,7 @@ class LinkedInEasyApplier:
                 "footer label[for='follow-company-checkbox']"
             )
             # scroll so the label is free of the sticky footer
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block:'center'});", label)
+            self._scroll_center(label)
             time.sleep(0.2)
 
             # only click if it is actually checked
@@ -929,11 +1508,8 @@ class LinkedInEasyApplier:
         Raise only if an *active* error message is present
         (LinkedIn keeps the error DIV in the DOM even after the problem is fixed).
         """
-        active_errors = [
-            e.text.strip() for e in
-            self.driver.find_elements(By.CLASS_NAME, "artdeco-inline-feedback--error")
-            if e.is_displayed() and e.text.strip()
-        ]
+        # Visible, non-empty messages only, collected in a single round trip
+        active_errors = self.driver.execute_script(_ACTIVE_ERRORS_JS)
         if active_errors:
             # Dump HTML for debugging
             try:
@@ -994,16 +1570,6 @@ class LinkedInEasyApplier:
         except Exception as e:
             pass
 
-    def _is_upload_field(self, element: WebElement) -> bool:
-        try:
-            element.find_element(By.XPATH, ".//input[@type='file']")
-            return True
-        except NoSuchElementException:
-            return False
-
-
-
-
     def _handle_upload_fields(self, block: WebElement) -> bool:
         """
         Upload résumé or cover-letter inside *block*.
@@ -1021,53 +1587,35 @@ class LinkedInEasyApplier:
             except NoSuchElementException:
                 return None
 
-        file_input = _find_file_input()
-        if not file_input:
-            return False
-
-        # Identify what the block expects
+        # Identify what the block expects and make the <input> interact-able
+        # in one round trip
         try:
-            input_id = (file_input.get_attribute("id") or "").lower()
-        except Exception:
-            # If element is stale, re-find it
-            file_input = _find_file_input()
-            if not file_input:
-                return False
-            input_id = (file_input.get_attribute("id") or "").lower()
+            info = self.driver.execute_script(_UPLOAD_SETUP_JS, block)
+        except WebDriverException as e:
+            logger.warning(f"Failed to inspect upload field: {e}")
+            return False
+        if not info:
+            return False
 
-        wants_cover = any(k in input_id for k in ("cover", "motivation"))
+        wants_cover = info["wantsCover"]
         wants_resume = not wants_cover
 
-        # Make the <input> interact-able - re-find element before script execution
-        try:
-            fresh_input = _find_file_input()
-            if fresh_input:
-                self.driver.execute_script(
-                    "arguments[0].classList.remove('hidden');", fresh_input
-                )
-        except Exception as e:
-            logger.warning(f"Failed to make input interactable: {e}")
-
         uploaded = False
 
         # ── résumé ─────────────────────────────────────────────────────────
         if wants_resume and self.resume_dir:
-            try:
+            def _send_resume() -> bool:
+                # Re-find the input on every attempt in case it went stale
                 fresh_input = _find_file_input()
-                if fresh_input:
-                    fresh_input.send_keys(str(self.resume_dir.resolve()))
-                    uploaded = True
+                if not fresh_input:
+                    return False
+                fresh_input.send_keys(self._resume_path_str)
+                return True
+
+            try:
+                uploaded = self._retry_with_backoff(_send_resume)
             except Exception as e:
-                logger.warning(f"Resume upload failed, retrying: {e}")
-                # Retry once with a fresh element
-                try:
-                    time.sleep(0.5)
-                    fresh_input = _find_file_input()
-                    if fresh_input:
-                        fresh_input.send_keys(str(self.resume_dir.resolve()))
-                        uploaded = True
-                except Exception as e2:
-                    logger.error(f"Resume upload failed after retry: {e2}")
+                logger.error(f"Resume upload failed after retries: {e}")
 
         # ── cover letter (generated on-the-fly) ────────────────────────────
         if wants_cover:
@@ -1084,28 +1632,46 @@ class LinkedInEasyApplier:
 
         # Tell LinkedIn the field changed so it refreshes footer CTA
         try:
-            fresh_input = _find_file_input()
-            if fresh_input:
-                for evt in ("change", "blur"):
-                    try:
-                        self.driver.execute_script(
-                            "arguments[0].dispatchEvent(new Event(arguments[1],{bubbles:true}));",
-                            fresh_input, evt
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to dispatch {evt} event: {e}")
+            self.driver.execute_script(_DISPATCH_EVENTS_JS, block, ["change", "blur"], "input[type='file']")
         except Exception as e:
             logger.warning(f"Failed to dispatch events on upload field: {e}")
 
         # tiny guard: press ESC once – closes any stray OS picker if one appeared
         try:
-            self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+            self.driver.execute_script(_PRESS_ESCAPE_JS)
         except Exception:
             pass
         time.sleep(0.2)
 
         return True
 
+    def _retry_with_backoff(self, fn, *, attempts: int = 3, base: float = 0.25, cap: float = 4.0):
+        """
+        Call ``fn`` until it succeeds, sleeping with capped exponential backoff
+        plus jitter between attempts.
+        
+        Args:
+            fn: Callable taking no arguments
+            attempts: Maximum number of calls
+            base: Delay before the first retry, in seconds (before jitter)
+            cap: Upper bound on the exponential part of the delay
+            
+        Returns:
+            The return value of the first successful call
+            
+        Raises:
+            Exception: Whatever the last attempt raised
+        """
+        for attempt in range(attempts):
+            try:
+                return fn()
+            except Exception as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = min(cap, base * 2 ** attempt) + random.uniform(0, base)
+                logger.warning(f"Attempt {attempt + 1}/{attempts} failed, retrying in {delay:.2f}s: {e}")
+                time.sleep(delay)
+
     def _create_and_upload_resume(self, element: WebElement) -> None:
         """
         Create and upload a dynamically generated resume PDF.
@@ -1122,40 +1688,37 @@ class LinkedInEasyApplier:
         Raises:
             Exception: If maximum retries are reached and upload fails
         """
-        max_retries = 3
-        retry_delay = 1
         folder_path = 'generated_cv'
 
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
             
-        for attempt in range(max_retries):
-            try:
-                # NOTE: Resume generation is currently disabled
-                # Uncomment and implement the following if dynamic resume generation is needed:
-                #
-                # html_string = self.gpt_answerer.get_resume_html()
-                # with tempfile.NamedTemporaryFile(delete=False, suffix='.html', mode='w', encoding='utf-8') as temp_html_file:
-                #     temp_html_file.write(html_string)
-                #     file_name_HTML = temp_html_file.name
-                #
-                # file_name_pdf = f"resume_{uuid.uuid4().hex}.pdf"
-                # file_path_pdf = os.path.join(folder_path, file_name_pdf)
-                # 
-                # with open(file_path_pdf, "wb") as f:
-                #     f.write(base64.b64decode(utils.HTML_to_PDF(file_name_HTML)))
-                #     
-                # element.send_keys(os.path.abspath(file_path_pdf))
-                # time.sleep(2)  # Give some time for the upload process
-                # os.remove(file_name_HTML)
-                
-                return True
-            except Exception:
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                else:
-                    tb_str = traceback.format_exc()
-                    raise Exception(f"Max retries reached. Upload failed: \nTraceback:\n{tb_str}")
+        def _attempt():
+            # NOTE: Resume generation is currently disabled
+            # Uncomment and implement the following if dynamic resume generation is needed:
+            #
+            # html_string = self.gpt_answerer.get_resume_html()
+            # with tempfile.NamedTemporaryFile(delete=False, suffix='.html', mode='w', encoding='utf-8') as temp_html_file:
+            #     temp_html_file.write(html_string)
+            #     file_name_HTML = temp_html_file.name
+            #
+            # file_name_pdf = f"resume_{uuid.uuid4().hex}.pdf"
+            # file_path_pdf = os.path.join(folder_path, file_name_pdf)
+            # 
+            # with open(file_path_pdf, "wb") as f:
+            #     f.write(base64.b64decode(utils.HTML_to_PDF(file_name_HTML)))
+            #     
+            # element.send_keys(os.path.abspath(file_path_pdf))
+            # time.sleep(2)  # Give some time for the upload process
+            # os.remove(file_name_HTML)
+            
+            return True
+
+        try:
+            return self._retry_with_backoff(_attempt)
+        except Exception:
+            tb_str = traceback.format_exc()
+            raise Exception(f"Max retries reached. Upload failed: \nTraceback:\n{tb_str}")
 
     def _upload_resume(self, element: WebElement) -> None:
         """
@@ -1164,7 +1727,7 @@ class LinkedInEasyApplier:
         Args:
             element: The file input element to upload the resume to
         """
-        element.send_keys(str(self.resume_dir))
+        element.send_keys(self._resume_path_str)
 
     def _create_and_upload_cover_letter(self, element: WebElement) -> None:
         """
@@ -1176,17 +1739,30 @@ class LinkedInEasyApplier:
         Args:
             element: The file input element to upload the cover letter to
         """
-        cover_letter = self.gpt_answerer.answer_question_textual_wide_range("Write a cover letter")
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf_file:
-            letter_path = temp_pdf_file.name
-            c = canvas.Canvas(letter_path, pagesize=letter)
+        # The letter is written for the current job; re-uploads within the
+        # same application (retries, later passes) reuse the generated file
+        if self._cover_letter_path is None:
+            # reportlab is only needed for the few applications asking for a letter
+            from reportlab.lib.pagesizes import letter
+            from reportlab.pdfgen import canvas
+
+            cover_letter = self.gpt_answerer.answer_question_textual_wide_range("Write a cover letter")
+
+            # Render in memory, then write the file once
+            buf = io.BytesIO()
+            c = canvas.Canvas(buf, pagesize=letter)
             width, height = letter
             text_object = c.beginText(100, height - 100)
             text_object.setFont("Helvetica", 12)
             text_object.textLines(cover_letter)
             c.drawText(text_object)
             c.save()
-            element.send_keys(letter_path)
+
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf_file:
+                temp_pdf_file.write(buf.getvalue())
+            self._cover_letter_path = temp_pdf_file.name
+
+        element.send_keys(self._cover_letter_path)
 
     def _fill_additional_questions(self) -> None:
         """
@@ -1196,26 +1772,63 @@ class LinkedInEasyApplier:
         beyond the basic application information.
         """
         form_sections = self.driver.find_elements(By.CLASS_NAME, 'jobs-easy-apply-form-section__grouping')
-        for section in form_sections:
-            self._process_question(section)
+        # The read-only probes of all sections go out in one round trip;
+        # answering still happens one section at a time
+        self._prefetch_probes(form_sections)
+        try:
+            for section in form_sections:
+                self._process_question(section)
+        finally:
+            self._prefetched_probes.clear()
 
     def _process_question(self, section: WebElement) -> None:
         """
         Process a single question section in the application form.
         
-        Delegates to specific handlers based on the type of form element found.
+        Classifies the section in one round trip and delegates to the matching
+        handler; unrecognized sections are offered to each handler in turn.
         
         Args:
             section: WebElement containing the question to process
         """
-        if self._handle_terms_of_service(section):
+        handler = {
+            "tos": self._handle_terms_of_service,
+            "radio": self._handle_radio_question,
+            "textbox": self._handle_textbox_question,
+            "date": self._handle_date_question,
+            "dropdown": self._handle_dropdown_question,
+        }.get(self._classify_element(section))
+        if handler is not None:
+            handler(section)
+            return
+
+        # Unrecognized markup: try the handlers in turn, sharing one label lookup
+        label_text = self._section_label(section)
+        if self._handle_terms_of_service(section, label_text):
             return
         self._handle_radio_question(section)
-        self._handle_textbox_question(section)
+        self._handle_textbox_question(section, label_text)
         self._handle_date_question(section)
         self._handle_dropdown_question(section)
 
-    def _handle_terms_of_service(self, element: WebElement) -> bool:
+    def _section_label(self, section: WebElement) -> Optional[str]:
+        """
+        Label text of a section, looked up once for the whole handler cascade.
+        
+        Args:
+            section: WebElement containing the question
+            
+        Returns:
+            The label text, or None if it could not be read (handlers then
+            look it up themselves)
+        """
+        try:
+            return self._deep_label_text(section)
+        except (StaleElementReferenceException, WebDriverException) as exc:
+            logger.debug(f"Section label lookup failed: {exc}")
+            return None
+
+    def _handle_terms_of_service(self, element: WebElement, label_text: Optional[str] = None) -> bool:
         """
         Handle terms of service, privacy policy, and similar checkboxes.
         
@@ -1224,17 +1837,16 @@ class LinkedInEasyApplier:
         
         Args:
             element: WebElement containing the checkbox
+            label_text: Label text already read by the caller, if any
             
         Returns:
             True if a terms checkbox was found and clicked, False otherwise
         """
+        if label_text is not None and not _TOS_RE.search(label_text):
+            return False
         try:
             checkbox = element.find_element(By.TAG_NAME, 'label')
-            question_text = checkbox.text.lower()
-            if any(kw in question_text for kw in (
-                    'terms of service', 'privacy policy', 'terms of use',
-                    'politique de confidentialité', 'conditions d’utilisation',
-                    'j\'accepte', 'confidentialité')):
+            if _TOS_RE.search(checkbox.text):
                 checkbox.click()
                 return True
             return False
@@ -1269,10 +1881,11 @@ class LinkedInEasyApplier:
                 return True  # already answered
 
             options = [lbl.text.strip() for lbl in labels if lbl.text.strip()]
+            options_lower = {opt.lower() for opt in options}
             key     = question_text.lower()
 
             answer  = next(
-                (ans for substr, ans in self.answers.items() if substr in key and ans in options),
+                (ans for ans in self._saved_answers_in(key) if ans.lower() in options_lower),
                 None,
             )
 
@@ -1293,7 +1906,7 @@ class LinkedInEasyApplier:
             if generated:
                 self._remember_answer("radio", question_text, answer)
 
-            time.sleep(0.3)
+            self._wait_until(lambda d: element.find_elements(By.CSS_SELECTOR, "input[type=radio]:checked"))
             return True
 
         except NoSuchElementException:
@@ -1316,8 +1929,10 @@ class LinkedInEasyApplier:
             if isinstance(raw_answer, (int, float)):
                 intval = int(raw_answer)
             else:
-                intval = int(float(str(raw_answer).strip()))
-        except Exception:
+                text = str(raw_answer).strip()
+                # Plain digit strings (the usual GPT reply) skip the float parse
+                intval = int(text) if text.isdecimal() else int(float(text))
+        except (TypeError, ValueError, OverflowError):
             # If we can't parse the number, return 1 as a safe fallback
             return "1"
         
@@ -1350,20 +1965,26 @@ class LinkedInEasyApplier:
             # Fallback to conservative range
             return 1, 99
 
-    def _handle_multiline_question(self, element: WebElement) -> bool:
+    def _handle_multiline_question(self, element: WebElement, label_text: Optional[str] = None) -> bool:
         try:
             element.find_element(By.CSS_SELECTOR,
                                  "[data-test-multiline-text-form-component]")
-            question_text = element.find_element(By.TAG_NAME, "label").text.strip()
+            question_text = (label_text if label_text is not None
+                             else element.find_element(By.TAG_NAME, "label").text.strip())
             textarea      = element.find_element(By.TAG_NAME, "textarea")
 
-            answer = (self.gpt_answerer
-                      .answer_question_textual_wide_range(question_text) or "").strip()
-            if not answer:
+            # Type the answer as it streams in, overlapping generation with typing
+            textarea.clear()
+            typed = []
+            for chunk in self.gpt_answerer.stream_answer_textual_wide_range(question_text):
+                if not typed:
+                    chunk = chunk.lstrip()
+                if chunk:
+                    textarea.send_keys(chunk)
+                    typed.append(chunk)
+            if not "".join(typed).strip():
                 return False
 
-            textarea.clear()
-            textarea.send_keys(answer)
             time.sleep(0.5)
             return True
 
@@ -1428,7 +2049,7 @@ class LinkedInEasyApplier:
                 suggestions = []
                 for by, selector in dropdown_selectors:
                     try:
-                        suggestions = WebDriverWait(self.driver, 3).until(
+                        suggestions = WebDriverWait(self.driver, 3, poll_frequency=0.1).until(
                             EC.presence_of_all_elements_located((by, selector))
                         )
                         if suggestions:
@@ -1522,44 +2143,32 @@ class LinkedInEasyApplier:
     # ---------------------------------------------------------------------------
     # REPLACE the whole _handle_textbox_question
     # ---------------------------------------------------------------------------
-    def _handle_textbox_question(self, element: WebElement) -> bool:
+    def _handle_textbox_question(self, element: WebElement, label_text: Optional[str] = None) -> bool:
         """Answer single-line text or numeric inputs and remember GPT answers."""
-        if not (element.find_elements(By.TAG_NAME, "input") or element.find_elements(By.TAG_NAME, "textarea")):
-            return False
-
-        try:
-            question_text = self._deep_label_text(element).lower()
-        except NoSuchElementException:
+        # visible input (or textarea) and its attributes, in one round trip
+        field = self._probe_section(element)["field"]
+        if field is None:
             return False
+        text_field = field["el"]
 
-        # locate the visible input
-        text_field = None
-        for inp in element.find_elements(By.TAG_NAME, "input"):
-            if inp.is_displayed() and (inp.get_attribute("type") or "").lower() not in ("hidden", "file"):
-                text_field = inp
-                break
-        if text_field is None:
-            for ta in element.find_elements(By.TAG_NAME, "textarea"):
-                if ta.is_displayed():
-                    text_field = ta
-                    break
-        if text_field is None:
-            return False
+        if label_text is None:
+            try:
+                label_text = self._deep_label_text(element)
+            except NoSuchElementException:
+                return False
+        question_text = label_text.lower()
 
         # Check if this is a typeahead/autocomplete field
-        role = text_field.get_attribute("role") or ""
-        aria_autocomplete = text_field.get_attribute("aria-autocomplete") or ""
-        
-        if role == "combobox" and aria_autocomplete == "list":
+        if field["role"] == "combobox" and field["autocomplete"] == "list":
             logger.debug(f"[TYPEAHEAD] Detected typeahead field: {question_text!r}")
             return self._handle_typeahead_field(element, text_field, question_text)
 
-        if text_field.get_attribute("value").strip():
-            text_field.send_keys(Keys.TAB)
-            time.sleep(0.3)
+        if field["value"].strip():
+            # Already filled: just let LinkedIn validate it
+            self.driver.execute_script(_DISPATCH_EVENTS_JS, text_field, ["change", "blur"])
             return True
 
-        field_id   = text_field.get_attribute("id") or ""
+        field_id   = field["id"]
         is_numeric = "-numeric" in field_id
 
         answer = self._get_answer_from_set("numeric" if is_numeric else "text", question_text)
@@ -1597,14 +2206,19 @@ class LinkedInEasyApplier:
         
         for attempt in range(max_retries + 1):
             try:
-                text_field.clear()
-                text_field.send_keys(answer)
-                text_field.send_keys(Keys.TAB)
-                time.sleep(0.5)
+                # Set value, fire input/change and blur in one round trip;
+                # type it only if the page's input handling rejected that
+                if self.driver.execute_script(_SET_VALUE_JS, text_field, answer) != answer:
+                    text_field.clear()
+                    text_field.send_keys(answer)
+                    text_field.send_keys(Keys.TAB)
+                    self._wait_until(lambda d: text_field.get_attribute("value") == answer)
                 
-                # Check for validation errors
-                error_elements = self.driver.find_elements(By.CSS_SELECTOR, ".artdeco-inline-feedback--error")
-                active_errors = [e for e in error_elements if e.is_displayed() and e.text.strip()]
+                # Check for validation errors (visible messages, one round trip)
+                active_errors = self.driver.execute_script(_ACTIVE_ERRORS_JS)
+                if generated and attempt == 0:
+                    # Lets the semantic cache evict and retune on rejected cached answers
+                    self.gpt_answerer.record_answer_feedback(question_text, not active_errors)
                 
                 if not active_errors:
                     # Success! Remember the answer if it was generated
@@ -1614,7 +2228,7 @@ class LinkedInEasyApplier:
                     
                 # We have validation errors - handle them
                 if attempt < max_retries and is_numeric:
-                    error_text = " ".join([e.text.strip() for e in active_errors])
+                    error_text = " ".join(active_errors)
                     logger.debug(f"Validation error for {question_text}: {error_text}")
                     
                     # Ask GPT for appropriate range
@@ -1629,7 +2243,7 @@ class LinkedInEasyApplier:
                     continue  # Retry with clamped value
                 else:
                     # Final attempt failed or not numeric - log and continue
-                    logger.warning(f"Failed to resolve validation error for {question_text}: {[e.text for e in active_errors]}")
+                    logger.warning(f"Failed to resolve validation error for {question_text}: {active_errors}")
                     break
                     
             except Exception as e:
@@ -1660,9 +2274,8 @@ class LinkedInEasyApplier:
                 return False
 
             date_picker.clear()
-            date_picker.send_keys(date.today().strftime("%m/%d/%y"))
-            date_picker.send_keys(Keys.RETURN)
-            time.sleep(0.3)
+            date_picker.send_keys(self._today_text() + Keys.RETURN)
+            self._wait_until(lambda d: (date_picker.get_attribute("value") or "").strip())
             return True
 
         except NoSuchElementException:
@@ -1671,6 +2284,50 @@ class LinkedInEasyApplier:
             logger.error(f"Date question handling error: {e}")
             return False
 
+    def _today_text(self) -> str:
+        """Today's date formatted for LinkedIn date pickers (MM/DD/YY), formatted once per day."""
+        today = date.today()
+        if today != self._today:
+            self._today = today
+            self._today_str = today.strftime("%m/%d/%y")
+        return self._today_str
+
+    def _probe_section(self, element: WebElement) -> Dict[str, Any]:
+        """
+        Read everything the textbox and dropdown handlers need from a form element at once.
+        
+        Args:
+            element: WebElement containing form controls
+            
+        Returns:
+            Dict with ``label`` (first label text or None), ``labelText``
+            (first non-empty label text, or ""), ``multiline`` (whether it is a
+            multiline text question), ``field`` (first visible text input or
+            textarea: el, type, id, value, role, autocomplete; or None) and
+            ``select`` (el, selected, enabled, options; or None)
+        """
+        probe = self._prefetched_probes.pop(element.id, None)
+        if probe is not None:
+            return probe
+        return self.driver.execute_script(_PROBE_SECTION_JS, element)
+
+    def _prefetch_probes(self, elements: List[WebElement]) -> None:
+        """
+        Probe several form elements in a single round trip, for `_probe_section`
+        to hand out later.
+        
+        Args:
+            elements: WebElements containing form controls
+        """
+        if not elements:
+            return
+        try:
+            probes = self.driver.execute_script(_PROBE_SECTIONS_JS, elements)
+        except WebDriverException as exc:
+            logger.debug(f"Batched section probe failed, probing one by one: {exc}")
+            return
+        self._prefetched_probes.update((el.id, probe) for el, probe in zip(elements, probes))
+
     def _handle_dropdown_question(self, element: WebElement) -> bool:
         """
         Handle dropdown (select) form elements.
@@ -1685,21 +2342,24 @@ class LinkedInEasyApplier:
             True if a dropdown option was selected, False if not a dropdown or already answered
         """
         try:
-            question_text = element.find_element(By.TAG_NAME, "label").text.lower()
-            dropdown      = element.find_element(By.TAG_NAME, "select")
-            select        = Select(dropdown)
+            # label, <select>, its state and option texts in one round trip
+            probe = self._probe_section(element)
+            if probe["label"] is None or probe["select"] is None:
+                return False
+            question_text = probe["label"].lower()
+            dropdown      = probe["select"]["el"]
 
             logger.info(f"[DROPDOWN] Processing question: {question_text!r}")
             
-            first = select.first_selected_option.text.strip().lower()
+            first = probe["select"]["selected"].strip().lower()
             logger.debug(f"[DROPDOWN] Currently selected: {first!r}")
             
-            if first and not any(tok in first for tok in ("select", "sélect", "selecciona", "choose", "choisissez")) \
-            and not dropdown.is_enabled():
+            if first and not _PLACEHOLDER_RE.search(first) \
+            and not probe["select"]["enabled"]:
                 logger.debug(f"[DROPDOWN] Already answered and disabled, skipping")
                 return False  # already confirmed
 
-            options   = [o.text for o in select.options]
+            options   = probe["select"]["options"]
             logger.debug(f"[DROPDOWN] Available options ({len(options)}): {options[:5]}{'...' if len(options) > 5 else ''}")
             
             # First try: exact match from saved answers
@@ -1731,20 +2391,13 @@ class LinkedInEasyApplier:
             # Last resort: select first non-placeholder option
             if not answer:
                 logger.warning(f"[DROPDOWN] Try 4: Using fallback (first non-placeholder)")
-                placeholder = ("select", "sélect", "selecciona", "choose", "choisissez", "opción")
-                answer = next((o for o in options if not any(p in o.lower() for p in placeholder)),
+                answer = next((o for o in options if not _PLACEHOLDER_RE.search(o)),
                             options[1] if len(options) > 1 else options[0])
                 generated = True
                 logger.warning(f"[DROPDOWN] ⚠️ Fallback selection: {answer!r}")
 
             logger.info(f"[DROPDOWN] Final answer: {question_text!r} → {answer!r}")
-            self._select_dropdown(dropdown, answer)
-
-            for evt in ("change", "blur"):
-                self.driver.execute_script(
-                    "arguments[0].dispatchEvent(new Event(arguments[1],{bubbles:true}));",
-                    dropdown, evt,
-                )
+            self._select_dropdown(dropdown, answer, options)
 
             if generated:
                 self._remember_answer("dropdown", question_text, answer)
@@ -1811,7 +2464,7 @@ class LinkedInEasyApplier:
         # Check for any dropdowns or autocomplete suggestions
         try:
             # Locate the first dropdown suggestion and click it
-            dropdown = WebDriverWait(self.driver, 2).until(
+            dropdown = WebDriverWait(self.driver, 2, poll_frequency=0.1).until(
                 EC.visibility_of_element_located((By.CLASS_NAME, 'search-typeahead-v2__hit'))
             )
             dropdown.click()
@@ -1820,7 +2473,7 @@ class LinkedInEasyApplier:
             pass  # If no dropdown, continue as normal
 
 
-    def _select_dropdown(self, element: WebElement, text: str) -> None:
+    def _select_dropdown(self, element: WebElement, text: str, options: Optional[List[str]] = None) -> None:
         """
         Select an option from a dropdown element with intelligent matching.
         
@@ -1832,28 +2485,30 @@ class LinkedInEasyApplier:
         Args:
             element: The select dropdown element
             text: The text to search for in options
+            options: Texts of all the element's options, in order, if already known
         """
-        select = Select(element)
+        if options is None:
+            options = self.driver.execute_script(
+                "return Array.from(arguments[0].options).map(o => o.text);", element
+            )
+        texts = [" ".join(opt_text.split()) for opt_text in options]
+        wanted = " ".join(text.split())
+        wanted_lower = wanted.lower()
 
         # ⓐ exact
-        try:
-            select.select_by_visible_text(text)
-            return
-        except Exception:
-            pass
-
+        chosen = next((i for i, t in enumerate(texts) if t == wanted), None)
         # ⓑ case-insensitive substring match
-        for opt in select.options:
-            if text.lower() in opt.text.lower():
-                select.select_by_visible_text(opt.text)
-                return
-
+        if chosen is None:
+            chosen = next((i for i, t in enumerate(texts) if wanted_lower in t.lower()), None)
         # ⓒ sane fallback (skip “Select an option” / “Choose …”)
-        for opt in select.options:
-            t = opt.text.strip().lower()
-            if t and not any(tok in t for tok in ("select", "sélect", "choose", "choisissez")):
-                select.select_by_visible_text(opt.text)
-                return
+        if chosen is None:
+            chosen = next((i for i, t in enumerate(texts) if t and not _PLACEHOLDER_RE.search(t)), None)
+        if chosen is None:
+            return
+
+        # Select by the index matched above: no option lookup on the driver side,
+        # and the change/blur events go out in the same round trip
+        self.driver.execute_script(_SELECT_INDEX_JS, element, chosen)
 
 
     def _select_radio(self, radios: List[WebElement], answer: str) -> None:
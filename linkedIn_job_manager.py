@@ -27,6 +27,7 @@ import os
 import random
 import time
 import traceback
+from contextlib import contextmanager
 from itertools import product
 from pathlib import Path
 
@@ -40,6 +41,54 @@ from job import Job
 from linkedIn_easy_applier import LinkedInEasyApplier
 from logging_config import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Title, company and location from the top card of an opened job posting
+_POSTING_HEADER_JS = """
+const text = sel => {
+    const el = document.querySelector(sel);
+    return el ? el.innerText.trim() : '';
+};
+return [
+    text('.job-details-jobs-unified-top-card__job-title, .jobs-unified-top-card__job-title, h1'),
+    text('.job-details-jobs-unified-top-card__company-name, .jobs-unified-top-card__company-name'),
+    text('.job-details-jobs-unified-top-card__primary-description-container .tvm__text, '
+         + '.jobs-unified-top-card__bullet'),
+];
+"""
+
+# Answers given by GPT, one (type, question, answer) row each, reused across runs
+OLD_ANSWERS_CSV = Path("data_folder/output/old_Questions.csv")
+
+
+@contextmanager
+def _exclusive_lock(fh):
+    """
+    Hold an exclusive lock on an open file while the block runs, so parallel
+    workers sharing the answers file do not interleave their rows.
+    
+    Args:
+        fh: File object opened for writing
+    """
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+    else:
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+    try:
+        yield
+    finally:
+        fh.flush()
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
 
 class EnvironmentKeys:
     """
@@ -94,7 +143,11 @@ class LinkedInJobManager:
         """
         self.driver = driver
         self.set_old_answers: dict[tuple[str, str], str] = {}
+        # (type, question) pairs already stored in OLD_ANSWERS_CSV, lowercased
+        self._stored_answer_keys: set[tuple[str, str]] = set()
         self.easy_applier_component = None
+        # Parameters last passed to set_parameters, to skip redundant reconfiguration
+        self._params = None
 
     def set_parameters(self, parameters):
         """
@@ -104,6 +157,7 @@ class LinkedInJobManager:
             parameters: Dictionary containing search configuration including
                       positions, locations, blacklists, resume path, etc.
         """
+        self._params = parameters
         self.company_blacklist = parameters.get('companyBlacklist', []) or []
         self.title_blacklist = parameters.get('titleBlacklist', []) or []
         self.positions = parameters.get('positions', [])
@@ -121,6 +175,7 @@ class LinkedInJobManager:
         self.output_file_directory = Path(parameters['outputFileDirectory'])
         self.env_config = EnvironmentKeys()
         self._load_questions_from_csv()
+        self.easy_applier_component = None
 
     def set_gpt_answerer(self, gpt_answerer):
         """
@@ -130,6 +185,7 @@ class LinkedInJobManager:
             gpt_answerer: AI service for generating form responses
         """
         self.gpt_answerer = gpt_answerer
+        self.easy_applier_component = None
 
     def _load_questions_from_csv(self):
         """
@@ -137,10 +193,12 @@ class LinkedInJobManager:
         
         Loads answers from 'data_folder/output/old_Questions.csv' to avoid
         asking the same questions repeatedly during application sessions.
-        Filters out invalid placeholder answers.
+        Filters out invalid placeholder answers. Duplicate rows (possible when
+        several workers append to the file) collapse here, the last one winning.
         """
         self.set_old_answers = {}
-        file_path = 'data_folder/output/old_Questions.csv'
+        self._stored_answer_keys = set()
+        file_path = OLD_ANSWERS_CSV
         
         # Placeholder keywords to filter out (multilingual)
         placeholders = [
@@ -155,6 +213,7 @@ class LinkedInJobManager:
                 for row in csv_reader:
                     if len(row) == 3:
                         answer_type, question_text, answer = row
+                        self._stored_answer_keys.add((answer_type.lower(), question_text.lower()))
                         
                         # Validate answer is not a placeholder
                         if answer:
@@ -168,32 +227,93 @@ class LinkedInJobManager:
 
 
 
-    # ---------------------------------------------------------------------------
-    # replace the whole method
-    # ---------------------------------------------------------------------------
-    def start_applying(self):
+    def _ensure_easy_applier(self):
         """
-        Boot the Easy-Apply helper and iterate through every (position, location)
-        search combination – one LinkedIn result page at a time.
-        Every brand-new GPT answer that gets generated during a job application
-        is persisted through `record_gpt_answer`, so that future runs can reuse it.
+        Create the Easy-Apply helper on first use, handing it the saved answers
+        and the persistence callback for new GPT answers.
         """
+        if self.easy_applier_component is not None:
+            return
 
         old_answers_as_triples = [
             (q_type, q_sub, ans)              # (str, str, str)
             for (q_type, q_sub), ans in self.set_old_answers.items()
         ]
-        # ----
 
-        # hand the persistence callback to the applier  ↓↓↓
         self.easy_applier_component = LinkedInEasyApplier(
             driver            = self.driver,
             resume_dir        = self.resume_dir,
             set_old_answers   = old_answers_as_triples,
             gpt_answerer      = self.gpt_answerer,
-            record_answer_cb  = self.record_gpt_answer,   #  ← NEW
+            record_answer_cb  = self.record_gpt_answer,
+            record_answers_bulk_cb = self.record_gpt_answers,
         )
 
+    def start_applying_batch(self, job_ids) -> dict[str, str]:
+        """
+        Apply to a list of LinkedIn job postings given by their ids.
+        
+        The Easy-Apply helper is set up once for the whole batch; each job is
+        then opened directly from its posting URL instead of a search page,
+        and its title and company are read from the posting so the blacklists
+        apply as they do for searched jobs.
+        
+        Args:
+            job_ids: LinkedIn job posting ids
+            
+        Returns:
+            Mapping of job id to its outcome ("success", "failed" or "skipped")
+        """
+        self._ensure_easy_applier()
+
+        results = {}
+        for job_id in job_ids:
+            link = f"https://www.linkedin.com/jobs/view/{job_id}/"
+            title, company, location = self._read_posting_header(link)
+            job = Job(
+                title=title or str(job_id),
+                company=company,
+                location=location,
+                link=link,
+                apply_method="Easy Apply",
+            )
+            results[str(job_id)] = self._apply_to_job(job)
+        return results
+
+    def _read_posting_header(self, link: str) -> tuple[str, str, str]:
+        """
+        Open a job posting and read its title, company and location.
+        
+        Args:
+            link: URL of the job posting
+            
+        Returns:
+            (title, company, location); empty strings for parts not found
+        """
+        self.driver.get(link)
+        try:
+            WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.TAG_NAME, "h1"))
+            )
+        except TimeoutException:
+            logger.warning(f"Job posting header did not load: {link}")
+            return "", "", ""
+        title, company, location = self.driver.execute_script(_POSTING_HEADER_JS)
+        return title, company, location
+
+    # ---------------------------------------------------------------------------
+    # replace the whole method
+    # ---------------------------------------------------------------------------
+    def start_applying(self):
+        """
+        Boot the Easy-Apply helper and iterate through every (position, location)
+        search combination – one LinkedIn result page at a time.
+        Every brand-new GPT answer that gets generated during a job application
+        is persisted through `record_gpt_answer`, so that future runs can reuse it.
+        """
+
+        self._ensure_easy_applier()
+
         searches           = list(product(self.positions, self.locations))
         random.shuffle(searches)
 
@@ -264,7 +384,7 @@ class LinkedInJobManager:
 
             # Wait for job tiles to load
             try:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                     EC.presence_of_element_located(
                         (By.CSS_SELECTOR, "li[data-occludable-job-id]")
                     )
@@ -297,24 +417,37 @@ class LinkedInJobManager:
 
             # Process each job
             for job in job_list:
-                if self.is_blacklisted(job.title, job.company, job.link):
-                    logger.warning(f"Blacklisted {job.title} at {job.company}, skipping...")
-                    self.write_to_file(job.company, job.location, job.title, job.link, "skipped")
-                    continue
-
-                try:
-                    if job.apply_method not in {"Continue", "Applied", "Apply"}:
-                        self.easy_applier_component.job_apply(job)
-                except Exception:
-                    self.write_to_file(job.company, job.location, job.title, job.link, "failed")
-                    logger.error("apply_jobs failed:\n" + traceback.format_exc())
-                    continue
-                    
-                self.write_to_file(job.company, job.location, job.title, job.link, "success")
-                self.seen_jobs.append(job.link)
+                self._apply_to_job(job)
         
         except Exception as e:
             raise e
+
+    def _apply_to_job(self, job: Job) -> str:
+        """
+        Apply to a single job unless blacklisted, recording the outcome to CSV.
+        
+        Args:
+            job: Job to apply to
+            
+        Returns:
+            The outcome: "success", "failed" or "skipped"
+        """
+        if self.is_blacklisted(job.title, job.company, job.link):
+            logger.warning(f"Blacklisted {job.title} at {job.company}, skipping...")
+            self.write_to_file(job.company, job.location, job.title, job.link, "skipped")
+            return "skipped"
+
+        try:
+            if job.apply_method not in {"Continue", "Applied", "Apply"}:
+                self.easy_applier_component.job_apply(job)
+        except Exception:
+            self.write_to_file(job.company, job.location, job.title, job.link, "failed")
+            logger.error("apply_jobs failed:\n" + traceback.format_exc())
+            return "failed"
+            
+        self.write_to_file(job.company, job.location, job.title, job.link, "success")
+        self.seen_jobs.append(job.link)
+        return "success"
     
     def write_to_file(self, company, job_location, job_title, link, file_name):
         to_write = [company, job_title, link, job_location]
@@ -332,18 +465,32 @@ class LinkedInJobManager:
         Persist every never-seen-before Q/A tuple so that `old_question()` can
         preload it next time.
         """
-        csv_path = Path("data_folder/output/old_Questions.csv")
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # De-dup: skip if we already stored exactly the same (type, question) row
-        if csv_path.exists():
-            with csv_path.open("r", encoding="utf-8", newline="") as fh:
-                for a_type, q_text, _ in csv.reader(fh):
-                    if a_type.lower() == answer_type.lower() and q_text.lower() == question_text.lower():
-                        return
-
-        with csv_path.open("a", encoding="utf-8", newline="") as fh:
-            csv.writer(fh).writerow([answer_type, question_text, gpt_response])
+        self.record_gpt_answers([(answer_type, question_text, gpt_response)])
+
+    def record_gpt_answers(self, rows) -> None:
+        """
+        Persist several Q/A tuples with a single locked append to the CSV,
+        skipping (type, question) pairs already stored.
+
+        The file is never re-read here: pairs loaded at startup and written
+        since are tracked in memory, and rows another worker appended in the
+        meantime are deduplicated when the file is next loaded.
+
+        Args:
+            rows: Iterable of (answer_type, question_text, gpt_response) tuples
+        """
+        new_rows = []
+        for answer_type, question_text, gpt_response in rows:
+            key = (answer_type.lower(), question_text.lower())
+            if key not in self._stored_answer_keys:
+                self._stored_answer_keys.add(key)
+                new_rows.append([answer_type, question_text, gpt_response])
+
+        if new_rows:
+            OLD_ANSWERS_CSV.parent.mkdir(parents=True, exist_ok=True)
+            with OLD_ANSWERS_CSV.open("a", encoding="utf-8", newline="") as fh:
+                with _exclusive_lock(fh):
+                    csv.writer(fh).writerows(new_rows)
 
     def get_base_search_url(self, parameters):
         url_parts = []
@@ -348,7 +348,7 @@ def init_browser():
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
 
 
-def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_key: str):
+def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_key: str, job_ids=None):
     """
     Create and execute the LinkedIn job application bot.
     
@@ -360,6 +360,7 @@ def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_k
         password: LinkedIn account password  
         parameters: Configuration parameters for job search
         openai_api_key: OpenAI API key for GPT functionality
+        job_ids: Optional LinkedIn job posting ids to apply to instead of searching
         
     Raises:
         RuntimeError: If bot execution fails
@@ -420,8 +421,14 @@ def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_k
         bot.start_login()
         logger.info("[BOT EXEC] Login completed successfully")
         
-        logger.info("[BOT EXEC] Starting job application process")
-        bot.start_apply()
+        if job_ids:
+            logger.info(f"[BOT EXEC] Applying to {len(job_ids)} given job postings")
+            results = bot.start_apply_batch(job_ids)
+            for job_id, outcome in results.items():
+                logger.info(f"[BOT EXEC] Job {job_id}: {outcome}")
+        else:
+            logger.info("[BOT EXEC] Starting job application process")
+            bot.start_apply()
         logger.info("[BOT EXEC] Job application process completed")
         
     except Exception as e:
@@ -434,7 +441,9 @@ def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_k
               help="Path to the resume PDF file")
 @click.option('--verbose', '-v', is_flag=True, default=False,
               help="Enable verbose logging (show DEBUG messages on console)")
-def main(resume: Path = None, verbose: bool = False):
+@click.option('--job-id', 'job_ids', multiple=True,
+              help="Apply to this LinkedIn job posting id instead of searching (repeatable)")
+def main(resume: Path = None, verbose: bool = False, job_ids: tuple = ()):
     """
     Main entry point for the LinkedIn job application bot.
     
@@ -447,12 +456,13 @@ def main(resume: Path = None, verbose: bool = False):
         resume: Optional path to PDF resume file. If not provided, 
                 will use dynamic resume generation from plain text resume.
         verbose: If True, enables verbose logging (DEBUG messages on console)
+        job_ids: LinkedIn job posting ids to apply to directly, skipping the search
     """
     # [ENTRY POINT] Starting application
     logger.info("="*80)
     logger.info("LinkedIn Auto Apply Bot - Starting")
     logger.info("="*80)
-    logger.debug(f"[MAIN] Command line arguments: resume={resume}, verbose={verbose}")
+    logger.debug(f"[MAIN] Command line arguments: resume={resume}, verbose={verbose}, job_ids={list(job_ids)}")
     
     try:
         # Configure logging based on verbose flag
@@ -487,12 +497,14 @@ def main(resume: Path = None, verbose: bool = False):
 
         # Create and run the bot
         logger.info("[MAIN] Initializing bot components")
-        create_and_run_bot(email, password, parameters, openai_api_key)
+        create_and_run_bot(email, password, parameters, openai_api_key, list(job_ids))
         
         logger.info("="*80)
         logger.info("[MAIN] Bot execution completed successfully")
         logger.info("="*80)
         
+    except KeyboardInterrupt:
+        logger.info("[MAIN] Job application interrupted by user")
     except ConfigError as ce:
         logger.error(f"[MAIN ERROR] Configuration error: {str(ce)}")
         logger.error("Refer to the configuration guide for troubleshooting: https://github.com/feder-cr/LinkedIn_AIHawk_automatic_job_application/blob/main/readme.md#configuration")
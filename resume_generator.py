@@ -10,16 +10,25 @@ import subprocess
 import sys
 import tempfile
 import yaml
+from collections import deque
+from functools import cache
 from pathlib import Path
 from datetime import datetime
 from logging_config import logger
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
+
+@cache
 def get_repo_root():
     """Get the absolute path to the repository root."""
     return Path(__file__).parent.absolute()
 
 
+@cache
 def get_resumy_path():
     """Get the path to the resumy source directory."""
     repo_root = get_repo_root()
@@ -87,10 +96,7 @@ def generate_tailored_resume(company_name: str, job_title: str, tailored_config_
     # Set up environment with resumy in PYTHONPATH
     env = os.environ.copy()
     current_path = env.get('PYTHONPATH', '')
-    if current_path:
-        env['PYTHONPATH'] = f"{resumy_src}:{current_path}"
-    else:
-        env['PYTHONPATH'] = str(resumy_src)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.fspath(resumy_src), current_path]))
     logger.debug(f"[RESUME GEN] PYTHONPATH set to: {env['PYTHONPATH']}")
     
     # Get default theme path
@@ -98,32 +104,45 @@ def generate_tailored_resume(company_name: str, job_title: str, tailored_config_
     logger.debug(f"[RESUME GEN] Theme path: {default_theme}")
     
     # Prepare the resumy command
+    output_s = os.fspath(pdf_path)
+    theme_s = os.fspath(default_theme)
+    config_s = os.fspath(config_path)
     cmd = [
         sys.executable, "-m", "resumy.resumy", "build",
-        "-o", str(pdf_path),
-        "--theme", str(default_theme),
+        "-o", output_s,
+        "--theme", theme_s,
         "--disable-validation",
-        str(config_path)
+        config_s
     ]
     
     logger.info(f"[RESUME GEN] Generating resume PDF")
     logger.debug(f"[RESUME GEN] Command: {' '.join(cmd)}")
     
     try:
-        # Run the command
+        # Run the command, streaming its combined output as it is produced
         logger.debug("[RESUME GEN] Executing resumy build command")
-        result = subprocess.run(
+        output_tail = deque(maxlen=50)
+        with subprocess.Popen(
             cmd,
             cwd=repo_root,
             env=env,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip()
+                output_tail.append(line)
+                logger.debug(f"[RESUME GEN] resumy: {line}")
+        
+        if proc.returncode != 0:
+            logger.error(f"[RESUME GEN ERROR] ❌ Error generating resume, return code: {proc.returncode}")
+            if output_tail:
+                logger.error("[RESUME GEN ERROR] OUTPUT:\n" + "\n".join(output_tail))
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
         
         logger.info(f"[RESUME GEN] ✅ Resume generated successfully: {pdf_path}")
-        if result.stdout:
-            logger.debug(f"[RESUME GEN] Build output: {result.stdout[:500]}")
         
         # Verify file was created
         if pdf_path.exists():
@@ -135,11 +154,6 @@ def generate_tailored_resume(company_name: str, job_title: str, tailored_config_
         return str(pdf_path)
         
     except subprocess.CalledProcessError as e:
-        logger.error(f"[RESUME GEN ERROR] ❌ Error generating resume, return code: {e.returncode}")
-        if e.stdout:
-            logger.error(f"[RESUME GEN ERROR] STDOUT: {e.stdout}")
-        if e.stderr:
-            logger.error(f"[RESUME GEN ERROR] STDERR: {e.stderr}")
         raise Exception(f"Failed to generate resume for {company_name}: {e}")
     except Exception as e:
         logger.error(f"[RESUME GEN ERROR] ❌ Unexpected error: {e}")
@@ -158,7 +172,7 @@ def validate_yaml_config(yaml_content: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        yaml.safe_load(yaml_content)
+        yaml.load(yaml_content, Loader=_SafeLoader)
         return True
     except yaml.YAMLError as e:
         logger.error(f"Invalid YAML configuration: {e}")
@@ -0,0 +1,389 @@
+"""
+Semantic Answer Cache for GPT Form Responses
+
+This module provides an embedding-based cache for answers produced by the
+GPT helpers. LinkedIn forms phrase the same question in many different ways
+("Years of Python experience?" vs "How many years have you worked with
+Python?"), so exact-match caching misses most repeats. Questions are embedded
+and compared by cosine similarity; a close enough match returns the stored
+answer instead of making another LLM call.
+
+Key Features:
+- Pluggable embedding function (OpenAI embeddings by default in GPTAnswerer)
+- Two tiers: exact sha256 match on the normalized question first (case,
+  spacing and punctuation ignored), then a cosine scan as one
+  matrix-vector product over unit-norm float32 rows
+- Entries namespaced by a resume hash, so editing the resume invalidates them
+- Similarity threshold tuned from answer quality feedback
+- Write-through persistence in a SQLite database (embeddings stored as blobs)
+- Optional time-to-live, and hit/miss counters logged when the cache closes
+
+Classes:
+    SemanticCache: Embedding similarity cache for question/answer pairs
+"""
+
+import atexit
+import hashlib
+import re
+import sqlite3
+import time
+from typing import Callable, Collection, List, Optional
+
+import numpy as np
+
+from logging_config import logger
+
+# Case, whitespace and punctuation are ignored by the exact-match tier; "+" and
+# "#" are kept so "C++" and "C#" questions do not collide
+_NON_WORD_RE = re.compile(r"[^\w+#]+")
+
+
+class SemanticCache:
+    """
+    Cache of answered questions looked up by exact hash, then by embedding similarity.
+
+    Entries are partitioned by ``namespace`` (the resume hash) and ``kind``
+    (e.g. "textual", "numeric", "options") so an answer is only reused for
+    the same resume and the same type of question.
+
+    Attributes:
+        threshold: Minimum cosine similarity for a cache hit
+        namespace: Partition new lookups and inserts are made in
+        high_quality_hits: Number of hits approved via record_feedback
+        low_quality_hits: Number of hits rejected via record_feedback
+        hits: Lookups answered from the cache in this session
+        misses: Lookups that found no usable entry in this session
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        threshold: float = 0.92,
+        path: Optional[str] = None,
+        target_quality: float = 0.95,
+        threshold_step: float = 0.005,
+        ttl: Optional[float] = None,
+        exact_kinds: Collection[str] = (),
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_fn: Function mapping a list of texts to a list of embeddings
+            threshold: Initial cosine similarity threshold for a hit
+            path: Optional SQLite database file used to persist the cache
+            target_quality: Desired share of approved hits; the threshold is
+                raised when feedback falls below it and lowered when above
+            threshold_step: Amount the threshold moves per feedback event
+            ttl: Seconds an entry stays usable after it is inserted; None keeps
+                entries forever
+            exact_kinds: Kinds only reused on an exact (normalized) question
+                match, never by similarity, e.g. numeric questions where
+                "years of Python" and "years of Java" embed close together
+        """
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.path = path
+        self.target_quality = target_quality
+        self.threshold_step = threshold_step
+        self.ttl = ttl
+        self.exact_kinds = frozenset(exact_kinds)
+        self.namespace = ""
+
+        self.high_quality_hits = 0
+        self.low_quality_hits = 0
+        self.hits = 0
+        self.misses = 0
+
+        # Unit-norm float32 embeddings in rows [0, len(self)), grown by doubling
+        self._matrix: Optional[np.ndarray] = None
+        self._partition_codes = np.empty(0, dtype=np.int32)
+        self._partition_ids: dict[tuple[str, str], int] = {}
+        self._entries: list[dict] = []
+        # sha256 of (namespace, kind, question) -> row, checked before the vector scan
+        self._exact: dict[bytes, int] = {}
+        # Embeddings computed during lookup, reused by insert on a miss
+        self._pending: dict[tuple[str, str], np.ndarray] = {}
+        # Questions answered from the cache, awaiting feedback
+        self._served: dict[str, int] = {}
+
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self.load()
+            atexit.register(self.close)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_namespace(self, namespace: str):
+        """
+        Select the partition used by lookup and insert.
+
+        Args:
+            namespace: Identifier of the current resume, e.g. a hash of its text
+        """
+        self.namespace = namespace
+
+    def _exact_key(self, namespace: str, kind: str, question: str) -> bytes:
+        """Hash a question, normalized to its lowercase word characters, for the exact-match tier."""
+        normalized = _NON_WORD_RE.sub("", question.lower())
+        return hashlib.sha256(f"{namespace}\0{kind}\0{normalized}".encode("utf-8")).digest()
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed a single text as a unit-norm float32 vector."""
+        vector = np.asarray(self.embed_fn([text])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
+
+    def _partition_id(self, namespace: str, kind: str) -> int:
+        """Map a (namespace, kind) pair to a small integer code."""
+        return self._partition_ids.setdefault((namespace, kind), len(self._partition_ids))
+
+    def _append(self, vectors: np.ndarray, partition_codes: np.ndarray):
+        """Append unit-norm rows, growing the preallocated matrix as needed."""
+        size = len(self._entries)
+        needed = size + len(vectors)
+        if self._matrix is None or needed > len(self._matrix):
+            capacity = max(256, needed, 2 * (0 if self._matrix is None else len(self._matrix)))
+            matrix = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+            codes = np.empty(capacity, dtype=np.int32)
+            if self._matrix is not None:
+                matrix[:size] = self._matrix[:size]
+                codes[:size] = self._partition_codes[:size]
+            self._matrix = matrix
+            self._partition_codes = codes
+        self._matrix[size:needed] = vectors
+        self._partition_codes[size:needed] = partition_codes
+
+    def _expired(self, index: int) -> bool:
+        """Evict the entry at ``index`` if it is older than the TTL; True if it was."""
+        if self.ttl is None or time.time() - self._entries[index]["created"] <= self.ttl:
+            return False
+        self._remove(index)
+        return True
+
+    def lookup(self, question: str, kind: str) -> Optional[str]:
+        """
+        Return the cached answer of the same or the most similar question, if close enough.
+
+        Args:
+            question: Question text
+            kind: Question type the answer must have been stored under
+
+        Returns:
+            Cached answer, or None on a miss
+        """
+        answer = self._lookup(question, kind)
+        if answer is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return answer
+
+    def _lookup(self, question: str, kind: str) -> Optional[str]:
+        """Exact tier, then the similarity scan; see `lookup`."""
+        exact = self._exact.get(self._exact_key(self.namespace, kind, question))
+        if exact is not None and not self._expired(exact):
+            self._served[question] = exact
+            logger.debug(f"[SEMANTIC CACHE] Exact hit ({kind}): '{question[:60]}'")
+            return self._entries[exact]["answer"]
+        if kind in self.exact_kinds:
+            return None
+
+        try:
+            query = self._embed(question)
+        except Exception as e:
+            logger.warning(f"[SEMANTIC CACHE] Embedding failed, skipping lookup: {e}")
+            return None
+        self._pending[(question, kind)] = query
+
+        size = len(self._entries)
+        partition_id = self._partition_ids.get((self.namespace, kind))
+        if size == 0 or partition_id is None or not query.any():
+            return None
+
+        # Rows and query are unit-norm, so the dot product is the cosine similarity
+        similarities = self._matrix[:size] @ query
+        similarities[self._partition_codes[:size] != partition_id] = -1.0
+
+        best = int(np.argmax(similarities))
+        best_similarity = float(similarities[best])
+        if best_similarity < self.threshold:
+            logger.debug(f"[SEMANTIC CACHE] Miss ({kind}): best similarity {best_similarity:.3f} < {self.threshold:.3f}")
+            return None
+
+        if self._expired(best):
+            return None
+        entry = self._entries[best]
+        self._served[question] = best
+        logger.debug(f"[SEMANTIC CACHE] Hit ({kind}, {best_similarity:.3f}): '{question[:60]}' ~ '{entry['question'][:60]}'")
+        return entry["answer"]
+
+    def insert(self, question: str, answer: str, kind: str):
+        """
+        Store an answer for a question.
+
+        Args:
+            question: Question text
+            answer: Answer to cache
+            kind: Question type the answer belongs to
+        """
+        key = self._exact_key(self.namespace, kind, question)
+        if key in self._exact:
+            return
+
+        embedding = self._pending.pop((question, kind), None)
+        if embedding is None and kind in self.exact_kinds and self._matrix is not None:
+            # Never compared by similarity: a zero row keeps the layout without an embedding call
+            embedding = np.zeros(self._matrix.shape[1], dtype=np.float32)
+        if embedding is None:
+            try:
+                embedding = self._embed(question)
+            except Exception as e:
+                logger.warning(f"[SEMANTIC CACHE] Embedding failed, answer not cached: {e}")
+                return
+
+        entry = {"question": question, "answer": str(answer), "kind": kind, "namespace": self.namespace,
+                 "created": time.time()}
+        if self._db is not None:
+            try:
+                with self._db:
+                    cursor = self._db.execute(
+                        "INSERT INTO entries (namespace, kind, question, answer, embedding, created) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (self.namespace, kind, question, entry["answer"], embedding.tobytes(), entry["created"])
+                    )
+                entry["id"] = cursor.lastrowid
+            except sqlite3.Error as e:
+                logger.warning(f"[SEMANTIC CACHE] Failed to persist entry: {e}")
+
+        self._append(embedding.reshape(1, -1), np.array([self._partition_id(self.namespace, kind)], dtype=np.int32))
+        self._exact[key] = len(self._entries)
+        self._entries.append(entry)
+
+    def record_feedback(self, question: str, approved: bool):
+        """
+        Record whether a cached answer served for a question was acceptable.
+
+        Rejected answers are evicted, and the threshold is adjusted towards
+        the target quality rate.
+
+        Args:
+            question: Question that was answered from the cache
+            approved: True if the cached answer was acceptable
+        """
+        index = self._served.pop(question, None)
+        if index is None:
+            return
+
+        if approved:
+            self.high_quality_hits += 1
+        else:
+            self.low_quality_hits += 1
+            self._remove(index)
+
+        quality_rate = self.high_quality_hits / (self.high_quality_hits + self.low_quality_hits)
+        if quality_rate < self.target_quality:
+            self.threshold = min(0.999, self.threshold + self.threshold_step)
+        else:
+            self.threshold = max(0.5, self.threshold - self.threshold_step)
+        logger.debug(f"[SEMANTIC CACHE] Feedback approved={approved}, quality={quality_rate:.2f}, threshold={self.threshold:.3f}")
+
+    def _remove(self, index: int):
+        """Remove an entry and remap the indexes of served and exact-match questions."""
+        size = len(self._entries)
+        entry = self._entries[index]
+        if self._db is not None and "id" in entry:
+            try:
+                with self._db:
+                    self._db.execute("DELETE FROM entries WHERE id = ?", (entry["id"],))
+            except sqlite3.Error as e:
+                logger.warning(f"[SEMANTIC CACHE] Failed to delete entry: {e}")
+
+        self._matrix[index:size - 1] = self._matrix[index + 1:size]
+        self._partition_codes[index:size - 1] = self._partition_codes[index + 1:size]
+        del self._entries[index]
+        self._served = {
+            question: i - (i > index)
+            for question, i in self._served.items()
+            if i != index
+        }
+        self._exact = {
+            key: i - (i > index)
+            for key, i in self._exact.items()
+            if i != index
+        }
+
+    def save(self):
+        """Persist the tuned threshold and feedback counters; entries are written through on insert."""
+        if self._db is None:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("threshold", self.threshold),
+                        ("high_quality_hits", self.high_quality_hits),
+                        ("low_quality_hits", self.low_quality_hits),
+                    ]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"[SEMANTIC CACHE] Failed to save cache state to {self.path}: {e}")
+
+    def close(self):
+        """Save the cache state and close the database."""
+        if self._db is None:
+            return
+        if self.hits or self.misses:
+            logger.debug(f"[SEMANTIC CACHE] Session stats: {self.hits} hits, {self.misses} misses, "
+                         f"hit rate {self.hits / (self.hits + self.misses):.0%}")
+        self.save()
+        self._db.close()
+        self._db = None
+
+    def load(self):
+        """Open the database at ``path`` and load every persisted entry."""
+        try:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "id INTEGER PRIMARY KEY, namespace TEXT NOT NULL, kind TEXT NOT NULL, "
+                    "question TEXT NOT NULL, answer TEXT NOT NULL, embedding BLOB NOT NULL, created REAL)"
+                )
+                self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)")
+                # Databases from before the TTL: existing entries count as created now
+                columns = {row[1] for row in self._db.execute("PRAGMA table_info(entries)")}
+                if "created" not in columns:
+                    self._db.execute("ALTER TABLE entries ADD COLUMN created REAL")
+                    self._db.execute("UPDATE entries SET created = ?", (time.time(),))
+                if self.ttl is not None:
+                    self._db.execute("DELETE FROM entries WHERE created < ?", (time.time() - self.ttl,))
+            rows = self._db.execute(
+                "SELECT id, namespace, kind, question, answer, embedding, created FROM entries ORDER BY id"
+            ).fetchall()
+            meta = dict(self._db.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error as e:
+            logger.warning(f"[SEMANTIC CACHE] Failed to load cache from {self.path}: {e}")
+            self._db = None
+            return
+
+        self.threshold = meta.get("threshold", self.threshold)
+        self.high_quality_hits = int(meta.get("high_quality_hits", 0))
+        self.low_quality_hits = int(meta.get("low_quality_hits", 0))
+        if not rows:
+            return
+
+        matrix = np.stack([np.frombuffer(row[5], dtype=np.float32) for row in rows])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+        partition_codes = np.array([self._partition_id(row[1], row[2]) for row in rows], dtype=np.int32)
+        self._append(matrix, partition_codes)
+        for index, (row_id, namespace, kind, question, answer, _, created) in enumerate(rows):
+            self._entries.append({"id": row_id, "question": question, "answer": answer, "kind": kind,
+                                  "namespace": namespace, "created": created})
+            self._exact[self._exact_key(namespace, kind, question)] = index
+        logger.debug(f"[SEMANTIC CACHE] Loaded {len(self._entries)} entries from {self.path}")
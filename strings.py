@@ -466,6 +466,70 @@ Question: What is your experience with swift?
 ## """
 
 
+
+# Fallback template: picks the resume section relevant to a question
+section_picker_template = """For the following question: '{question}', which section of the resume is relevant? Respond with ONLY ONE of these exact options (no explanation, no markdown, just the text):
+Personal information
+Self Identification
+Legal Authorization
+Work Preferences
+Education Details
+Experience Details
+Projects
+Availability
+Salary Expectations
+Certifications
+Languages
+Interests
+Cover letter"""
+
+
+# Single-call template: picks the relevant resume section and answers in one request
+section_answer_template = """
+The following is a resume and a question from a job application form, answered by the person who's resume it is (first person).
+
+First decide which section of the resume is relevant to the question, choosing ONLY ONE of:
+personal_information, self_identification, legal_authorization, work_preferences, education_details, experience_details, projects, availability, salary_expectations, certifications, languages, interests, cover_letter
+
+Then answer the question using that section.
+
+## Rules
+- Answer questions directly
+- If seems likely that you have the experience, even if is not explicitly defined, answer as if you have the experience
+- If unsure, answer things like "I have no experience with that, but I learn fast" or "Not yet, but willing to learn."
+- The answer must not be longer than a tweet (140 characters)
+- If the section is cover_letter, leave the answer empty
+
+## My resume:
+```
+{resume}
+```
+
+## Question:
+{question}
+"""
+
+
+# Batch template: answers several form questions in one request
+batch_questions_template = """
+The following is a resume and a list of questions from a job application form, answered by the person who's resume it is (first person).
+
+## Rules
+- Answer questions directly
+- If seems likely that you have the experience, even if is not explicitly defined, answer as if you have the experience
+- If unsure, answer things like "I have no experience with that, but I learn fast" or "Not yet, but willing to learn."
+- Each answer must not be longer than a tweet (140 characters)
+- Respond with strict JSON only, no markdown: a JSON array of {count} strings, one answer per question, in the same order
+
+## My resume:
+```
+{resume}
+```
+
+## Questions:
+{questions}
+"""
+
 numeric_question_template = """The following is a resume and an answered question about the resume, being answered by the person who's resume it is (first person).
 
 ## Rules
@@ -529,6 +593,48 @@ Options: [1-2, 3-5, 6-10, 10+]
 ## """
 
 
+
+# Batch template: answers several numeric form questions in one request
+numeric_batch_template = """The following is a resume and a list of numeric questions about the resume, being answered by the person who's resume it is (first person).
+
+## Rules
+- Answer each question with a number only (no text, no explanations).
+- Regarding work experience, evaluate based on job titles, responsibilities, and technologies mentioned in work history.
+- Regarding experience in general, consider both work experience and educational background, including courses and projects.
+- If it seems likely that you have the experience based on the resume, even if not explicitly stated on the resume, answer as if you have the experience.
+- If you have no experience with the specific technology or skill, answer with 0.
+- For questions about years of experience, answer with a whole number (e.g., 3, 5, 10).
+- For questions about proficiency levels or ratings, use numbers 1-10 where 1 is beginner and 10 is expert.
+- If using a default value, use {default_experience}.
+- Respond with strict JSON only, no markdown: a JSON array of {count} integers, one per question, in the same order
+
+## My resume:
+```
+{resume}
+```
+
+## Questions:
+{questions}
+"""
+
+
+# Batch template: answers several multiple choice form questions in one request
+options_batch_template = """The following is a resume and a list of questions about the resume, each answered with one of its options.
+
+## Rules
+- Never choose the default/placeholder option, examples are: 'Select an option', 'None', 'Choose from the options below', etc.
+- Each answer must be exactly one of the options of its question.
+- Respond with strict JSON only, no markdown: a JSON array of {count} strings, one chosen option per question, in the same order
+
+## My resume:
+```
+{resume}
+```
+
+## Questions:
+{questions}
+"""
+
 try_to_fix_template = """\
 The objective is to fix the text of a form input on a web page.
 
@@ -256,6 +256,37 @@ def chromeBrowserOptions():
     return options
 
 
+# Small DOM helpers defined once per document as window.__la, so hot call
+# sites send a short call instead of a full script body each time
+PAGE_HELPERS_JS = """
+window.__la = {
+    scrollCenter: e => e.scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'}),
+    jsClick: e => e.click(),
+    scrollBy: (e, d) => e.scrollBy(0, d),
+    textOf: e => e.innerText.trim(),
+};
+"""
+
+
+def install_page_helpers(driver) -> bool:
+    """
+    Define ``window.__la`` helpers in the current page and every page loaded after it.
+    
+    Args:
+        driver: Chromium-based Selenium WebDriver
+        
+    Returns:
+        True if the helpers are installed, False if the driver has no CDP support
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PAGE_HELPERS_JS})
+        driver.execute_script(PAGE_HELPERS_JS)
+        return True
+    except (AttributeError, WebDriverException) as e:
+        logger.debug(f"Page helpers not installed: {e}")
+        return False
+
+
 def log_error(text: str) -> None:
     """
     Log text as error message.